@@ -1,8 +1,11 @@
 import datetime
+import html
+import os
+import threading
 from PyQt6 import QtWidgets, QtCore
-from PyQt6.QtCore import QDate, QSettings, QTime, Qt, QByteArray, QDateTime
-from PyQt6.QtGui import QCloseEvent
-from PyQt6.QtWidgets import QApplication, QTextEdit, QPushButton, QDialog, QFormLayout, QLineEdit
+from PyQt6.QtCore import QDate, QSettings, QTime, Qt, QByteArray, QDateTime, QTimer
+from PyQt6.QtGui import QAction, QCloseEvent, QKeySequence, QShortcut
+from PyQt6.QtWidgets import QApplication, QTextEdit, QPushButton, QDialog, QFormLayout, QLineEdit, QMenu, QFileDialog, QProgressDialog
 from PyQt6.QtPrintSupport import QPrintDialog
 
 import tracker_config as tkc
@@ -15,7 +18,7 @@ from ui.main_ui.gui import Ui_MainWindow
 # ############################################################################
 # LOGGER
 # ############################################################################
-from logger_setup import logger
+from logger_setup import logger, log_directory
 
 # ############################################################################
 # NAVIGATION
@@ -29,6 +32,8 @@ from utility.app_operations.diet_calc import (
     calculate_calories)
 from utility.app_operations.save_generic import (
     TextEditSaver)
+from utility.app_operations.document_export import (
+    DocumentExporter)
 from utility.widgets_set_widgets.slider_spinbox_connections import (
     connect_slider_spinbox)
 from utility.app_operations.frameless_window import (
@@ -43,41 +48,64 @@ from utility.widgets_set_widgets.slider_timers import (
     connect_slider_timeedits)
 from utility.widgets_set_widgets.buttons_set_time import (
     btn_times)
+from utility.widgets_set_widgets.date_range_filter import (
+    install_date_filter)
+from utility.widgets_set_widgets.preview_delegate import (
+    install_preview_delegates)
+from utility.widgets_set_widgets.data_browser import (
+    install_data_browser, widget_stats)
 from utility.app_operations.show_hide import (
     toggle_views)
-from utility.widgets_set_widgets.buttons_set_time import (
-    btn_times)
+from utility.app_operations.search_dialog import (
+    SearchDialog)
+from utility.app_operations.note_viewer import (
+    NoteViewer)
+from utility.app_operations.draft_autosave import (
+    DraftAutosaver)
+from utility.app_operations.ui_snapshot import (
+    UiStateSnapshot)
+from utility.app_operations.idle_scheduler import (
+    IdleScheduler)
+from utility.app_operations.charts import (
+    ChartDialog, SeriesCache)
+from utility.app_operations.refresh_scheduler import (
+    RefreshScheduler)
+from utility.app_operations.stall_watchdog import (
+    StallWatchdog)
+from utility.app_operations.sampling_profiler import (
+    SamplingProfiler)
+from utility.app_operations.ingest_bridge import (
+    IngestBridge)
 
 # #############################################################################
 # DATABASE Magicks 
 # #############################################################################
 from database.database_manager import (
     DataManager)
+# Backups
+from database.database_utility.backup import (
+    DatabaseBackup)
+# Maintenance
+from database.database_utility.maintenance import (
+    DatabaseMaintenance)
+# Archives
+from database.database_utility.archive import (
+    archive_old_rows)
+# Ingest endpoint
+from database.database_utility.ingest_server import (
+    IngestServer)
 # Delete Records
 from database.database_utility.delete_records import (
     delete_selected_rows)
 # setup Models
 from database.database_utility.model_setup import (
     create_and_set_model)
+from database.database_utility.sort_helper import (
+    apply_sorting)
 # add data modules
-from database.add_data.basics_mod.basics_shower import add_shower_data
-from database.add_data.basics_mod.basics_exercise import add_exercise_data
-from database.add_data.basics_mod.basics_teethbrushing import add_teethbrush_data
-from database.add_data.diet_mod.diet_hydration import add_hydration_data
-from database.add_data.diet_mod.diet import add_diet_data
-from database.add_data.lily_mod.lily_walk_notes import add_lily_walk_notes
-from database.add_data.lily_mod.lily_diet import add_lily_diet_data
-from database.add_data.lily_mod.lily_walks import add_lily_walk_data
-from database.add_data.lily_mod.lily_time_in_room import add_time_in_room_data
-from database.add_data.lily_mod.lily_mood import add_lily_mood_data
-from database.add_data.lily_mod.lily_notes import add_lily_note_data
-from database.add_data.sleep_mod.sleep_quality import add_sleep_quality_data
-from database.add_data.sleep_mod.sleep_total_hours_slept import add_total_hours_slept_data
-from database.add_data.sleep_mod.sleep_woke_up_like import add_woke_up_like_data
-from database.add_data.sleep_mod.sleep import add_sleep_data
-from database.add_data.mental.wefe import add_wefe_data
-from database.add_data.mental.mmdmr import add_mentalsolo_data
-from database.add_data.mental.cspr import add_cspr_data
+from database.add_data.form_spec import bind_forms, compile_form
+from database.add_data.forms import FORMS, SLEEP_FORMS
+from database.add_data.sleep_mod.sleep_commit import commit_sleep_page
 
 
 class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
@@ -114,6 +142,8 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
     - db_manager: The database manager.
     - settings: The QSettings object.
     - window_controller: The WindowController object.
+    - ui_snapshot: The UiStateSnapshot holding the window state and input drafts.
+    - draft_autosaver: The DraftAutosaver keeping drafts of the input pages.
 
     Methods:
     - __init__: Initializes the MainWindow object.
@@ -163,61 +193,174 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         self.total_hours_slept_model = None
         self.total_hrs_slept = None
         self.basics_model = None
+        self.search_dialog = None
+        self.draft_autosaver = None
+        self.ui_snapshot = None
+        self.db_backup = None
+        self.backup_timer = None
+        self.db_maintenance = None
+        self.idle_scheduler = None
+        self.chart_dialog = None
+        self.ingest_server = None
+        self.ingest_bridge = None
+        self.forms = []
+        self.sleep_forms = []
+        self.refresh_scheduler = None
+        self.stall_watchdog = None
+        self.profiler = None
+        self.profiler_action = None
+        self.document_exporter = None
+        self.text_saver = None
+        self.export_progress = None
+        self.note_viewer = None
         
         self.ui = Ui_MainWindow()
         self.setupUi(self)
         self.settings = QSettings(tkc.ORGANIZATION_NAME, tkc.APPLICATION_NAME)
+        self.ui_snapshot = UiStateSnapshot(
+            os.path.join(os.path.expanduser('~'), tkc.PRINGLES, tkc.UI_STATE_FILE))
+        if not self.ui_snapshot.loaded:
+            self.import_settings_state()
         self.window_controller = WindowController()
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.db_manager = DataManager()
+        self.refresh_scheduler = RefreshScheduler(self)
         self.setup_models()
+        self.draft_autosaver = DraftAutosaver(
+            self.ui_snapshot, [self.bds_page, self.lilys_mod, self.mentalpage])
         self.restore_state()
         self.app_operations()
         self.commits_setup()
         self.delete_actions()
         self.sort_tables_by_date_desc()
+        self.date_filters_setup()
+        if tkc.DATA_BROWSER_MODE:
+            self.data_browser_setup()
+        self.note_viewer_setup()
+        self.preview_delegate_setup()
+        for table_view in self.table_views():
+            self.refresh_scheduler.watch(table_view)
+    
+    def date_filters_setup(self):
+        """
+        Adds a date range filter bar to every data page, applied to all models on that page.
+        """
+        try:
+            page_models = {
+                self.sleep_data_page: [self.sleep_model, self.total_hours_slept_model,
+                                       self.woke_up_like_model, self.sleep_quality_model],
+                self.diet_data_page: [self.diet_model, self.hydro_model],
+                self.basics_data_page: [self.shower_model, self.tooth_model, self.exercise_model],
+                self.lilys_dataviews: [self.lily_diet_model, self.lily_mood_model,
+                                       self.lily_walk_model, self.lily_room_model,
+                                       self.lily_note_model, self.lily_walk_note_model],
+                self.mentaldatapage: [self.mmdmr_model, self.cspr_model, self.wefe_model],
+            }
+            for page, models in page_models.items():
+                install_date_filter(page, models, tkc.DEFAULT_DATE_RANGE_DAYS)
+        except Exception as e:
+            logger.error(f"Error setting up date filters: {e}", exc_info=True)
+    
+    def data_browser_setup(self):
+        """
+        Replaces the table views of every data page with one shared view and a table picker,
+        and logs the widget count and resident memory before and after.
+        """
+        try:
+            widgets_before, memory_before = widget_stats()
+            page_tables = {
+                self.sleep_data_page: [
+                    ("Sleep", 'sleep_tableview', 'sleep_model'),
+                    ("Total Hours Slept", 'total_hours_slept_tableview', 'total_hours_slept_model'),
+                    ("Woke Up Like", 'woke_up_like_tableview', 'woke_up_like_model'),
+                    ("Sleep Quality", 'sleep_quality_tableview', 'sleep_quality_model')],
+                self.diet_data_page: [
+                    ("Diet", 'diet_table', 'diet_model'),
+                    ("Hydration", 'hydration_table', 'hydro_model')],
+                self.basics_data_page: [
+                    ("Shower", 'shower_table', 'shower_model'),
+                    ("Teeth Brushed", 'teethbrushed_table', 'tooth_model'),
+                    ("Exercise", 'yoga_table', 'exercise_model')],
+                self.lilys_dataviews: [
+                    ("Lily Diet", 'lily_diet_table', 'lily_diet_model'),
+                    ("Lily Mood", 'lily_mood_table', 'lily_mood_model'),
+                    ("Lily Walks", 'lily_walk_table', 'lily_walk_model'),
+                    ("Lily Time in Room", 'time_in_room_table', 'lily_room_model'),
+                    ("Lily Notes", 'lily_notes_table', 'lily_note_model'),
+                    ("Lily Walk Notes", 'lily_walk_note_table', 'lily_walk_note_model')],
+                self.mentaldatapage: [
+                    ("WEFE", 'wefe_tableview', 'wefe_model'),
+                    ("CSPR", 'cspr_tableview', 'cspr_model'),
+                    ("MMDMR", 'mdmmr_tableview', 'mmdmr_model')],
+            }
+            for page, tables in page_tables.items():
+                install_data_browser(self, page, tables)
+            # the replaced views are deleted on the next event loop pass
+            QApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete.value)
+            widgets_after, memory_after = widget_stats()
+            memory = ""
+            if memory_before is not None and memory_after is not None:
+                memory = f", resident memory {memory_before / 2 ** 20:.1f} -> {memory_after / 2 ** 20:.1f} MiB"
+            logger.info(f"Data browser mode: {widgets_before} -> {widgets_after} widgets{memory}")
+        except Exception as e:
+            logger.error(f"Error setting up the data browser: {e}", exc_info=True)
+    
+    def note_viewer_setup(self):
+        """
+        Opens the full text of a note when its row is double-clicked; the note tables only show
+        a preview of long notes.
+        """
+        try:
+            self.note_viewer = NoteViewer(self.db_manager, self)
+            # with DATA_BROWSER_MODE both names refer to the one shared view
+            views = {id(view): view for view in (self.lily_notes_table, self.lily_walk_note_table)}
+            for view in views.values():
+                view.doubleClicked.connect(self.note_viewer.open_index)
+        except Exception as e:
+            logger.error(f"Error setting up the note viewer: {e}", exc_info=True)
+    
+    def preview_delegate_setup(self):
+        """
+        Paints the note and food cells as single elided lines.
+        """
+        try:
+            install_preview_delegates(
+                [self.lily_notes_table, self.lily_walk_note_table, self.diet_table],
+                {'lily_notes_table': 'lily_notes',
+                 'lily_walk_notes_table': 'lily_walk_note',
+                 'diet_table': 'food_eaten'},
+                tkc.PREVIEW_CACHE_SIZE)
+        except Exception as e:
+            logger.error(f"Error setting up the preview delegates: {e}", exc_info=True)
+    
+    def table_views(self):
+        return [self.wefe_tableview, self.cspr_tableview, self.mdmmr_tableview,
+                self.sleep_tableview, self.total_hours_slept_tableview,
+                self.woke_up_like_tableview, self.sleep_quality_tableview, self.shower_table,
+                self.teethbrushed_table, self.yoga_table, self.diet_table,
+                self.hydration_table, self.lily_diet_table, self.lily_mood_table,
+                self.lily_walk_table, self.time_in_room_table, self.lily_notes_table,
+                self.lily_walk_note_table]
     
     def sort_tables_by_date_desc(self):
-        table_views = [self.wefe_tableview, self.cspr_tableview, self.mdmmr_tableview,
-                       self.sleep_tableview, self.total_hours_slept_tableview,
-                       self.woke_up_like_tableview, self.sleep_quality_tableview, self.shower_table,
-                       self.teethbrushed_table, self.yoga_table, self.diet_table,
-                       self.hydration_table, self.lily_diet_table, self.lily_mood_table,
-                       self.lily_walk_table, self.time_in_room_table, self.lily_notes_table,
-                       self.lily_walk_note_table]
+        table_views = self.table_views()
         
         # Column index for the date column
         date_column_index = 1  # Adjust this to the correct column index for your date column
         for table_view in table_views:
-            table_view.setSortingEnabled(True)
-            table_view.sortByColumn(date_column_index, Qt.SortOrder.DescendingOrder)
+            apply_sorting(table_view, date_column_index)
     
     def commits_setup(self):
         """
         Sets up the methods with their buttons/actions to commit data relevant to the module. 
         
-        This method calls several other methods to set up commits for different activities,
-        such as sleep, total hours, woke up like, sleep quality, diet data, shower, exercise,
-        teethbrush, lily diet data, lily mood data, lily walk, lily in room, lily notes data,
-        lily walk notes data, mmdmr table, cspr table, wefe table, and slider set spinbox.
-        """
-        self.add_cspr_data()
-        self.add_diet_data()
-        self.add_exercise_data()
-        self.add_lily_diet_data()
-        self.add_lily_mood_data()
-        self.add_lily_notes_data()
-        self.add_lily_walk_notes_data()
-        self.add_lily_walk_data()
-        self.add_lily_time_in_room_data()
-        self.add_mmdmr_data()
-        self.add_shower_data()
-        self.add_sleep_data()
-        self.add_sleep_quality_data()
-        self.add_wefe_data()
-        self.add_woke_up_like_data()
-        self.add_teethbrushing_data()
-        self.add_total_hours_data()
+        The forms declared in database/add_data (diet, shower, exercise, teethbrush, lily diet,
+        lily mood, lily walk, lily in room, lily notes, lily walk notes, mmdmr, cspr and wefe)
+        are compiled once and bound to their triggers. The sleep forms are committed together
+        in one transaction.
+        """
+        self.forms = bind_forms(self, FORMS, self.db_manager, self.refresh_scheduler.mark_dirty)
+        self.add_sleep_commit()
     
     ##########################################################################################
     # APP-OPERATIONS setup
@@ -245,9 +388,263 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             self.stack_navigation()
             self.actionTotalHours.triggered.connect(self.calculate_total_hours_slept)
             self.actionExit.triggered.connect(self.close_app)
+            self.search_setup()
+            self.backup_setup()
+            self.maintenance_setup()
+            self.journal_setup()
+            self.charts_setup()
+            self.profiler_setup()
+            self.export_setup()
+            if tkc.STALL_WATCHDOG_ENABLED:
+                self.watchdog_setup()
+            if tkc.INGEST_ENABLED:
+                self.ingest_setup()
         except Exception as e:
             logger.error(f"Error in app_operation block : {e}", exc_info=True)
     
+    def backup_setup(self):
+        """
+        Schedules online database backups: one shortly after startup, then one every
+        BACKUP_INTERVAL_MS. The backups run on a background thread.
+        """
+        self.db_backup = DatabaseBackup(self.db_manager.db.databaseName())
+        self.backup_timer = QTimer(self)
+        self.backup_timer.setInterval(tkc.BACKUP_INTERVAL_MS)
+        self.backup_timer.timeout.connect(self.db_backup.start)
+        self.backup_timer.start()
+        QTimer.singleShot(60 * 1000, self.db_backup.start)
+    
+    def maintenance_setup(self):
+        """
+        Runs the database maintenance (integrity check, ANALYZE, PRAGMA optimize, incremental
+        vacuum) on a background thread once the app has been idle for MAINTENANCE_IDLE_MS.
+        """
+        self.db_maintenance = DatabaseMaintenance(self.db_manager.db.databaseName())
+        self.idle_scheduler = IdleScheduler(tkc.MAINTENANCE_IDLE_MS, parent=self)
+        self.idle_scheduler.add_job(self.db_maintenance.start, tkc.MAINTENANCE_INTERVAL_S)
+        if tkc.ARCHIVE_AFTER_DAYS is not None:
+            self.idle_scheduler.add_job(self.start_archiving, tkc.MAINTENANCE_INTERVAL_S)
+    
+    def journal_setup(self):
+        """
+        Binds the standard Undo and Redo shortcuts to the operation journal, which covers the
+        commits and deletes made in the app, and prunes the journal when the app is idle.
+        Text fields keep their own undo while they have the focus.
+        """
+        self.add_menu_action("Undo", self.undo_operation, QKeySequence.StandardKey.Undo)
+        self.add_menu_action("Redo", self.redo_operation, QKeySequence.StandardKey.Redo)
+        self.idle_scheduler.add_job(
+            lambda: self.db_manager.journal.prune(tkc.JOURNAL_KEEP_OPERATIONS),
+            tkc.MAINTENANCE_INTERVAL_S)
+    
+    def undo_operation(self):
+        try:
+            self.refresh_journal_table(self.db_manager.journal.undo())
+        except Exception as e:
+            logger.error(f"Error undoing the last operation: {e}", exc_info=True)
+    
+    def redo_operation(self):
+        try:
+            self.refresh_journal_table(self.db_manager.journal.redo())
+        except Exception as e:
+            logger.error(f"Error redoing the last operation: {e}", exc_info=True)
+    
+    def refresh_journal_table(self, touched):
+        """
+        Refreshes only the models and chart series an undo or redo touched.
+        """
+        if not touched:
+            return
+        models = self.table_models()
+        for table in touched:
+            self.refresh_scheduler.mark_dirty(models.get(table))
+        self.invalidate_chart_series(touched)
+    
+    def start_archiving(self):
+        """
+        Moves the rows older than ARCHIVE_AFTER_DAYS into the per-year archive files on a
+        background thread.
+        """
+        threading.Thread(target=archive_old_rows,
+                         args=(self.db_manager.db.databaseName(), tkc.ARCHIVE_AFTER_DAYS),
+                         name="bslm-archive", daemon=True).start()
+    
+    def search_setup(self):
+        """
+        Binds the standard Find shortcut (Ctrl+F / Cmd+F) to the notes and food search box.
+        """
+        self.search_dialog = SearchDialog(self.db_manager, {
+            "lily_notes_table": self.switch_to_lilys_dataviews,
+            "lily_walk_notes_table": self.switch_to_lilys_dataviews,
+            "diet_table": self.switch_to_diet_data_page,
+        }, self)
+        search_shortcut = QShortcut(QKeySequence(QKeySequence.StandardKey.Find), self)
+        search_shortcut.activated.connect(self.open_search)
+    
+    def add_menu_action(self, text, slot, shortcut=None):
+        """
+        Adds an action to the menu holding actionTotalHours and actionExit, just above Exit.
+        The action is also added to the window so its shortcut works without the menu.
+
+        Returns:
+            QAction: The new action.
+        """
+        action = QAction(text, self)
+        if shortcut is not None:
+            action.setShortcut(QKeySequence(shortcut))
+        action.triggered.connect(slot)
+        menus = [obj for obj in self.actionExit.associatedObjects() if isinstance(obj, QMenu)]
+        if menus:
+            menus[0].insertAction(self.actionExit, action)
+        self.addAction(action)
+        return action
+    
+    def charts_setup(self):
+        self.chart_dialog = ChartDialog(SeriesCache(self.db_manager), self)
+        self.add_menu_action("Charts", self.open_charts, "Ctrl+G")
+    
+    def watchdog_setup(self):
+        """
+        Starts the event loop stall watchdog, which writes a report with the GUI thread's
+        stacks for every stall longer than STALL_THRESHOLD_MS.
+        """
+        self.stall_watchdog = StallWatchdog(os.path.join(log_directory, tkc.STALL_DIRECTORY),
+                                            tkc.STALL_THRESHOLD_MS, tkc.STALL_HEARTBEAT_MS,
+                                            tkc.STALL_KEEP_REPORTS, self)
+        self.stall_watchdog.start()
+    
+    def profiler_setup(self):
+        """
+        Adds a menu action that starts and stops the sampling profiler.
+        """
+        self.profiler = SamplingProfiler(
+            os.path.join(os.path.expanduser('~'), tkc.PRINGLES, tkc.PROFILE_DIRECTORY),
+            tkc.PROFILER_RATE_HZ, tkc.PROFILER_TOP_N)
+        self.profiler_action = self.add_menu_action("Start Profiling", self.toggle_profiler)
+    
+    def toggle_profiler(self):
+        try:
+            if self.profiler.running:
+                self.profiler.stop()
+                self.profiler_action.setText("Start Profiling")
+            else:
+                self.profiler.start()
+                self.profiler_action.setText("Stop Profiling")
+        except Exception as e:
+            logger.error(f"Error toggling the profiler: {e}", exc_info=True)
+    
+    def export_setup(self):
+        """
+        Adds menu actions that export the lily notes editor, and the selected (or all shown)
+        lily notes as one PDF. Both are written on a background thread.
+        """
+        self.document_exporter = DocumentExporter(self)
+        self.document_exporter.progress.connect(self.show_export_progress)
+        self.document_exporter.finished.connect(self.close_export_progress)
+        self.document_exporter.failed.connect(self.close_export_progress)
+        self.text_saver = TextEditSaver(self.document_exporter)
+        self.text_saver.set_current_text_edit(self.lily_notes)
+        self.add_menu_action("Export Note...", self.text_saver.save_current_text)
+        self.add_menu_action("Export Notes to PDF...", self.export_notes_pdf)
+    
+    def export_notes_pdf(self):
+        try:
+            model = self.lily_note_model
+            rows = []
+            if self.lily_notes_table.model() is model:
+                rows = sorted(index.row()
+                              for index in self.lily_notes_table.selectionModel().selectedRows())
+            sources = []
+            for row in rows or range(model.rowCount()):
+                record = model.record(row)
+                heading = html.escape(f"{record.value('lily_date')} {record.value('lily_time')}")
+                text = self.db_manager.read_note('lily_notes_table', record.value('id'))
+                body = html.escape(text or '').replace('\n', '<br>')
+                sources.append(f"<h3>{heading}</h3><p>{body}</p>")
+            if not sources:
+                return
+            filename, _ = QFileDialog.getSaveFileName(self, "Export Notes", "", "PDF Files (*.pdf)")
+            if not filename:
+                return
+            if not filename.lower().endswith('.pdf'):
+                filename += '.pdf'
+            self.document_exporter.export(sources, filename)
+        except Exception as e:
+            logger.error(f"Error exporting notes: {e}", exc_info=True)
+    
+    def show_export_progress(self, done, total):
+        if self.export_progress is None:
+            self.export_progress = QProgressDialog("Exporting...", None, 0, total, self)
+            self.export_progress.setMinimumDuration(500)
+        self.export_progress.setMaximum(total)
+        self.export_progress.setValue(done)
+    
+    def close_export_progress(self, filename):
+        if self.export_progress is not None:
+            self.export_progress.reset()
+            self.export_progress.deleteLater()
+            self.export_progress = None
+    
+    def ingest_setup(self):
+        """
+        Starts the localhost ingest endpoint. Its batches refresh the matching models and
+        charts on the GUI thread, coalesced to one refresh per INGEST_REFRESH_MS.
+        """
+        self.ingest_bridge = IngestBridge(self.table_models(), tkc.INGEST_REFRESH_MS, self,
+                                          self.refresh_scheduler.mark_dirty)
+        self.ingest_bridge.tablesRefreshed.connect(self.invalidate_chart_series)
+        self.ingest_server = IngestServer(self.db_manager.db.databaseName(),
+                                          on_ingest=self.ingest_bridge.notify)
+        self.ingest_server.start()
+    
+    def invalidate_chart_series(self, tables):
+        for table in tables:
+            self.chart_dialog.series_cache.invalidate(table)
+    
+    def table_models(self):
+        """
+        Returns:
+            dict: The table model of every tracking table, keyed by table name.
+        """
+        return {
+            "wefe_table": self.wefe_model,
+            "cspr_table": self.cspr_model,
+            "mmdmr_table": self.mmdmr_model,
+            "sleep_table": self.sleep_model,
+            "total_hours_slept_table": self.total_hours_slept_model,
+            "woke_up_like_table": self.woke_up_like_model,
+            "sleep_quality_table": self.sleep_quality_model,
+            "shower_table": self.shower_model,
+            "tooth_table": self.tooth_model,
+            "exercise_table": self.exercise_model,
+            "diet_table": self.diet_model,
+            "hydration_table": self.hydro_model,
+            "lily_diet_table": self.lily_diet_model,
+            "lily_mood_table": self.lily_mood_model,
+            "lily_walk_table": self.lily_walk_model,
+            "lily_in_room_table": self.lily_room_model,
+            "lily_notes_table": self.lily_note_model,
+            "lily_walk_notes_table": self.lily_walk_note_model,
+        }
+    
+    def open_charts(self):
+        try:
+            # pick up rows committed since the charts were last opened
+            self.chart_dialog.series_cache.series.clear()
+            self.chart_dialog.show()
+            self.chart_dialog.raise_()
+            self.chart_dialog.activateWindow()
+        except Exception as e:
+            logger.error(f"Error opening charts: {e}", exc_info=True)
+    
+    def open_search(self):
+        try:
+            self.search_dialog.show()
+            self.search_dialog.raise_()
+            self.search_dialog.activateWindow()
+        except Exception as e:
+            logger.error(f"Error opening search: {e}", exc_info=True)
+    
     def close_app(self):
         self.close()
     
@@ -556,94 +953,25 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
     # ######################################################################################
     # SLEEP COMMIT
     # ######################################################################################
-    def add_sleep_data(self):
-        """
-        Connects the 'Commit Sleep' action to the 'add_sleep_data' function and inserts the sleep data into the sleep table.
-
-        Raises:
-            Exception: If an error occurs during the connection or insertion process.
-        """
-        try:
-            self.actionCommitSleep.triggered.connect(lambda: add_sleep_data(self, {
-                "sleep_date": "sleep_date",
-                "time_asleep": "time_asleep",
-                "time_awake": "time_awake",
-                "model": "sleep_model",
-            }, self.db_manager.insert_into_sleep_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_total_hours_data(self):
-        """
-        Connects the 'CommitSleep' action to the 'add_total_hours_slept_data' function and inserts data into the 
-        'total_hours_slept_table' in the database.
-
-        Raises:
-            Exception: If an error occurs during the execution of the method.
-
+    def add_sleep_commit(self):
         """
-        try:
-            self.actionCommitSleep.triggered.connect(lambda: add_total_hours_slept_data(self, {
-                "sleep_date": "sleep_date", "total_hours_slept": "total_hours_slept", "model":
-                    "total_hours_slept_model",
-            }, self.db_manager.insert_into_total_hours_slept_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_woke_up_like_data(self):
-        """
-        Connects the 'Commit Sleep' action to the 'add_woke_up_like_data' function.
-
-        This method connects the 'triggered' signal of the 'actionCommitSleep' QAction to the 'add_woke_up_like_data'
-        function. It passes the necessary parameters to the function and inserts the data into the 'woke_up_like' table
-        using the 'db_manager' object.
-
-        Raises:
-            Exception: If an error occurs during the connection or data insertion, an exception is raised.
-
+        Connects the 'Commit Sleep' action to one handler that commits the sleep times, total
+        hours slept, woke up like and sleep quality rows in a single transaction and then
+        refreshes the four sleep models once.
         """
         try:
-            self.actionCommitSleep.triggered.connect(lambda: add_woke_up_like_data(self, {
-                "sleep_date": "sleep_date",
-                "woke_up_like": "woke_up_like",
-                "model": "woke_up_like_model",
-            }, self.db_manager.insert_woke_up_like_table, ))
+            self.sleep_forms = [compile_form(self, spec, self.db_manager,
+                                             self.refresh_scheduler.mark_dirty)
+                                for spec in SLEEP_FORMS]
+            self.actionCommitSleep.triggered.connect(self.commit_sleep)
         except Exception as e:
             logger.error(f"An Error has occurred {e}", exc_info=True)
     
-    def add_sleep_quality_data(self):
-        """
-        Connects the 'Commit Sleep' action to the 'add_sleep_quality_data' function and inserts the sleep quality data
-        into the sleep quality table in the database.
-
-        Raises:
-            Exception: If an error occurs during the execution of the method.
-
-        """
+    def commit_sleep(self):
         try:
-            self.actionCommitSleep.triggered.connect(lambda: add_sleep_quality_data(self, {
-                "sleep_date": "sleep_date", "sleep_quality": "sleep_quality", "model":
-                    "sleep_quality_model",
-            },
-                                                                                    self.db_manager.insert_into_sleep_quality_table, ))
+            commit_sleep_page(self.sleep_forms, self.db_manager)
         except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_diet_data(self):
-        """
-        Connects the 'Commit Diet' action to the 'add_diet_data' function and inserts the diet data into the database.
-
-        Raises:
-            Exception: If an error occurs during the process.
-
-        """
-        try:
-            self.actionCommitDiet.triggered.connect(lambda: add_diet_data(self, {
-                "diet_date": "diet_date", "diet_time": "diet_time", "food_eaten": "food_eaten",
-                "calories": "calories", "model": "diet_model",
-            }, self.db_manager.insert_into_diet_table, ))
-        except Exception as e:
-            logger.error(f"An error has occurred: {e}", exc_info=True)
+            logger.error(f"Error committing sleep data: {e}", exc_info=True)
     
     def commit_hydration(self,
                          amount):
@@ -664,284 +992,10 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
             time = QTime.currentTime().toString("hh:mm:ss")
             self.db_manager.insert_into_hydration_table(date, time, amount)
             logger.info(f"Committed {amount} oz of water at {date} {time}")
-            self.hydro_model.select()
+            self.refresh_scheduler.mark_dirty(self.hydro_model)
         except Exception as e:
             logger.error(f"Error committing hydration data: {e}", exc_info=True)
     
-    def add_shower_data(self):
-        """
-        Connects the 'clicked' signal of the 'shower_c' button to the 'add_shower_data' function,
-        passing the necessary parameters and calling the 'insert_into_shower_table' method of the 'db_manager' object.
-
-        Raises:
-            Exception: If an error occurs during the process.
-
-        """
-        try:
-            self.shower_c.clicked.connect(lambda: add_shower_data(self, {
-                "basics_date": "basics_date", "basics_time": "basics_time",
-                "shower_check": "shower_check", "model": "shower_model",
-            },
-                                                                  self.db_manager.insert_into_shower_table, ))
-        except Exception as e:
-            logger.error(f"An error occurred: {e}", exc_info=True)
-    
-    def add_exercise_data(self):
-        """
-        Connects the `yoga_commit` button to the `add_exercise_data` function with the specified arguments.
-
-        This method is responsible for setting up the connection between the `yoga_commit` button and the `add_exercise_data` function.
-        It passes the necessary arguments to the `add_exercise_data` function, which is responsible for inserting exercise data into the exercise table.
-
-        Args:
-            self: The instance of the class.
-
-        Returns:
-            None
-        """
-        self.yoga_commit.clicked.connect(lambda: add_exercise_data(self, {
-            "basics_date": "basics_date", "basics_time": "basics_time",
-            "exerc_check": "exerc_check", "model": "exercise_model",
-        }, self.db_manager.insert_into_exercise_table, ))
-    
-    def add_teethbrushing_data(self):
-        """
-        Connects the `clicked` signal of the `teeth_commit` button to the `add_teethbrush_data` function.
-
-        The `add_teethbrush_data` function is called with the following parameters:
-        - `self`: The instance of the main window class.
-        - A dictionary containing the data to be passed to the `add_teethbrush_data` function.
-        - `self.db_manager.insert_into_tooth_table`: The method to be called when inserting data into the tooth table.
-
-        This method is responsible for handling the commit action when the `teeth_commit` button is clicked.
-        """
-        self.teeth_commit.clicked.connect(lambda: add_teethbrush_data(self, {
-            "basics_date": "basics_date", "basics_time": "basics_time",
-            "tooth_check": "tooth_check", "model": "tooth_model",
-        }, self.db_manager.insert_into_tooth_table, ))
-    
-    def add_lily_diet_data(self):
-        """
-        Connects the `lily_ate_check` button click event to the `add_lily_diet_data` function.
-
-        The `add_lily_diet_data` function is called with the following parameters:
-        - `self`: The current instance of the class.
-        - A dictionary containing the data to be passed to the `add_lily_diet_data` function:
-            - "lily_date": The value of the "lily_date" attribute.
-            - "lily_time": The value of the "lily_time" attribute.
-            - "model": The value of the "lily_diet_model" attribute.
-        - `self.db_manager.insert_into_lily_diet_table`: The function to be called when the button is clicked.
-
-        Raises:
-            Exception: If an error occurs during the execution of the method.
-
-        """
-        try:
-            self.lily_ate_check.clicked.connect(lambda: add_lily_diet_data(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time",
-                "model": "lily_diet_model",
-            }, self.db_manager.insert_into_lily_diet_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_lily_mood_data(self):
-        """
-        Connects the 'commit_mood' action to the 'add_lily_mood_data' function and passes the necessary data to it.
-
-        This method connects the 'commit_mood' action to the 'add_lily_mood_data' function, which is responsible for inserting
-        Lily's mood data into the database. It sets up the necessary data and connects the action to the function using a lambda
-        function. The lambda function passes the required data and the function to be called when the action is triggered.
-
-        Parameters:
-            self (MainWindow): The instance of the main window.
-
-        Returns:
-            None
-        """
-        try:
-            self.actionCommitLilyMood.triggered.connect(lambda: add_lily_mood_data(self, {
-                "lily_date": "lily_date",
-                "lily_time": "lily_time",
-                "lily_mood_slider": "lily_mood_slider",
-                "lily_energy_slider": "lily_energy_slider",
-                "lily_mood_activity_slider": "lily_mood_activity_slider",
-                "model": "lily_mood_model",
-            }, self.db_manager.insert_into_lily_mood_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_lily_notes_data(self):
-        """
-        Connects the 'commit_lily_notes' action to the 'add_lily_note_data' function.
-
-        This method connects the 'commit_lily_notes' action to the 'add_lily_note_data' function,
-        passing the necessary parameters. It handles any exceptions that occur and logs an error message.
-
-        Parameters:
-        - self: The instance of the main window.
-
-        Returns:
-        - None
-        """
-        try:
-            self.lily_note_commit_btn.clicked.connect(lambda: add_lily_note_data(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time",
-                "lily_notes": "lily_notes",
-                "model": "lily_note_model",
-            }, self.db_manager.insert_into_lily_notes_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_lily_walk_data(self):
-        """
-        Connects the `lily_walk_btn` button to the `add_lily_walk_data` function with specified arguments.
-
-        This method is responsible for setting up the connection between the `lily_walk_btn` button and the `add_lily_walk_data` function.
-        It passes a dictionary of data and a callback function to the `add_lily_walk_data` function.
-
-        Args:
-            self: The instance of the class.
-
-        Returns:
-            None
-
-        Raises:
-            Exception: If an error occurs during the connection setup.
-
-        """
-        try:
-            self.lily_walk_btn.clicked.connect(lambda: add_lily_walk_data(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time",
-                "lily_behavior_slider": "lily_behavior_slider",
-                "lily_gait_slider": "lily_gait_slider",
-                "model": "lily_walk_model"
-            }, self.db_manager.insert_into_wiggles_walks_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_lily_time_in_room_data(self):
-        """
-        Connects the 'commit_room_time' action to the 'add_time_in_room_data' function,
-        passing the necessary parameters and inserting the data into the time in room table.
-
-        Raises:
-            Exception: If an error occurs during the commit process.
-
-        """
-        try:
-            self.actionCommitLilysTimeInRoom.triggered.connect(lambda: add_time_in_room_data(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time", "lily_time_in_room_slider":
-                    "lily_time_in_room_slider", "model": "lily_room_model"
-            }, self.db_manager.insert_into_time_in_room_table))
-        except Exception as e:
-            logger.error(f"Error occurring during in_room commit main_window.py loc. {e}",
-                         exc_info=True)
-    
-    def add_lily_walk_notes_data(self):
-        """
-        Connects the `lily_walk_btn` button to the `add_lily_walk_notes` function with specified
-        arguments.
-
-        This method sets up the connection between the `lily_walk_btn` button and the
-        `add_lily_walk_notes` function.
-        When the button is clicked, it calls the `add_lily_walk_notes` function with the provided
-        arguments.
-
-        Args:
-            self: The instance of the main window class.
-
-        Returns:
-            None
-
-        Raises:
-            Exception: If an error occurs during the connection setup.
-
-        """
-        try:
-            self.lily_walk_note_commit_btn.clicked.connect(lambda: add_lily_walk_notes(self, {
-                "lily_date": "lily_date", "lily_time": "lily_time",
-                "lily_walk_note": "lily_walk_note", "model": "lily_walk_note_model"
-            }, self.db_manager.insert_into_lily_walk_notes_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_mmdmr_data(self) -> None:
-        """
-        Connects the 'commit' action to the 'add_mentalsolo_data' function and inserts data into
-        the mmdmr_table.
-
-        This method connects the 'commit' action to the 'add_mentalsolo_data' function, which is
-        responsible for inserting data into the mmdmr_table. It sets up the connection using the
-        `triggered.connect()` method and passes the necessary data to the `add_mentalsolo_data`
-        function.
-
-        Raises:
-            Exception: If an error occurs during the process.
-        """
-        try:
-            self.actionCommitMMDMr.triggered.connect(
-                lambda: add_mentalsolo_data(
-                    self, {
-                        "mmdmr_date": "mmdmr_date",
-                        "mmdmr_time": "mmdmr_time",
-                        "mood_slider": "mood_slider",
-                        "mania_slider": "mania_slider",
-                        "depression_slider": "depression_slider",
-                        "mixed_risk_slider": "mixed_risk_slider",
-                        "model": "mmdmr_model"
-                    },
-                    self.db_manager.insert_into_mmdmr_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_cspr_data(self) -> None:
-        """
-        Connects the 'Commit CSPR' action to the 'add_cspr_data' function and inserts the CSPR exam
-        data into the database.
-
-        Raises:
-            Exception: If an error occurs during the execution of the method.
-        """
-        try:
-            self.actionCommitCSPR.triggered.connect(
-                lambda: add_cspr_data(
-                    self, {
-                        "cspr_date": "cspr_date",
-                        "cspr_time": "cspr_time",
-                        "calm_slider": "calm_slider",
-                        "stress_slider": "stress_slider",
-                        "pain_slider": "pain_slider",
-                        "rage_slider": "rage_slider",
-                        "model": "cspr_model"
-                    },
-                    self.db_manager.insert_into_cspr_exam, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
-    def add_wefe_data(self) -> None:
-        """
-        Connects the actionCommitWEFE signal to the add_wefe_data function with the specified parameters.
-        Inserts the WEFE data into the WEFE table using the db_manager.
-
-        Raises:
-            Exception: If an error occurs during the execution of the method.
-        """
-        try:
-            self.actionCommitWEFE.triggered.connect(
-                lambda: add_wefe_data(
-                    self, {
-                        "wefe_date": "wefe_date",
-                        "wefe_time": "wefe_time",
-                        "wellbeing_slider": "wellbeing_slider",
-                        "excite_slider": "excite_slider",
-                        "focus_slider": "focus_slider",
-                        "energy_slider": "energy_slider",
-                        "model": "wefe_model"
-                    },
-                    self.db_manager.insert_into_wefe_table, ))
-        except Exception as e:
-            logger.error(f"An Error has occurred {e}", exc_info=True)
-    
     def setup_models(self) -> None:
         """
         Set up models for various tables in the main window.
@@ -956,86 +1010,104 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         try:
             self.wefe_model = create_and_set_model(
                 "wefe_table",
-                self.wefe_tableview
+                self.wefe_tableview,
+                self.db_manager.archives
             )
             
             self.cspr_model = create_and_set_model(
                 "cspr_table",
-                self.cspr_tableview
+                self.cspr_tableview,
+                self.db_manager.archives
             )
             
             self.mmdmr_model = create_and_set_model(
                 "mmdmr_table",
-                self.mdmmr_tableview
+                self.mdmmr_tableview,
+                self.db_manager.archives
             )
             
             self.sleep_model = create_and_set_model(
                 "sleep_table",
-                self.sleep_tableview
+                self.sleep_tableview,
+                self.db_manager.archives
             )
             
             self.total_hours_slept_model = create_and_set_model(
                 "total_hours_slept_table",
-                self.total_hours_slept_tableview
+                self.total_hours_slept_tableview,
+                self.db_manager.archives
             )
             
             self.woke_up_like_model = create_and_set_model(
                 "woke_up_like_table",
-                self.woke_up_like_tableview)
+                self.woke_up_like_tableview,
+                self.db_manager.archives)
             
             self.sleep_quality_model = create_and_set_model(
                 "sleep_quality_table",
-                self.sleep_quality_tableview)
+                self.sleep_quality_tableview,
+                self.db_manager.archives)
             
             self.shower_model = create_and_set_model(
                 "shower_table",
-                self.shower_table
+                self.shower_table,
+                self.db_manager.archives
             )
             # SLEEP: model creates and set
             
             self.tooth_model = create_and_set_model(
                 "tooth_table",
-                self.teethbrushed_table
+                self.teethbrushed_table,
+                self.db_manager.archives
             )
             
             self.exercise_model = create_and_set_model(
                 "exercise_table",
-                self.yoga_table
+                self.yoga_table,
+                self.db_manager.archives
             )
             
             self.diet_model = create_and_set_model(
                 "diet_table",
-                self.diet_table
+                self.diet_table,
+                self.db_manager.archives
             )
             
             self.hydro_model = create_and_set_model(
                 "hydration_table",
-                self.hydration_table
+                self.hydration_table,
+                self.db_manager.archives
             )
             
             self.lily_diet_model = create_and_set_model(
                 "lily_diet_table",
-                self.lily_diet_table)
+                self.lily_diet_table,
+                self.db_manager.archives)
             
             self.lily_mood_model = create_and_set_model(
                 "lily_mood_table",
-                self.lily_mood_table)
+                self.lily_mood_table,
+                self.db_manager.archives)
             
             self.lily_walk_model = create_and_set_model(
                 "lily_walk_table",
-                self.lily_walk_table)
+                self.lily_walk_table,
+                self.db_manager.archives)
             
             self.lily_room_model = create_and_set_model(
                 "lily_in_room_table",
-                self.time_in_room_table)
+                self.time_in_room_table,
+                self.db_manager.archives)
             
             self.lily_note_model = create_and_set_model(
                 "lily_notes_table",
-                self.lily_notes_table)
+                self.lily_notes_table,
+                self.db_manager.archives)
             
             self.lily_walk_note_model = create_and_set_model(
                 "lily_walk_notes_table",
-                self.lily_walk_note_table)
+                self.lily_walk_note_table,
+                self.db_manager.archives)
         except Exception as e:
             logger.error(f"Error setting up models: {e}", exc_info=True)
     
@@ -1228,109 +1300,88 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         """
         Saves the state of the main window.
 
-        This method saves the values of various sliders, inputs, and other UI elements
-        as well as the window geometry and state to the application settings.
+        This method collects the pending input drafts, the current page and the window
+        geometry and state into the UI state snapshot and writes it in one atomic write.
 
         Raises:
             Exception: If there is an error while saving the state.
 
         """
         try:
-            self.settings.setValue(
-                'lily_time_in_room_slider',
-                self.lily_time_in_room_slider.value())
-        
-            self.settings.setValue(
-                'lily_mood_slider',
-                self.lily_mood_slider.value())
-        
-            self.settings.setValue(
-                'lily_mood_activity_slider',
-                self.lily_mood_activity_slider.value())
-        
-            self.settings.setValue(
-                'lily_energy_slider',
-                self.lily_energy_slider.value())
-        
-            self.settings.setValue(
-                'lily_time_in_room',
-                self.lily_time_in_room.value())
-        
-            self.settings.setValue(
-                'lily_mood',
-                self.lily_mood.value())
+            self.draft_autosaver.flush()
         
-            self.settings.setValue(
-                'lily_activity',
-                self.lily_activity.value())
+            self.ui_snapshot.setValue(
+                "current_page",
+                self.mainStack.currentIndex())
         
-            self.settings.setValue(
-                'lily_energy',
-                self.lily_energy.value())
-        
-            self.settings.setValue(
-                'lily_notes',
-                self.lily_notes.toHtml())
-        
-            self.settings.setValue(
+            self.ui_snapshot.setValue(
                 "geometry",
-                self.saveGeometry())
+                self.saveGeometry().data())
         
-            self.settings.setValue(
+            self.ui_snapshot.setValue(
                 "windowState",
-                self.saveState())
+                self.saveState().data())
+        
+            self.ui_snapshot.sync()
         except Exception as e:
             logger.error(f"Geometry not good fail. {e}", exc_info=True)
     
     def restore_state(self) -> None:
         """
-        Restores the state of the main window by retrieving values from the settings.
+        Restores the state of the main window from the UI state snapshot.
 
-        This method restores the values of various sliders, text fields, and window geometry
-        from the settings. If an error occurs during the restoration process, it is logged
+        This method restores the drafts of the input pages, the current page and the window
+        geometry. If an error occurs during the restoration process, it is logged
         with the corresponding exception.
 
         Returns:
             None
         """
         try:
-            # RESTORE LILYS MODULE
-            self.lily_time_in_room_slider.setValue(
-                self.settings.value('lily_time_in_room_slider', 0, type=int))
-        
-            self.lily_mood_slider.setValue(
-                self.settings.value('lily_mood_slider', 0, type=int))
-        
-            self.lily_mood_activity_slider.setValue(
-                self.settings.value('lily_mood_activity_slider', 0, type=int))
-        
-            self.lily_energy_slider.setValue(
-                self.settings.value('lily_energy_slider', 0, type=int))
-        
-            self.lily_time_in_room.setValue(
-                self.settings.value('lily_time_in_room', 0, type=int))
-        
-            self.lily_mood.setValue(
-                self.settings.value('lily_mood', 0, type=int))
+            # RESTORE INPUT DRAFTS
+            self.draft_autosaver.restore()
         
-            self.lily_activity.setValue(
-                self.settings.value('lily_activity', 0, type=int))
-        
-            self.lily_energy.setValue(
-                self.settings.value('lily_energy', 0, type=int))
-        
-            self.lily_notes.setHtml(
-                self.settings.value('lily_notes', "", type=str))
+            # restore the page, which also sets the window size for that page
+            page_switchers = [
+                self.switch_bds_page,
+                self.switch_lilys_mod,
+                self.switch_to_mental_page,
+                self.switch_sleep_data_page,
+                self.switch_to_diet_data_page,
+                self.switch_to_basics_data_page,
+                self.switch_to_lilys_dataviews,
+                self.switch_to_mental_data_page,
+            ]
+            current_page = self.ui_snapshot.value("current_page", 0, type=int)
+            if not 0 <= current_page < len(page_switchers):
+                current_page = 0
+            page_switchers[current_page]()
         
             # restore window geometry state
             self.restoreGeometry(
-                self.settings.value("geometry", QByteArray()))
+                QByteArray(self.ui_snapshot.value("geometry", b"")))
         
             self.restoreState(
-                self.settings.value("windowState", QByteArray()))
+                QByteArray(self.ui_snapshot.value("windowState", b"")))
         except Exception as e:
             logger.error(f"Error restoring WINDOW STATE {e}", exc_info=True)
     
+    def import_settings_state(self) -> None:
+        """
+        Seeds an empty UI state snapshot with the values previously kept in QSettings,
+        so the first start with the snapshot keeps the saved geometry and drafts.
+        """
+        try:
+            for key in self.settings.allKeys():
+                value = self.settings.value(key)
+                if isinstance(value, QByteArray):
+                    value = value.data()
+                if isinstance(value, (bool, int, float, str, bytes)):
+                    self.ui_snapshot.setValue(key, value)
+            self.ui_snapshot.sync()
+        except Exception as e:
+            logger.error(f"Error importing settings into the UI state snapshot {e}", exc_info=True)
+    
     def closeEvent(self,
                    event: QCloseEvent) -> None:
         """
@@ -1347,5 +1398,11 @@ class MainWindow(FramelessWindow, QtWidgets.QMainWindow, Ui_MainWindow):
         """
         try:
             self.save_state()
+            if self.ingest_server is not None:
+                self.ingest_server.stop()
+            if self.stall_watchdog is not None:
+                self.stall_watchdog.stop()
+            if self.profiler is not None:
+                self.profiler.stop(wait=True)
         except Exception as e:
             logger.error(f"error saving state during closure: {e}", exc_info=True)
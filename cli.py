@@ -0,0 +1,153 @@
+"""
+Log and query tracking data from the command line without starting the GUI.
+
+    python cli.py log hydration 16
+    python cli.py log mmdmr 3 0 1 0
+    python cli.py log sleep 23:30:00 07:15:00 --date 2024-05-01
+    python cli.py show sleep --last 7
+
+Point a shell alias such as `bslm` at this file to use it as `bslm log hydration 16`.
+It talks to the database through the sqlite3 storage backend, so PyQt6 is only loaded
+once, to create the schema of a new database. Writes wait for the GUI's when both run at once.
+A logged entry is written like one made in the app: it is recorded in the operation journal,
+so the app's Undo removes it, and a long note is compacted.
+"""
+import argparse
+import datetime
+import os
+import sqlite3
+import sys
+from typing import Any, List, Optional
+import tracker_config as tkc
+from database.database_utility.journal_store import JOURNAL_TABLE
+from database.database_utility.note_store import LENGTH_COLUMN, NOTE_COLUMNS
+from database.database_utility.storage_backend import SqliteBackend
+from database.database_utility.table_registry import TABLES, TOMBSTONE_COLUMN
+from logger_setup import logger
+
+DB_PATH = os.path.join(os.path.expanduser('~'), tkc.DB_NAME)
+
+# command name -> table
+COMMAND_TABLES = {
+    'sleep': 'sleep_table',
+    'hours-slept': 'total_hours_slept_table',
+    'woke-up-like': 'woke_up_like_table',
+    'sleep-quality': 'sleep_quality_table',
+    'shower': 'shower_table',
+    'exercise': 'exercise_table',
+    'teeth': 'tooth_table',
+    'diet': 'diet_table',
+    'hydration': 'hydration_table',
+    'lily-diet': 'lily_diet_table',
+    'lily-mood': 'lily_mood_table',
+    'lily-walk': 'lily_walk_table',
+    'lily-room': 'lily_in_room_table',
+    'lily-notes': 'lily_notes_table',
+    'lily-walk-notes': 'lily_walk_notes_table',
+    'wefe': 'wefe_table',
+    'cspr': 'cspr_table',
+    'mmdmr': 'mmdmr_table',
+}
+
+
+def convert_value(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def schema_exists() -> bool:
+    if not os.path.exists(DB_PATH):
+        return False
+    connection = sqlite3.connect(DB_PATH)
+    try:
+        # the columns and tables added after the first version; missing ones need DataManager
+        required = {table: {TOMBSTONE_COLUMN} for table in TABLES}
+        for table in NOTE_COLUMNS:
+            required[table].add(LENGTH_COLUMN)
+        required[JOURNAL_TABLE] = {'op_group'}
+        return all(columns <= {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+                   for table, columns in required.items())
+    finally:
+        connection.close()
+
+
+def open_backend() -> SqliteBackend:
+    """
+    Opens the database with the sqlite3 backend. Only a missing schema brings in PyQt6, to
+    let DataManager create the tables, indexes and triggers the GUI expects.
+    """
+    if not schema_exists():
+        from PyQt6.QtCore import QCoreApplication
+        from database.database_manager import DataManager
+        _app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+        DataManager(DB_PATH).db.close()
+    return SqliteBackend(DB_PATH)
+
+
+def log_entry(table: str, values: List[str], date: Optional[str], time: Optional[str]) -> int:
+    spec = TABLES[table]
+    if len(values) != len(spec.value_columns):
+        print(f"{table} takes {len(spec.value_columns)} value(s): "
+              f"{' '.join(spec.value_columns) or '(none)'}", file=sys.stderr)
+        return 2
+    now = datetime.datetime.now()
+    row: List[Any] = [date or now.strftime('%Y-%m-%d')]
+    if spec.time_column is not None:
+        row.append(time or now.strftime('%H:%M:%S'))
+    row.extend(convert_value(value) for value in values)
+
+    backend = open_backend()
+    try:
+        if backend.insert(table, row) is None:
+            print(f"Could not log {table}, see the log file", file=sys.stderr)
+            return 1
+    finally:
+        backend.close()
+    print(f"Logged {table}: {', '.join(str(value) for value in row)}")
+    return 0
+
+
+def show_entries(table: str, last_days: int) -> int:
+    columns = list(TABLES[table].columns)
+    since = (datetime.date.today() - datetime.timedelta(days=last_days - 1)).isoformat()
+    backend = open_backend()
+    try:
+        entries = backend.query_range(table, since=since, columns=columns, descending=True)
+    finally:
+        backend.close()
+    rows = [columns] + [[str(value) for value in entry] for entry in entries]
+    widths = [max(len(row[index]) for row in rows) for index in range(len(columns))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='bslm', description=f"{tkc.APPLICATION_NAME} tracker")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    log_parser = commands.add_parser('log', help="log one entry")
+    log_parser.add_argument('name', choices=COMMAND_TABLES)
+    log_parser.add_argument('values', nargs='*')
+    log_parser.add_argument('--date', help="yyyy-MM-dd, defaults to today")
+    log_parser.add_argument('--time', help="hh:mm:ss, defaults to now")
+
+    show_parser = commands.add_parser('show', help="show recent entries")
+    show_parser.add_argument('name', choices=COMMAND_TABLES)
+    show_parser.add_argument('--last', type=int, default=7, help="number of days, default 7")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == 'log':
+            return log_entry(COMMAND_TABLES[args.name], args.values, args.date, args.time)
+        return show_entries(COMMAND_TABLES[args.name], args.last)
+    except Exception as e:
+        logger.error(f"Error in command line {args.command}: {e}", exc_info=True)
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
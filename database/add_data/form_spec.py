@@ -0,0 +1,182 @@
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from PyQt6.QtCore import QDate, QTime
+from database.database_utility.storage_backend import insert_sql
+from database.database_utility.table_registry import TABLES
+from logger_setup import logger
+
+# form_spec.py
+
+DATE_FORMAT = 'yyyy-MM-dd'
+TIME_FORMAT = 'hh:mm:ss'
+
+
+class FormSpec(NamedTuple):
+    """
+    Declares one data entry form: which widget fills which column of a tracking table.
+
+    Attributes:
+        table (str): The table the form inserts into.
+        fields (Tuple[Tuple[str, str], ...]): (widget attribute, accessor) per column, in the
+            order of TableSpec.columns. The accessor is one of ACCESSORS.
+        model (Optional[str]): The attribute of the model re-selected after a commit.
+        trigger (Optional[str]): The attribute of the QAction or button that commits the form.
+    """
+    table: str
+    fields: Tuple[Tuple[str, str], ...]
+    model: Optional[str] = None
+    trigger: Optional[str] = None
+
+
+def read_date(widget) -> Callable[[], str]:
+    date = widget.date
+    return lambda: date().toString(DATE_FORMAT)
+
+
+def read_time(widget) -> Callable[[], str]:
+    time = widget.time
+    return lambda: time().toString(TIME_FORMAT)
+
+
+def reset_date(widget) -> Callable[[], None]:
+    set_date = widget.setDate
+    return lambda: set_date(QDate.currentDate())
+
+
+def reset_time(widget) -> Callable[[], None]:
+    set_time = widget.setTime
+    return lambda: set_time(QTime.currentTime())
+
+
+def reset_value(widget) -> Callable[[], None]:
+    set_value = widget.setValue
+    return lambda: set_value(0)
+
+
+def reset_checked(widget) -> Callable[[], None]:
+    set_checked = widget.setChecked
+    return lambda: set_checked(False)
+
+
+# accessor -> (reader factory, reset factory); each factory binds to the widget once
+ACCESSORS: Dict[str, Tuple[Callable[[Any], Callable[[], Any]], Callable[[Any], Callable[[], None]]]] = {
+    'date': (read_date, reset_date),
+    'time': (read_time, reset_time),
+    'value': (lambda widget: widget.value, reset_value),
+    'text': (lambda widget: widget.text, lambda widget: widget.clear),
+    'toPlainText': (lambda widget: widget.toPlainText, lambda widget: widget.clear),
+    'isChecked': (lambda widget: widget.isChecked, reset_checked),
+}
+
+
+class CompiledForm:
+    """
+    A FormSpec bound to the main window's widgets and the table's INSERT statement.
+
+    All widget and method lookups happen once in compile_form(), so a commit only calls the
+    bound readers in column order and runs the prepared statement through
+    DataManager.exec_insert, which also records the row in the operation journal.
+
+    Attributes:
+        spec (FormSpec): The form.
+        readers (Tuple[Callable[[], Any], ...]): One bound reader per column.
+        resets (Tuple[Callable[[], None], ...]): One bound reset per widget.
+        model (Optional[object]): The model re-selected after a commit.
+        refresh (Optional[Callable[[object], None]]): Schedules the model's re-select, e.g.
+            RefreshScheduler.mark_dirty; None selects it right away.
+        sql (str): The INSERT statement of the table.
+    """
+    __slots__ = ('spec', 'readers', 'resets', 'model', 'refresh', 'sql', 'db_manager')
+
+    def __init__(self, spec: FormSpec, readers: Tuple[Callable[[], Any], ...],
+                 resets: Tuple[Callable[[], None], ...], model: Optional[object], db_manager,
+                 refresh: Optional[Callable[[object], None]] = None) -> None:
+        self.spec = spec
+        self.readers = readers
+        self.resets = resets
+        self.model = model
+        self.refresh = refresh
+        self.sql = insert_sql(TABLES[spec.table], TABLES[spec.table].columns)
+        self.db_manager = db_manager
+
+    def read(self) -> List[Any]:
+        return [read() for read in self.readers]
+
+    def insert(self, values: List[Any]) -> Optional[int]:
+        return self.db_manager.exec_insert(self.spec.table, self.sql, values)
+
+    def reset(self, select_model: bool = True) -> None:
+        for reset in self.resets:
+            reset()
+        if not select_model or self.model is None:
+            return
+        if self.refresh is not None:
+            self.refresh(self.model)
+        else:
+            self.model.select()
+
+    def commit(self) -> bool:
+        """
+        Inserts the form's values and resets it.
+
+        Returns:
+            bool: True if the row was inserted. The form is only reset then.
+        """
+        try:
+            if self.insert(self.read()) is None:
+                return False
+            self.reset()
+            return True
+        except Exception as e:
+            logger.error(f"Error committing the {self.spec.table} form: {e}", exc_info=True)
+            return False
+
+
+def compile_form(main_window_instance, spec: FormSpec, db_manager,
+                 refresh: Optional[Callable[[object], None]] = None) -> CompiledForm:
+    """
+    Resolves a form's widgets, accessors and model once.
+
+    Raises:
+        ValueError: If the fields do not match the table's columns or an accessor is unknown.
+    """
+    table = TABLES.get(spec.table)
+    if table is None:
+        raise ValueError(f"Unknown table {spec.table!r}")
+    if len(spec.fields) != len(table.columns):
+        raise ValueError(f"{spec.table} takes {len(table.columns)} fields: "
+                         f"{', '.join(table.columns)}")
+    readers = []
+    resets = []
+    for widget_name, accessor in spec.fields:
+        if accessor not in ACCESSORS:
+            raise ValueError(f"Unknown accessor {accessor!r} for {widget_name}")
+        widget = getattr(main_window_instance, widget_name)
+        make_reader, make_reset = ACCESSORS[accessor]
+        readers.append(make_reader(widget))
+        resets.append(make_reset(widget))
+    model = getattr(main_window_instance, spec.model) if spec.model is not None else None
+    return CompiledForm(spec, tuple(readers), tuple(resets), model, db_manager, refresh)
+
+
+def bind_forms(main_window_instance, specs: Iterable[FormSpec], db_manager,
+               refresh: Optional[Callable[[object], None]] = None) -> List[CompiledForm]:
+    """
+    Compiles every form and connects its trigger to its commit. A form that fails to compile
+    is logged and left out.
+
+    Returns:
+        List[CompiledForm]: The compiled forms.
+    """
+    forms = []
+    for spec in specs:
+        try:
+            form = compile_form(main_window_instance, spec, db_manager, refresh)
+            if spec.trigger is not None:
+                trigger = getattr(main_window_instance, spec.trigger)
+                # QActions commit on triggered, buttons on clicked
+                signal = trigger.triggered if hasattr(trigger, 'triggered') else trigger.clicked
+                signal.connect(lambda checked=False, form=form: form.commit())
+            forms.append(form)
+        except Exception as e:
+            logger.error(f"Error binding the {spec.table} form: {e}", exc_info=True)
+    return forms
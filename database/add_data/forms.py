@@ -0,0 +1,44 @@
+from database.add_data.basics_mod.basics_exercise import EXERCISE_FORM
+from database.add_data.basics_mod.basics_shower import SHOWER_FORM
+from database.add_data.basics_mod.basics_teethbrushing import TEETHBRUSH_FORM
+from database.add_data.diet_mod.diet import DIET_FORM
+from database.add_data.lily_mod.lily_diet import LILY_DIET_FORM
+from database.add_data.lily_mod.lily_mood import LILY_MOOD_FORM
+from database.add_data.lily_mod.lily_notes import LILY_NOTES_FORM
+from database.add_data.lily_mod.lily_time_in_room import LILY_TIME_IN_ROOM_FORM
+from database.add_data.lily_mod.lily_walk_notes import LILY_WALK_NOTES_FORM
+from database.add_data.lily_mod.lily_walks import LILY_WALK_FORM
+from database.add_data.mental.cspr import CSPR_FORM
+from database.add_data.mental.mmdmr import MMDMR_FORM
+from database.add_data.mental.wefe import WEFE_FORM
+from database.add_data.sleep_mod.sleep import SLEEP_FORM
+from database.add_data.sleep_mod.sleep_quality import SLEEP_QUALITY_FORM
+from database.add_data.sleep_mod.sleep_total_hours_slept import TOTAL_HOURS_SLEPT_FORM
+from database.add_data.sleep_mod.sleep_woke_up_like import WOKE_UP_LIKE_FORM
+
+# forms.py
+
+# the forms committed on their own trigger; a new form only needs its FormSpec listed here
+FORMS = (
+    CSPR_FORM,
+    DIET_FORM,
+    EXERCISE_FORM,
+    LILY_DIET_FORM,
+    LILY_MOOD_FORM,
+    LILY_NOTES_FORM,
+    LILY_WALK_NOTES_FORM,
+    LILY_WALK_FORM,
+    LILY_TIME_IN_ROOM_FORM,
+    MMDMR_FORM,
+    SHOWER_FORM,
+    WEFE_FORM,
+    TEETHBRUSH_FORM,
+)
+
+# the sleep page's forms, committed together by the 'Commit Sleep' action
+SLEEP_FORMS = (
+    SLEEP_FORM,
+    TOTAL_HOURS_SLEPT_FORM,
+    WOKE_UP_LIKE_FORM,
+    SLEEP_QUALITY_FORM,
+)
@@ -0,0 +1,36 @@
+from typing import Sequence
+from database.add_data.form_spec import CompiledForm
+from logger_setup import logger
+
+# sleep_commit.py
+
+
+def commit_sleep_page(forms: Sequence[CompiledForm],
+                      db_manager) -> bool:
+    """
+    Commits the sleep page's sleep times, total hours slept, woke up like and sleep quality
+    rows in one unit of work, so either all four rows are saved or none.
+
+    Every form is read before anything is inserted or reset, so all four rows carry the date
+    picked on the page.
+
+    Args:
+        forms (Sequence[CompiledForm]): The compiled SLEEP_FORMS.
+        db_manager (DataManager): The data manager to insert with.
+
+    Returns:
+        bool: True if the rows were committed. The forms are only reset and their models
+        re-selected then, each once.
+    """
+    try:
+        rows = [form.read() for form in forms]
+        with db_manager.unit_of_work():
+            for form, values in zip(forms, rows):
+                form.insert(values)
+    except Exception as e:
+        logger.error(f"Error while committing the sleep page: {e}", exc_info=True)
+        return False
+
+    for form in forms:
+        form.reset()
+    return True
@@ -1,10 +1,27 @@
 # from sexy_logger import logger
 import tracker_config as tkc
+from PyQt6.QtCore import QByteArray
 from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+import datetime
 import os
 import shutil
-from typing import List, Union
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, Tuple
 from logger_setup import logger
+from database.database_utility.search_index import (
+    SEARCH_SOURCES, create_fts_table_sql, create_fts_trigger_sql, rebuild_fts_sql,
+    build_match_expression, build_search_sql, stores_text)
+from database.database_utility.note_store import (
+    LENGTH_COLUMN, NOTE_COLUMNS, body_sql, compact_sql, compress, decompress, make_preview,
+    setup_sql)
+from database.database_utility.column_cache import ColumnCache
+from database.database_utility.maintenance import AUTO_VACUUM_INCREMENTAL
+from database.database_utility.row_records import (
+    RowRecord, record_type, to_columns, to_records)
+from database.database_utility.storage_backend import checked_columns
+from database.database_utility.table_registry import TABLES, TOMBSTONE_COLUMN, TableSpec
+from database.database_utility.qt_storage_backend import QtSqlBackend
+from database.database_utility.journal import OperationJournal
 
 user_dir = os.path.expanduser('~')
 db_path = os.path.join(os.getcwd(), tkc.DB_NAME)  # Database Name
@@ -33,11 +50,19 @@ class DataManager:
         try:
             self.db = QSqlDatabase.addDatabase('QSQLITE')
             self.db.setDatabaseName(db_name)
+            self.db.setConnectOptions(f"QSQLITE_BUSY_TIMEOUT={tkc.DB_BUSY_TIMEOUT_MS}")
             
             if not self.db.open():
                 logger.error("Error: Unable to open database")
             logger.debug("DB INITIALIZING")
             self.query = QSqlQuery()
+            self.backend = QtSqlBackend(connection_name=self.db.connectionName())
+            self.archives = self.backend.archives()
+            self.column_cache = ColumnCache(self)
+            self.journal = OperationJournal(self.column_cache.remove, self.column_cache.restore)
+            self.unit_depth = 0
+            self.unit_failed = False
+            self.setup_auto_vacuum()
             self.setup_tables()
         except Exception as e:
             logger.error(f"Error: Unable to open database {e}", exc_info=True)
@@ -61,6 +86,502 @@ class DataManager:
         self.setup_wefe_table()
         self.setup_into_cspr_exam()
         self.setup_mmdmr_table()
+        self.setup_tombstones()
+        self.setup_note_bodies()
+        self.setup_search_indexes()
+        self.setup_date_indexes()
+        self.journal.setup()
+    
+    def setup_auto_vacuum(self) -> None:
+        """
+        Switches the database to incremental auto-vacuum, so the idle maintenance can return
+        free pages in small steps. The switch needs a full VACUUM, which holds the write lock
+        while it rewrites the file; it runs once, here at startup, before the models open and
+        any other connection of the app writes.
+
+        Returns:
+            None
+        """
+        if not self.query.exec("PRAGMA auto_vacuum") or not self.query.next():
+            logger.error(f"Error reading auto_vacuum - {self.query.lastError().text()}")
+            return
+        mode = self.query.value(0)
+        self.query.finish()
+        if mode == AUTO_VACUUM_INCREMENTAL:
+            return
+        if not (self.query.exec("PRAGMA auto_vacuum = INCREMENTAL") and self.query.exec("VACUUM")):
+            logger.error(f"Error switching to incremental auto-vacuum - "
+                         f"{self.query.lastError().text()}")
+            return
+        logger.info("Database switched to incremental auto-vacuum")
+    
+    def setup_tombstones(self) -> None:
+        """
+        Adds the deleted_at tombstone column to every tracking table that lacks it, with a
+        partial index over the tombstoned rows for the purge.
+
+        Returns:
+            None
+        """
+        for table in TABLES:
+            if not self.query.exec(f"PRAGMA table_info({table})"):
+                logger.error(f"Error reading columns: {table} - {self.query.lastError().text()}")
+                continue
+            columns = []
+            while self.query.next():
+                columns.append(self.query.value(1))
+            if TOMBSTONE_COLUMN not in columns:
+                if not self.query.exec(f"ALTER TABLE {table} ADD COLUMN {TOMBSTONE_COLUMN} TEXT"):
+                    logger.error(f"Error adding tombstone column: {table} - "
+                                 f"{self.query.lastError().text()}")
+                    continue
+            if not self.query.exec(f"CREATE INDEX IF NOT EXISTS idx_{table}_{TOMBSTONE_COLUMN} "
+                                   f"ON {table}({TOMBSTONE_COLUMN}) "
+                                   f"WHERE {TOMBSTONE_COLUMN} IS NOT NULL"):
+                logger.error(f"Error creating tombstone index: {table} - "
+                             f"{self.query.lastError().text()}")
+    
+    def setup_note_bodies(self) -> None:
+        """
+        Adds the note_length column to the note tables and sets up the compressed note bodies
+        with the triggers keeping them consistent (see note_store.setup_sql).
+
+        Returns:
+            None
+        """
+        for table in NOTE_COLUMNS:
+            if not self.query.exec(f"PRAGMA table_info({table})"):
+                logger.error(f"Error reading columns: {table} - {self.query.lastError().text()}")
+                continue
+            columns = []
+            while self.query.next():
+                columns.append(self.query.value(1))
+            if LENGTH_COLUMN not in columns:
+                if not self.query.exec(f"ALTER TABLE {table} ADD COLUMN {LENGTH_COLUMN} INTEGER"):
+                    logger.error(f"Error adding note length column: {table} - "
+                                 f"{self.query.lastError().text()}")
+                    continue
+            for statement in setup_sql(table):
+                if not self.query.exec(statement):
+                    logger.error(f"Error setting up note bodies: {table} - "
+                                 f"{self.query.lastError().text()}")
+    
+    def compact_note(self,
+                     table: str,
+                     row_id: int,
+                     text: Optional[str]) -> bool:
+        """
+        Stores a note's text compressed in the body table and leaves its preview in the row.
+        Short notes stay as they are and only get their length set.
+
+        Args:
+            table (str): The note table.
+            row_id (int): The id of the note.
+            text (Optional[str]): The full text of the note.
+
+        Returns:
+            bool: True if the note was compacted; otherwise it is left for the maintenance pass.
+        """
+        text = text or ''
+        query = QSqlQuery()
+        insert_body, update_row = compact_sql(table)
+        if len(text) > tkc.NOTE_PREVIEW_CHARS:
+            query.prepare(insert_body)
+            query.addBindValue(row_id)
+            # bound as bytes, PyQt6 would store the text of their repr instead of a blob
+            query.addBindValue(QByteArray(compress(text)))
+            if not query.exec():
+                logger.error(f"Error storing note body: {table} {row_id} - "
+                             f"{query.lastError().text()}")
+                return False
+            query.prepare(update_row)
+            query.addBindValue(make_preview(text))
+        else:
+            query.prepare(f"UPDATE {table} SET {LENGTH_COLUMN} = ? WHERE id = ?")
+        query.addBindValue(len(text))
+        query.addBindValue(row_id)
+        if not query.exec():
+            logger.error(f"Error compacting note: {table} {row_id} - {query.lastError().text()}")
+            return False
+        return True
+    
+    def read_note(self,
+                  table: str,
+                  row_id: int) -> Optional[str]:
+        """
+        Reads the full text of a note, decompressing its body if it was compacted. An archived
+        note is read from the archives, which hold its full text.
+
+        Args:
+            table (str): The note table.
+            row_id (int): The id of the note.
+
+        Returns:
+            Optional[str]: The text, None if the note does not exist or cannot be read.
+        """
+        try:
+            query = QSqlQuery()
+            query.prepare(body_sql(table))
+            query.addBindValue(row_id)
+            if not query.exec():
+                logger.error(f"Error reading note: {table} {row_id} - {query.lastError().text()}")
+                return None
+            if not query.next():
+                return self.read_archived_note(table, row_id)
+            body = query.value(0)
+            if body is None or body == '':
+                return query.value(1)
+            if isinstance(body, QByteArray):
+                body = body.data()
+            return decompress(body)
+        except Exception as e:
+            logger.error(f"Error reading note: {table} {row_id} {e}", exc_info=True)
+            return None
+    
+    def read_archived_note(self,
+                           table: str,
+                           row_id: int) -> Optional[str]:
+        source = self.archives.source(table, None, None)
+        if source == table:
+            return None
+        query = QSqlQuery()
+        query.prepare(f"SELECT {NOTE_COLUMNS[table]} FROM {source} WHERE id = ?")
+        query.addBindValue(row_id)
+        if not query.exec():
+            logger.error(f"Error reading archived note: {table} {row_id} - "
+                         f"{query.lastError().text()}")
+            return None
+        return query.value(0) if query.next() else None
+    
+    def live_ids(self,
+                 table: str,
+                 row_ids: List[int]) -> List[int]:
+        """
+        Returns the ids that are live rows of the table; archived rows, which a model may show
+        from the archives, and tombstoned ones are left out.
+        """
+        if not row_ids:
+            return []
+        query = QSqlQuery()
+        query.prepare(f"SELECT id FROM {TABLES[table].name} "
+                      f"WHERE id IN ({', '.join('?' for _ in row_ids)}) "
+                      f"AND {TOMBSTONE_COLUMN} IS NULL")
+        for row_id in row_ids:
+            query.addBindValue(row_id)
+        live: List[int] = []
+        if not query.exec():
+            raise RuntimeError(query.lastError().text())
+        while query.next():
+            live.append(query.value(0))
+        return live
+    
+    def soft_delete(self,
+                    table: str,
+                    row_ids: List[int]) -> int:
+        """
+        Tombstones rows in one UPDATE. The rows disappear from the models and searches at once
+        and are physically removed by the maintenance purge later.
+
+        Args:
+            table (str): The table.
+            row_ids (List[int]): The ids of the rows to delete.
+
+        Returns:
+            int: The number of rows tombstoned.
+        """
+        if not row_ids:
+            return 0
+        query = QSqlQuery()
+        query.prepare(f"UPDATE {TABLES[table].name} SET {TOMBSTONE_COLUMN} = ? "
+                      f"WHERE id IN ({', '.join('?' for _ in row_ids)}) "
+                      f"AND {TOMBSTONE_COLUMN} IS NULL")
+        query.addBindValue(datetime.datetime.now().isoformat(timespec='seconds'))
+        for row_id in row_ids:
+            query.addBindValue(row_id)
+        if not query.exec():
+            logger.error(f"Error deleting rows: {table} - {query.lastError().text()}")
+            return 0
+        self.column_cache.remove(table, row_ids)
+        return query.numRowsAffected()
+    
+    def delete_rows(self,
+                    table: str,
+                    rows: List[Dict[str, Any]]) -> int:
+        """
+        Soft-deletes rows and records them in the operation journal in one unit of work, so a
+        delete is never committed without the entry that undoes it. Archived rows are read-only
+        and left out.
+
+        Args:
+            table (str): The table.
+            rows (List[Dict[str, Any]]): The rows to delete, with their id, keyed by column.
+
+        Returns:
+            int: The number of rows deleted, 0 if nothing was or the delete was rolled back.
+        """
+        try:
+            with self.unit_of_work():
+                live = set(self.live_ids(table, [row['id'] for row in rows]))
+                rows = [row for row in rows if row['id'] in live]
+                deleted = self.soft_delete(table, [row['id'] for row in rows])
+                if deleted and not self.journal.record_delete(table, rows):
+                    raise RuntimeError("Unable to record the delete in the journal")
+            return deleted
+        except Exception as e:
+            logger.error(f"Error deleting rows: {table} {e}", exc_info=True)
+            return 0
+    
+    def setup_date_indexes(self) -> None:
+        """
+        Sets up a (date, time) index on every tracking table.
+
+        The index serves both the date-ordered header sort of the table views and date range
+        filters, so neither needs a full table scan or an in-memory sort.
+
+        Returns:
+            None
+        """
+        for table, spec in TABLES.items():
+            columns = spec.date_column
+            if spec.time_column is not None:
+                columns += f", {spec.time_column}"
+            if not self.query.exec(f"CREATE INDEX IF NOT EXISTS idx_{table}_date ON {table}({columns})"):
+                logger.error(f"Error creating index: idx_{table}_date - "
+                             f"{self.query.lastError().text()}")
+    
+    def setup_search_indexes(self) -> None:
+        """
+        Sets up the FTS5 full-text indexes over the free-text columns listed in SEARCH_SOURCES.
+
+        Each index is an FTS5 table kept in sync with its source table by insert, delete and
+        update triggers. The note indexes keep their own copy of the text, since compacted notes
+        only keep a preview; an external-content note index from an older version is dropped
+        and rebuilt. An index created for the first time is rebuilt from the rows already in
+        the source table.
+
+        Returns:
+            None
+        """
+        for source_table in SEARCH_SOURCES:
+            fts_table = SEARCH_SOURCES[source_table][0]
+            self.query.prepare("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?")
+            self.query.addBindValue(fts_table)
+            already_exists = self.query.exec() and self.query.next()
+            outdated = (already_exists and stores_text(source_table)
+                        and "content=" in (self.query.value(0) or ''))
+            self.query.finish()
+            if outdated:
+                for suffix in ('ai', 'ad', 'au'):
+                    self.query.exec(f"DROP TRIGGER IF EXISTS {fts_table}_{suffix}")
+                if not self.query.exec(f"DROP TABLE {fts_table}"):
+                    logger.error(f"Error dropping search index: {fts_table} - "
+                                 f"{self.query.lastError().text()}")
+                    continue
+                already_exists = False
+            
+            if not self.query.exec(create_fts_table_sql(source_table)):
+                logger.error(f"Error creating search index: {fts_table} - "
+                             f"{self.query.lastError().text()}")
+                continue
+            for trigger_sql in create_fts_trigger_sql(source_table):
+                if not self.query.exec(trigger_sql):
+                    logger.error(f"Error creating search trigger: {fts_table} - "
+                                 f"{self.query.lastError().text()}")
+            if not already_exists and not self.query.exec(rebuild_fts_sql(source_table)):
+                logger.error(f"Error building search index: {fts_table} - "
+                             f"{self.query.lastError().text()}")
+    
+    def search_entries(self,
+                       text: str,
+                       limit: int = 50) -> List[Tuple[str, int, str, str, str]]:
+        """
+        Searches the notes and food entries for the given text, best matches first.
+
+        Every word of the text is matched as a prefix, so partially typed words find results.
+
+        Args:
+            text (str): The text typed into the search box.
+            limit (int): The maximum number of hits to return.
+
+        Returns:
+            List[Tuple[str, int, str, str, str]]: (source table, row id, date, time, snippet) hits.
+        """
+        match_expression = build_match_expression(text)
+        if not match_expression:
+            return []
+        
+        hits: List[Tuple[str, int, str, str, str]] = []
+        try:
+            # archived notes and food entries are searched in the archives' own indexes
+            schemas = self.archives.search_schemas()
+            self.query.prepare(build_search_sql(schemas))
+            for _ in range(len(SEARCH_SOURCES) * (1 + len(schemas))):
+                self.query.addBindValue(match_expression)
+            self.query.addBindValue(limit)
+            if not self.query.exec():
+                logger.error(f"Error searching entries - {self.query.lastError().text()}")
+                return hits
+            while self.query.next():
+                hits.append((self.query.value(0), self.query.value(1), self.query.value(2),
+                             self.query.value(3), self.query.value(4)))
+            self.query.finish()
+        except Exception as e:
+            logger.error(f"Error during search: {e}", exc_info=True)
+        return hits
+    
+    def iter_rows(self,
+                  table: str,
+                  since: Optional[str] = None,
+                  until: Optional[str] = None,
+                  columns: Optional[Sequence[str]] = None,
+                  descending: bool = False,
+                  chunk_size: int = tkc.READ_CHUNK_SIZE) -> Iterator[RowRecord]:
+        """
+        Streams the live rows of an inclusive date range, ordered by date and time, without
+        going through a Qt model.
+
+        Rows are read from a forward-only query chunk_size at a time and yielded as RowRecords
+        with one slot per column, e.g. row.mood_slider, so memory stays the same however large
+        the range. Note columns hold the preview of compacted notes; read_note has the text.
+
+        Args:
+            table (str): The table.
+            since (Optional[str]): The first 'yyyy-MM-dd' date, None for no lower bound.
+            until (Optional[str]): The last 'yyyy-MM-dd' date, None for no upper bound.
+            columns (Optional[Sequence[str]]): The columns to read, default id and
+                TableSpec.columns.
+            descending (bool): Newest rows first.
+            chunk_size (int): The rows fetched at a time.
+
+        Raises:
+            ValueError: If the table or a column is unknown.
+
+        Yields:
+            RowRecord: The next row.
+        """
+        columns = tuple(checked_columns(self.table_spec(table), columns))
+        record = record_type(table, columns)
+        for chunk in self.backend.iter_range(table, since, until, columns, descending, chunk_size):
+            yield from to_records(record, chunk)
+    
+    def iter_column_chunks(self,
+                           table: str,
+                           since: Optional[str] = None,
+                           until: Optional[str] = None,
+                           columns: Optional[Sequence[str]] = None,
+                           descending: bool = False,
+                           chunk_size: int = tkc.READ_CHUNK_SIZE) -> Iterator[Dict[str, List[Any]]]:
+        """
+        Streams the same rows as iter_rows, as one list per column for every chunk of up to
+        chunk_size rows, for analytics that work on columns.
+
+        Raises:
+            ValueError: If the table or a column is unknown.
+
+        Yields:
+            Dict[str, List[Any]]: Column -> its values in the chunk.
+        """
+        columns = checked_columns(self.table_spec(table), columns)
+        for chunk in self.backend.iter_range(table, since, until, columns, descending, chunk_size):
+            yield to_columns(columns, chunk)
+    
+    def data_version(self) -> Optional[int]:
+        """
+        Returns SQLite's data_version, which changes whenever another connection commits.
+        """
+        query = QSqlQuery()
+        if query.exec("PRAGMA data_version") and query.next():
+            return query.value(0)
+        return None
+    
+    @staticmethod
+    def table_spec(table: str) -> TableSpec:
+        if table not in TABLES:
+            raise ValueError(f"Unknown table {table!r}")
+        return TABLES[table]
+    
+    @contextmanager
+    def unit_of_work(self) -> Iterator[None]:
+        """
+        Runs the inserts made inside the block in one transaction, recorded as one operation in
+        the journal, so they are committed, undone and redone together.
+
+        If any insert fails or the block raises, everything is rolled back and the error is
+        raised. Nested units join the outermost one.
+
+        Raises:
+            RuntimeError: If the transaction could not be started or committed, or an insert
+                inside the block failed.
+        """
+        if self.unit_depth:
+            self.unit_depth += 1
+            try:
+                yield
+            finally:
+                self.unit_depth -= 1
+            return
+        if not self.db.transaction():
+            raise RuntimeError(f"Unable to start a transaction: {self.db.lastError().text()}")
+        self.unit_depth = 1
+        self.unit_failed = False
+        self.journal.begin_group()
+        try:
+            yield
+            if self.unit_failed:
+                raise RuntimeError("An insert in the unit of work failed")
+            if not self.db.commit():
+                raise RuntimeError(f"Unable to commit: {self.db.lastError().text()}")
+        except Exception:
+            self.db.rollback()
+            self.journal.load_position()
+            # the rolled back rows may already be in the column cache
+            self.column_cache.clear()
+            raise
+        finally:
+            self.unit_depth = 0
+            self.journal.end_group()
+    
+    def exec_insert(self,
+                    table: str,
+                    sql: str,
+                    bind_values: List[Union[str, int]]) -> Optional[int]:
+        """
+        Runs the INSERT statement of one of the insert methods below and records the new row in
+        the operation journal.
+
+        Args:
+            table (str): The table inserted into.
+            sql (str): The INSERT statement, with one placeholder per column of TableSpec.columns.
+            bind_values (List[Union[str, int]]): The values, in the order of TableSpec.columns.
+
+        Returns:
+            Optional[int]: The id of the new row, None if the insert failed.
+        """
+        try:
+            if sql.count('?') != len(bind_values):
+                raise ValueError(f"Mismatch: {table} Expected {sql.count('?')} bind values, "
+                                 f"got {len(bind_values)}.")
+            self.query.prepare(sql)
+            for value in bind_values:
+                self.query.addBindValue(value)
+            if not self.query.exec():
+                logger.error(f"Error inserting data: {table} - {self.query.lastError().text()}")
+                self.unit_failed = True
+                return None
+            row_id = self.query.lastInsertId()
+            self.journal.record_insert(table, row_id, bind_values)
+            self.column_cache.append(table, row_id, bind_values)
+            if table in NOTE_COLUMNS:
+                # the journal keeps the full text; the row only its preview
+                self.compact_note(table, row_id,
+                                  bind_values[TABLES[table].columns.index(NOTE_COLUMNS[table])])
+            return row_id
+        except ValueError as e:
+            logger.error(f"ValueError {table}: {e}")
+        except Exception as e:
+            logger.error(f"Error during data insertion: {table} {e}", exc_info=True)
+        self.unit_failed = True
+        return None
     
     def setup_mmdmr_table(self) -> None:
         """
@@ -130,20 +651,7 @@ class DataManager:
         bind_values: List[Union[str, int]] = [mmdmr_date, mmdmr_time,
                                               mood_slider, mania_slider, depression_slider,
                                               mixed_risk_slider]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: mmdmr_table Expected {sql.count('?')}
-                                        bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: mmdmr_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError mmdmr_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: mmdmr_table {e}", exc_info=True)
+        self.exec_insert('mmdmr_table', sql, bind_values)
     
     def setup_into_cspr_exam(self) -> None:
         if not self.query.exec(f"""
@@ -178,20 +686,7 @@ class DataManager:
         
         bind_values: List[Union[str, int]] = [cspr_date, cspr_time,
                                               calm_slider, stress_slider, pain_slider, rage_slider]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: cspr_table Expected {sql.count('?')}
-                                        bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: cspr_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError cspr_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: cspr_table {e}", exc_info=True)
+        self.exec_insert('cspr_table', sql, bind_values)
     
     def setup_wefe_table(self) -> None:
         if not self.query.exec(f"""
@@ -231,20 +726,7 @@ class DataManager:
                                               excite_slider,
                                               focus_slider,
                                               energy_slider]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: wefe_table Expected {sql.count('?')}
-                                    bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: wefe_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError wefe_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: wefe_table {e}", exc_info=True)
+        self.exec_insert('wefe_table', sql, bind_values)
     
     def setup_lily_notes_table(self) -> None:
         """
@@ -289,19 +771,7 @@ class DataManager:
         """
         sql: str = f"""INSERT INTO lily_notes_table(lily_date, lily_time, lily_notes) VALUES (?, ?, ?)"""
         bind_values: List[str] = [lily_date, lily_time, lily_notes]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: lily_notes_table Expected {sql.count('?')}
-                            bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(f"Error inserting data: lily_notes_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError lily_notes_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_notes_table {e}", exc_info=True)
+        self.exec_insert('lily_notes_table', sql, bind_values)
         
         ##################################################################################################################
         # Lily Diet Table
@@ -350,20 +820,7 @@ class DataManager:
         sql: str = f"""INSERT INTO lily_in_room_table(lily_date, lily_time,
                                                time_in_room_slider) VALUES (?, ?, ?)"""
         bind_values: List[Union[str, int]] = [lily_date, lily_time, time_in_room_slider]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: lily_in_room_table Expected {sql.count('?')}
-                            bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_in_room_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError lily_in_room_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_in_room_table {e}", exc_info=True)
+        self.exec_insert('lily_in_room_table', sql, bind_values)
         
         ##################################################################################################################
         # Lily Diet Table
@@ -407,20 +864,7 @@ class DataManager:
         """
         sql: str = f"""INSERT INTO lily_diet_table(lily_date, lily_time) VALUES (?, ?)"""
         bind_values: List[str] = [lily_date, lily_time]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: lily_eats_table Expected {sql.count('?')}
-                            bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_eats_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError lily_eats_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_eats_table {e}", exc_info=True)
+        self.exec_insert('lily_diet_table', sql, bind_values)
         
         ##################################################################################################################
         #       Lily MOOD table
@@ -465,20 +909,7 @@ class DataManager:
                 VALUES (?, ?, ?, ?, ?)"""
         bind_values: List[Union[str, int]] = [lily_date, lily_time, lily_mood_slider,
                                               lily_mood_activity_slider, lily_energy_slider]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: lily_mood_table Expected
-                            {sql.count('?')} bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_mood_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError lily_mood_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_mood_table {e}", exc_info=True)
+        self.exec_insert('lily_mood_table', sql, bind_values)
         
         # Lily WALKS table
     
@@ -531,21 +962,7 @@ class DataManager:
                     VALUES (?, ?, ?, ?)"""
         
         bind_values: List[Union[str, int]] = [lily_date, lily_time, lily_behavior, lily_gait]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(
-                    f"Mismatch: lily_walk_table Expected {sql.count('?')} bind values, got "
-                    f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_walk_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError lily_walk_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_walk_table", str(e))
+        self.exec_insert('lily_walk_table', sql, bind_values)
     
     def setup_lily_walk_notes_table(self) -> None:
         """
@@ -593,21 +1010,7 @@ class DataManager:
                     VALUES (?, ?, ?)"""
         
         bind_values: List[Union[str, int]] = [lily_date, lily_time, lily_walk_note]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(
-                    f"Mismatch: lily_walk_notes_table Expected {sql.count('?')} bind values, got "
-                    f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: lily_walk_notes_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError lily_walk_notes_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: lily_walk_notes_table", str(e))
+        self.exec_insert('lily_walk_notes_table', sql, bind_values)
     
     def setup_mental_mental_table(self) -> None:
         """
@@ -661,19 +1064,7 @@ class DataManager:
                 (?, ?, ?, ?)"""
         
         bind_values = [diet_date, diet_time, food_eaten, calories]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"Mismatch: diet_table Expected {sql.count('?')} bind values, got "
-                                 f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(f"Error inserting data: diet_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError diet_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: diet_table", str(e))
+        self.exec_insert('diet_table', sql, bind_values)
     
     def setup_hydration_table(self):
         if not self.query.exec(f"""
@@ -694,18 +1085,7 @@ class DataManager:
         sql = """INSERT INTO hydration_table(diet_date, diet_time, hydration) VALUES (?, ?, ?)"""
         
         bind_values = [diet_date, diet_time, hydration]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"Mismatch: hydration_table Expected {sql.count('?')} bind values, got {len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(f"Error inserting data: hydration_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError hydration_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: hydration_table", str(e))
+        self.exec_insert('hydration_table', sql, bind_values)
         
         # -:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-
         # SLEEP table
@@ -731,20 +1111,7 @@ class DataManager:
         
         bind_values: List[Union[str, bool]] = [basics_date, basics_time,
                                                shower_check]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: shower_table Expected {sql.count('?')}
-                            bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: shower_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError shower_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: shower_table {e}", exc_info=True)
+        self.exec_insert('shower_table', sql, bind_values)
     
     def setup_exercise(self) -> None:
         if not self.query.exec(f"""
@@ -766,20 +1133,7 @@ class DataManager:
         
         bind_values: List[Union[str, bool]] = [basics_date, basics_time,
                                                exerc_check]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: exercise_table Expected {sql.count('?')}
-                            bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: exercise_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError exercise_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: exercise_table {e}", exc_info=True)
+        self.exec_insert('exercise_table', sql, bind_values)
         
         # Teethbrushing Table
     
@@ -803,20 +1157,7 @@ class DataManager:
         
         bind_values: List[Union[str, bool]] = [basics_date, basics_time,
                                                tooth_check]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(f"""Mismatch: tooth_table Expected {sql.count('?')}
-                            bind values, got {len(bind_values)}.""")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: tooth_table - {self.query.lastError().text()}")
-        except ValueError as e:
-            logger.error(f"ValueError tooth_table: {e}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: tooth_table {e}", exc_info=True)
+        self.exec_insert('tooth_table', sql, bind_values)
     
     # SLEEP TIMES TABLE 
     def setup_sleep_table(self):
@@ -835,21 +1176,7 @@ class DataManager:
                                 time_awake):
         sql = f"""INSERT INTO sleep_table(sleep_date, time_asleep, time_awake) VALUES (?, ?, ?)"""
         bind_values = [sleep_date, time_asleep, time_awake]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(
-                    f"Mismatch: sleep_table Expected {sql.count('?')} bind values, got "
-                    f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: sleep_table - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError sleep_table: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: sleep_table", str(e))
+        self.exec_insert('sleep_table', sql, bind_values)
     
     # -:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-:-
     # BASICS table
@@ -869,21 +1196,7 @@ class DataManager:
         # Prepare the SQL statement
         sql = f"""INSERT INTO total_hours_slept_table(sleep_date, total_hours_slept) VALUES (?, ?)"""
         bind_values = [sleep_date, total_hours_slept]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(
-                    f"Mismatch: total_hours_slept Expected {sql.count('?')} bind values, got "
-                    f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: total_hours_slept - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError total_hours_slept: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: total_hours_slept", str(e))
+        self.exec_insert('total_hours_slept_table', sql, bind_values)
     
     def setup_woke_up_like_table(self):
         if not self.query.exec(f"""
@@ -900,21 +1213,7 @@ class DataManager:
         # Prepare the SQL statement
         sql = f"""INSERT INTO woke_up_like_table(sleep_date, woke_up_like) VALUES (?, ?)"""
         bind_values = [sleep_date, woke_up_like]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(
-                    f"Mismatch: woke_up_like Expected {sql.count('?')} bind values, got "
-                    f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: woke_up_like - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError woke_up_like: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: woke_up_like", str(e))
+        self.exec_insert('woke_up_like_table', sql, bind_values)
     
     def setup_sleep_quality_table(self):
         if not self.query.exec(f"""
@@ -931,21 +1230,7 @@ class DataManager:
         # Prepare the SQL statement
         sql = f"""INSERT INTO sleep_quality_table(sleep_date, sleep_quality) VALUES (?, ?)"""
         bind_values = [sleep_date, sleep_quality]
-        try:
-            self.query.prepare(sql)
-            for value in bind_values:
-                self.query.addBindValue(value)
-            if sql.count('?') != len(bind_values):
-                raise ValueError(
-                    f"Mismatch: sleep_quality Expected {sql.count('?')} bind values, got "
-                    f"{len(bind_values)}.")
-            if not self.query.exec():
-                logger.error(
-                    f"Error inserting data: sleep_quality - {self.query.lastError().text()}")
-        except ValueError as ve:
-            logger.error(f"ValueError sleep_quality: {str(ve)}")
-        except Exception as e:
-            logger.error(f"Error during data insertion: sleep_quality", str(e))
+        self.exec_insert('sleep_quality_table', sql, bind_values)
 
 
 def close_database(self):
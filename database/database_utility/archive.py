@@ -0,0 +1,318 @@
+import datetime
+import os
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional
+import tracker_config as tkc
+from database.database_utility.note_store import NOTE_COLUMNS, register_functions
+from database.database_utility.search_index import (
+    SEARCH_SOURCES, create_archive_fts_sql, fill_archive_fts_sql)
+from database.database_utility.table_registry import TABLES, TOMBSTONE_COLUMN
+from logger_setup import logger
+
+# archive.py
+
+ARCHIVE_PREFIX = 'bslm_archive_'
+ARCHIVE_SUFFIX = '.db'
+ARCHIVE_VIEW_SUFFIX = '_all'
+# SQLite's default limit on attached databases
+MAX_ATTACHED = 10
+
+
+def archive_view(table: str) -> str:
+    return f"{table}{ARCHIVE_VIEW_SUFFIX}"
+
+
+def archive_schema(year: int) -> str:
+    return f"archive_{year}"
+
+
+class ArchiveManager:
+    """
+    Moves old rows of the tracking tables into one SQLite file per year and attaches those files
+    only when a query's date range needs them.
+
+    For the attached years, a TEMP view named <table>_all combines the hot table and its archived
+    rows, so historical queries stay correct while the main database stays small. The readers
+    ask source() which of the two a date range needs: ranges that stay clear of the archived
+    years keep reading the table and attach nothing. Archived rows are read-only.
+
+    Attributes:
+        connection (Any): The connection the archives are attached to: a sqlite3 connection, or
+            a QueryCursor for a QSqlDatabase.
+        archive_dir (str): Where the per-year archive files live.
+        attached (List[int]): The archive years currently attached.
+        view_years (Optional[List[int]]): The years the <table>_all views cover, None if there
+            are no views.
+        years (List[int]): The archive years found at the last look into archive_dir.
+        listed_at (Optional[int]): The modification time of archive_dir at that look.
+    """
+
+    def __init__(self,
+                 connection: Any,
+                 archive_dir: str = os.path.join(os.path.expanduser('~'), tkc.PRINGLES,
+                                                 tkc.ARCHIVE_DIRECTORY)) -> None:
+        self.connection = connection
+        self.archive_dir = archive_dir
+        self.attached: List[int] = []
+        self.view_years: Optional[List[int]] = None
+        self.years: List[int] = []
+        self.listed_at: Optional[int] = None
+
+    def archive_path(self, year: int) -> str:
+        return os.path.join(self.archive_dir, f"{ARCHIVE_PREFIX}{year}{ARCHIVE_SUFFIX}")
+
+    def archive_years(self) -> List[int]:
+        """
+        The directory is only listed again once its modification time changes, so readers can
+        ask on every query.
+
+        Returns:
+            List[int]: The years that have an archive file, oldest first.
+        """
+        try:
+            modified = os.stat(self.archive_dir).st_mtime_ns
+        except OSError:
+            return []
+        if modified != self.listed_at:
+            years = []
+            for name in os.listdir(self.archive_dir):
+                match = re.fullmatch(rf"{ARCHIVE_PREFIX}(\d{{4}}){re.escape(ARCHIVE_SUFFIX)}",
+                                     name)
+                if match:
+                    years.append(int(match.group(1)))
+            self.years = sorted(years)
+            self.listed_at = modified
+        return self.years
+
+    def needed_years(self, since: Optional[str], until: Optional[str]) -> List[int]:
+        """
+        Returns the archive years overlapping an inclusive 'yyyy-MM-dd' date range, None for an
+        open side.
+        """
+        first_year = int(since[:4]) if since else None
+        last_year = int(until[:4]) if until else None
+        return [year for year in self.archive_years()
+                if (first_year is None or year >= first_year)
+                and (last_year is None or year <= last_year)]
+
+    def table_columns(self, schema: str, table: str) -> List[str]:
+        return [row[1] for row in self.connection.execute(f"PRAGMA {schema}.table_info({table})")]
+
+    def attach(self, year: int) -> None:
+        if year in self.attached:
+            return
+        os.makedirs(self.archive_dir, exist_ok=True)
+        self.connection.execute("ATTACH DATABASE ? AS " + archive_schema(year),
+                                (self.archive_path(year),))
+        self.attached.append(year)
+
+    def detach_all(self) -> None:
+        """
+        Drops the views and detaches the archives. An archive a pending statement still reads
+        cannot be detached; the error is raised and that archive stays in attached.
+        """
+        self.drop_views()
+        for year in list(self.attached):
+            self.connection.execute(f"DETACH DATABASE {archive_schema(year)}")
+            self.attached.remove(year)
+
+    def create_archive_table(self, year: int, table: str) -> None:
+        """
+        Creates the table in the year's archive with the same definition as the main table.
+        """
+        (create_sql,) = self.connection.execute(
+            "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?",
+            (table,)).fetchone()
+        create_sql = re.sub(rf'^CREATE TABLE\s+"?{table}"?',
+                            f"CREATE TABLE IF NOT EXISTS {archive_schema(year)}.{table}",
+                            create_sql)
+        self.connection.execute(create_sql)
+
+    def archive_before(self, cutoff: str) -> Dict[str, int]:
+        """
+        Moves every row dated before the cutoff into the archive file of its year.
+
+        All moves happen in one transaction, so a crash leaves each row either in the main
+        database or in its archive, never in both or neither. Compacted notes are archived
+        with their full text, as their bodies are deleted with the rows.
+
+        Args:
+            cutoff (str): The 'yyyy-MM-dd' date; older rows are archived.
+
+        Returns:
+            Dict[str, int]: The number of rows archived per table.
+        """
+        moved: Dict[str, int] = {}
+        years_by_table: Dict[str, List[int]] = {}
+        for table, spec in TABLES.items():
+            rows = self.connection.execute(
+                f"SELECT DISTINCT CAST(substr({spec.date_column}, 1, 4) AS INTEGER) FROM {table} "
+                f"WHERE {spec.date_column} < ?", (cutoff,)).fetchall()
+            years_by_table[table] = [year for (year,) in rows if year]
+        if not any(years_by_table.values()):
+            return moved
+
+        register_functions(self.connection)
+        self.detach_all()
+        archived_years = sorted({year for years in years_by_table.values() for year in years})
+        for year in archived_years:
+            self.attach(year)
+        try:
+            self.connection.execute("BEGIN IMMEDIATE")
+            for year in archived_years:
+                # every archive can be searched, whichever sources it holds rows of
+                for table in SEARCH_SOURCES:
+                    self.create_archive_table(year, table)
+                    self.connection.execute(create_archive_fts_sql(archive_schema(year), table))
+            for table, years in years_by_table.items():
+                date_column = TABLES[table].date_column
+                for year in years:
+                    self.create_archive_table(year, table)
+                    archive_columns = set(self.table_columns(archive_schema(year), table))
+                    column_names = [column for column in self.table_columns('main', table)
+                                    if column in archive_columns]
+                    columns = ", ".join(column_names)
+                    selected = ", ".join(f"note_text('{table}', id, {column})"
+                                         if column == NOTE_COLUMNS.get(table) else column
+                                         for column in column_names)
+                    # soft-deleted rows stay behind for the purge
+                    in_year = (f"{date_column} < ? AND {TOMBSTONE_COLUMN} IS NULL AND "
+                               f"CAST(substr({date_column}, 1, 4) AS INTEGER) = ?")
+                    self.connection.execute(
+                        f"INSERT INTO {archive_schema(year)}.{table} ({columns}) "
+                        f"SELECT {selected} FROM main.{table} WHERE {in_year}", (cutoff, year))
+                    cursor = self.connection.execute(
+                        f"DELETE FROM main.{table} WHERE {in_year}", (cutoff, year))
+                    moved[table] = moved.get(table, 0) + cursor.rowcount
+            for year in archived_years:
+                for table in SEARCH_SOURCES:
+                    self.connection.execute(fill_archive_fts_sql(archive_schema(year), table))
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        finally:
+            self.detach_all()
+        logger.info(f"Archived rows older than {cutoff}: {moved}")
+        return moved
+
+    def attach_range(self, since: Optional[str], until: Optional[str]) -> List[int]:
+        """
+        Attaches the archives covering a date range and makes the <table>_all views cover them.
+
+        Years attached for earlier ranges stay attached, as views over more years still read
+        the right rows, so alternating between ranges does not rebuild the views every time.
+        Only a range that needs more than MAX_ATTACHED years in all starts over.
+
+        Args:
+            since (Optional[str]): The first 'yyyy-MM-dd' date of the range, None for no bound.
+            until (Optional[str]): The last 'yyyy-MM-dd' date of the range, None for no bound.
+
+        Returns:
+            List[int]: The archive years now attached.
+        """
+        needed = self.needed_years(since, until)
+        if len(needed) > MAX_ATTACHED:
+            logger.warning(f"Only the latest {MAX_ATTACHED} of {len(needed)} archive years "
+                           f"can be attached; older years are left out")
+            needed = needed[-MAX_ATTACHED:]
+        if len(set(self.attached) | set(needed)) > MAX_ATTACHED:
+            self.detach_all()
+        for year in needed:
+            self.attach(year)
+        if self.attached and self.view_years != self.attached:
+            self.create_views()
+        return self.attached
+
+    def source(self, table: str, since: Optional[str], until: Optional[str]) -> str:
+        """
+        Returns what a read of a date range selects from: the table itself, or its <table>_all
+        view once the range reaches an archived year. If the archives cannot be attached, e.g.
+        inside a transaction, the error is logged and the table is read alone.
+
+        Args:
+            table (str): The table.
+            since (Optional[str]): The first 'yyyy-MM-dd' date of the range, None for no bound.
+            until (Optional[str]): The last 'yyyy-MM-dd' date of the range, None for no bound.
+
+        Returns:
+            str: The table or view name.
+        """
+        if not self.needed_years(since, until):
+            return table
+        try:
+            self.attach_range(since, until)
+        except Exception as e:
+            logger.error(f"Error attaching archives for {table}: {e}", exc_info=True)
+            return table
+        return archive_view(table) if self.view_years else table
+
+    def search_schemas(self) -> List[str]:
+        """
+        Attaches every archive for a search and returns the schemas whose archived text is
+        indexed. An archive holds one full-text index per SEARCH_SOURCES table.
+        """
+        try:
+            self.attach_range(None, None)
+        except Exception as e:
+            logger.error(f"Error attaching archives for search: {e}", exc_info=True)
+            return []
+        indexes = {SEARCH_SOURCES[table][0] for table in SEARCH_SOURCES}
+        schemas = []
+        for year in self.attached:
+            schema = archive_schema(year)
+            names = {row[0] for row in self.connection.execute(
+                f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table'")}
+            if indexes <= names and set(SEARCH_SOURCES) <= names:
+                schemas.append(schema)
+        return schemas
+
+    def drop_views(self) -> None:
+        for table in TABLES:
+            self.connection.execute(f"DROP VIEW IF EXISTS temp.{archive_view(table)}")
+        self.view_years = None
+
+    def create_views(self) -> None:
+        """
+        Creates a TEMP view per table combining the main table with the attached archives.
+        Columns missing from an older archive read as NULL.
+        """
+        self.drop_views()
+        for table in TABLES:
+            columns = self.table_columns('main', table)
+            selects = [f"SELECT {', '.join(columns)} FROM main.{table}"]
+            for year in self.attached:
+                archive_columns = set(self.table_columns(archive_schema(year), table))
+                if not archive_columns:
+                    continue
+                selected = ", ".join(column if column in archive_columns else f"NULL AS {column}"
+                                     for column in columns)
+                selects.append(f"SELECT {selected} FROM {archive_schema(year)}.{table}")
+            self.connection.execute(
+                f"CREATE TEMP VIEW {archive_view(table)} AS {' UNION ALL '.join(selects)}")
+        self.view_years = list(self.attached)
+
+
+def archive_old_rows(db_path: str, after_days: int) -> Dict[str, int]:
+    """
+    Archives the rows older than after_days on a connection of its own.
+
+    Args:
+        db_path (str): The main database file.
+        after_days (int): Rows dated more than this many days ago are archived.
+
+    Returns:
+        Dict[str, int]: The number of rows archived per table.
+    """
+    connection = None
+    try:
+        cutoff = (datetime.date.today() - datetime.timedelta(days=after_days)).isoformat()
+        connection = sqlite3.connect(db_path, timeout=5.0, isolation_level=None)
+        return ArchiveManager(connection).archive_before(cutoff)
+    except Exception as e:
+        logger.error(f"Error archiving old rows: {e}", exc_info=True)
+        return {}
+    finally:
+        if connection is not None:
+            connection.close()
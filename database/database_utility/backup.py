@@ -0,0 +1,153 @@
+import datetime
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+from typing import List, Optional, Set, Tuple
+import tracker_config as tkc
+from logger_setup import logger
+
+# backup.py
+
+BACKUP_PREFIX = 'bslm_backup_'
+BACKUP_SUFFIX = '.db.gz'
+BACKUP_STAMP = '%Y%m%d_%H%M%S'
+
+
+class DatabaseBackup:
+    """
+    Online backups of the live database taken with SQLite's backup API on a background thread.
+
+    The backup copies a few pages per step and sleeps between steps, so the GUI's own connection
+    is never locked out for long. Each backup is gzip compressed into a timestamped file and old
+    backups are pruned by the retention rules.
+
+    Attributes:
+        db_path (str): The live database file.
+        backup_dir (str): Where the compressed backups are written.
+        pages_per_step (int): Pages copied per backup step.
+        step_sleep (float): Seconds slept between steps.
+        keep_daily (int): Number of most recent days keeping their newest backup.
+        keep_weekly (int): Number of most recent weeks keeping their newest backup.
+        thread (Optional[threading.Thread]): The running backup, if any.
+    """
+
+    def __init__(self,
+                 db_path: str,
+                 backup_dir: str = os.path.join(os.path.expanduser('~'), tkc.PRINGLES,
+                                                tkc.BACKUP_DIRECTORY),
+                 pages_per_step: int = tkc.BACKUP_PAGES_PER_STEP,
+                 step_sleep: float = tkc.BACKUP_STEP_SLEEP,
+                 keep_daily: int = tkc.BACKUP_KEEP_DAILY,
+                 keep_weekly: int = tkc.BACKUP_KEEP_WEEKLY) -> None:
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+        self.keep_daily = keep_daily
+        self.keep_weekly = keep_weekly
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """
+        Starts a backup on a background thread unless one is already running.
+
+        Returns:
+            bool: True if a backup was started.
+        """
+        if self.thread is not None and self.thread.is_alive():
+            return False
+        self.thread = threading.Thread(target=self.run, name="bslm-backup", daemon=True)
+        self.thread.start()
+        return True
+
+    def run(self) -> Optional[str]:
+        """
+        Takes one backup and prunes the old ones. Runs on the calling thread.
+
+        Returns:
+            Optional[str]: The path of the new backup, or None if it failed.
+        """
+        try:
+            if not os.path.exists(self.db_path):
+                return None
+            os.makedirs(self.backup_dir, exist_ok=True)
+            stamp = datetime.datetime.now().strftime(BACKUP_STAMP)
+            partial_path = os.path.join(self.backup_dir, f".{BACKUP_PREFIX}{stamp}.partial")
+            backup_path = os.path.join(self.backup_dir, f"{BACKUP_PREFIX}{stamp}{BACKUP_SUFFIX}")
+
+            source = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=30)
+            target = sqlite3.connect(partial_path)
+            try:
+                source.backup(target, pages=self.pages_per_step, sleep=self.step_sleep)
+            finally:
+                target.close()
+                source.close()
+
+            with open(partial_path, 'rb') as raw, gzip.open(f"{partial_path}.gz", 'wb') as packed:
+                shutil.copyfileobj(raw, packed, 1024 * 1024)
+            os.replace(f"{partial_path}.gz", backup_path)
+            os.remove(partial_path)
+
+            logger.info(f"Database backup written: {backup_path}")
+            self.prune()
+            return backup_path
+        except Exception as e:
+            logger.error(f"Error backing up database: {e}", exc_info=True)
+            return None
+
+    def list_backups(self) -> List[Tuple[datetime.datetime, str]]:
+        """
+        Lists the finished backups, newest first.
+
+        Returns:
+            List[Tuple[datetime.datetime, str]]: (taken at, path) of every backup.
+        """
+        backups = []
+        for name in os.listdir(self.backup_dir):
+            if not (name.startswith(BACKUP_PREFIX) and name.endswith(BACKUP_SUFFIX)):
+                continue
+            stamp = name[len(BACKUP_PREFIX):-len(BACKUP_SUFFIX)]
+            try:
+                taken_at = datetime.datetime.strptime(stamp, BACKUP_STAMP)
+            except ValueError:
+                continue
+            backups.append((taken_at, os.path.join(self.backup_dir, name)))
+        backups.sort(reverse=True)
+        return backups
+
+    def prune(self) -> None:
+        """
+        Deletes the backups the retention rules no longer keep, along with partial files left
+        behind by an interrupted backup.
+
+        The newest backup is always kept, as is the newest backup of each of the last
+        keep_daily days and of each of the last keep_weekly ISO weeks.
+        """
+        try:
+            backups = self.list_backups()
+            keep: Set[str] = {backups[0][1]} if backups else set()
+            days: List[datetime.date] = []
+            weeks: List[Tuple[int, int]] = []
+            for taken_at, path in backups:
+                day = taken_at.date()
+                week = tuple(taken_at.isocalendar())[:2]
+                if day not in days and len(days) < self.keep_daily:
+                    days.append(day)
+                    keep.add(path)
+                if week not in weeks and len(weeks) < self.keep_weekly:
+                    weeks.append(week)
+                    keep.add(path)
+
+            for _, path in backups:
+                if path not in keep:
+                    os.remove(path)
+                    logger.info(f"Pruned database backup: {path}")
+
+            # prune runs after the current backup finished, so any partial file is stale
+            for name in os.listdir(self.backup_dir):
+                if name.startswith(f".{BACKUP_PREFIX}"):
+                    os.remove(os.path.join(self.backup_dir, name))
+        except Exception as e:
+            logger.error(f"Error pruning database backups: {e}", exc_info=True)
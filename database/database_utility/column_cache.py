@@ -0,0 +1,225 @@
+import datetime
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from database.database_utility.table_registry import TABLES
+from logger_setup import logger
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# column_cache.py
+
+# the small-integer time series kept in memory; see ColumnCache
+NUMERIC_TABLES = ('mmdmr_table', 'cspr_table', 'wefe_table', 'lily_mood_table', 'lily_walk_table',
+                  'sleep_quality_table', 'woke_up_like_table', 'hydration_table')
+
+# the typecode an array is widened to once a value does not fit
+WIDER_TYPECODES = {'b': 'h', 'h': 'i', 'i': 'q'}
+
+
+def epoch_seconds(date: Any, time: Any) -> Optional[int]:
+    """
+    Converts a 'yyyy-MM-dd' date and 'hh:mm:ss' time to local epoch seconds, None if invalid.
+    """
+    try:
+        return int(datetime.datetime.fromisoformat(f"{date}T{time}").timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+def insert_value(values: array, index: int, value: int) -> array:
+    """
+    Inserts a value and returns the array now holding the column. That is a copy if the array
+    is exported to a memoryview, which keeps seeing the old contents, or a wider array if the
+    value does not fit the typecode.
+    """
+    try:
+        values.insert(index, value)
+        return values
+    except BufferError:
+        values = array(values.typecode, values)
+    except OverflowError:
+        if values.typecode not in WIDER_TYPECODES:
+            raise
+        values = array(WIDER_TYPECODES[values.typecode], values)
+    return insert_value(values, index, value)
+
+
+def delete_value(values: array, index: int) -> array:
+    try:
+        del values[index]
+        return values
+    except BufferError:
+        values = array(values.typecode, values)
+        del values[index]
+        return values
+
+
+class TableColumns:
+    """
+    The cached columns of one table, ordered by timestamp (then id): ids as int64, epoch
+    seconds as int32 and one int8 array per value column.
+    """
+    __slots__ = ('ids', 'stamps', 'values')
+
+    def __init__(self, value_columns: Sequence[str]) -> None:
+        self.ids = array('q')
+        self.stamps = array('i')
+        self.values: Dict[str, array] = {column: array('b') for column in value_columns}
+
+    def insert(self, row_id: int, stamp: int, values: Sequence[int]) -> None:
+        index = bisect_right(self.stamps, stamp)
+        self.ids = insert_value(self.ids, index, row_id)
+        self.stamps = insert_value(self.stamps, index, stamp)
+        for column, value in zip(self.values, values):
+            self.values[column] = insert_value(self.values[column], index, value)
+
+    def remove(self, row_id: int) -> bool:
+        try:
+            index = self.ids.index(row_id)
+        except ValueError:
+            return False
+        self.ids = delete_value(self.ids, index)
+        self.stamps = delete_value(self.stamps, index)
+        for column in self.values:
+            self.values[column] = delete_value(self.values[column], index)
+        return True
+
+    def nbytes(self) -> int:
+        return sum(len(values) * values.itemsize
+                   for values in (self.ids, self.stamps, *self.values.values()))
+
+
+class ColumnCache:
+    """
+    In-memory columns of the NUMERIC_TABLES for charts and analytics.
+
+    A table is read once, on first use, through DataManager.iter_column_chunks, archived rows
+    included. DataManager then keeps it current: exec_insert adds new rows, soft_delete and
+    undo remove rows, and redo or undoing a delete puts them back. Writes by other connections,
+    such as the ingest server, cli.py or the archiving, change SQLite's data_version; the cache
+    then drops every table and reads them again on next use.
+
+    Readers get read-only memoryviews of the arrays, without copying. An array exported to a
+    view cannot be resized, so a later change copies it first; views already handed out keep
+    the rows they were taken with. Values are int8 and a column is widened on the first value
+    that does not fit.
+
+    Attributes:
+        db_manager: The DataManager the tables are read through.
+        tables (Dict[str, TableColumns]): The tables loaded.
+        data_version (Optional[int]): The data_version the tables were loaded at.
+    """
+
+    def __init__(self, db_manager) -> None:
+        self.db_manager = db_manager
+        self.tables: Dict[str, TableColumns] = {}
+        self.data_version: Optional[int] = None
+
+    def table(self, table: str) -> TableColumns:
+        if table not in NUMERIC_TABLES:
+            raise ValueError(f"{table} is not cached, expected one of {', '.join(NUMERIC_TABLES)}")
+        version = self.db_manager.data_version()
+        if version != self.data_version:
+            self.tables.clear()
+            self.data_version = version
+        if table not in self.tables:
+            self.tables[table] = self.load(table)
+        return self.tables[table]
+
+    def load(self, table: str) -> TableColumns:
+        spec = TABLES[table]
+        columns = TableColumns(spec.value_columns)
+        read = ['id', spec.date_column] + ([spec.time_column] if spec.time_column else [])
+        skipped = 0
+        for chunk in self.db_manager.iter_column_chunks(table,
+                                                        columns=read + list(spec.value_columns)):
+            times = chunk[spec.time_column] if spec.time_column else None
+            dates = chunk[spec.date_column]
+            values = [chunk[column] for column in spec.value_columns]
+            for index, row_id in enumerate(chunk['id']):
+                row = self.parse_row(dates[index], times[index] if times else '00:00:00',
+                                     [column[index] for column in values])
+                if row is None:
+                    skipped += 1
+                    continue
+                columns.insert(row_id, *row)
+        logger.info(f"Column cache loaded {table}: {len(columns.ids)} rows, "
+                    f"{columns.nbytes()} bytes" + (f", {skipped} skipped" if skipped else ""))
+        return columns
+
+    @staticmethod
+    def parse_row(date: Any, time: Any, values: Sequence[Any]) -> Optional[Tuple[int, List[int]]]:
+        stamp = epoch_seconds(date, time)
+        if stamp is None:
+            return None
+        try:
+            return stamp, [int(value) for value in values]
+        except (TypeError, ValueError):
+            return None
+
+    def view(self, table: str, column: str) -> Tuple[memoryview, memoryview]:
+        """
+        Returns read-only views of a column's timestamps and values, in timestamp order.
+
+        Raises:
+            ValueError: If the table is not cached.
+            KeyError: If the column is not one of its value columns.
+        """
+        columns = self.table(table)
+        return (memoryview(columns.stamps).toreadonly(),
+                memoryview(columns.values[column]).toreadonly())
+
+    def as_numpy(self, table: str, column: str):
+        """
+        Returns a column's timestamps and values as read-only NumPy arrays sharing the cache's
+        memory, None if NumPy is not installed.
+        """
+        if numpy is None:
+            return None
+        stamps, values = self.view(table, column)
+        return (numpy.frombuffer(stamps, dtype=stamps.format),
+                numpy.frombuffer(values, dtype=values.format))
+
+    def append(self, table: str, row_id: int, values: Sequence[Any]) -> None:
+        """
+        Adds a row inserted by DataManager, if its table is loaded.
+
+        Args:
+            table (str): The table.
+            row_id (int): The id of the new row.
+            values (Sequence[Any]): The row, in the order of TableSpec.columns.
+        """
+        columns = self.tables.get(table)
+        if columns is None:
+            return
+        spec = TABLES[table]
+        offset = 2 if spec.time_column else 1
+        row = self.parse_row(values[0], values[1] if spec.time_column else '00:00:00',
+                             values[offset:])
+        if row is not None:
+            columns.insert(row_id, *row)
+
+    def restore(self, table: str, row_id: int, payload: Dict[str, Any]) -> None:
+        """
+        Puts back a row restored by undo or redo, from its journal payload.
+        """
+        if table in self.tables:
+            self.tables[table].remove(row_id)
+            self.append(table, row_id, [payload.get(column) for column in TABLES[table].columns])
+
+    def remove(self, table: str, row_ids: Iterable[int]) -> None:
+        columns = self.tables.get(table)
+        if columns is None:
+            return
+        for row_id in row_ids:
+            columns.remove(row_id)
+
+    def clear(self) -> None:
+        """
+        Drops every table, e.g. after a rolled back transaction.
+        """
+        self.tables.clear()
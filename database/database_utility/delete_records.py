@@ -1,4 +1,5 @@
 from PyQt6.QtWidgets import QTableView, QMainWindow
+from database.database_utility.note_store import NOTE_COLUMNS
 from logger_setup import logger
 
 
@@ -21,18 +22,32 @@ def delete_selected_rows(main_window_instance: QMainWindow, table_view_widget_na
         table_view: QTableView = getattr(main_window_instance, table_view_widget_name)
         model = getattr(main_window_instance, model_name)  # The model's specific type could vary
 
-        if table_view is not None:
+        # with DATA_BROWSER_MODE the view is shared and may be showing another table
+        if table_view is not None and table_view.model() is model:
             # Get indices of selected rows, sorted in reverse order for deletion
             selected_rows = table_view.selectionModel().selectedRows()
             rows_to_delete = sorted([index.row() for index in selected_rows], reverse=True)
 
-            # Delete each selected row from the model
+            # Keep the selected rows for the operation journal, so the delete can be undone
+            deleted = []
             for row in rows_to_delete:
-                model.removeRow(row)
-
-            # Submit changes and refresh the model
-            model.submitAll()
-            model.select()
+                record = model.record(row)
+                deleted.append({record.fieldName(i): record.value(i)
+                                for i in range(record.count())})
+
+            # Compacted notes only show a preview; the journal keeps the full text
+            db_manager = main_window_instance.db_manager
+            note_column = NOTE_COLUMNS.get(model.tableName())
+            if note_column is not None:
+                for row in deleted:
+                    text = db_manager.read_note(model.tableName(), row['id'])
+                    if text is not None:
+                        row[note_column] = text
+
+            # Tombstone the rows and journal them together, then refresh the model; the
+            # maintenance purges them later
+            db_manager.delete_rows(model.tableName(), deleted)
+            main_window_instance.refresh_scheduler.mark_dirty(model)
 
     except Exception as e:
         logger.error(f"An error occurred while deleting records: {str(e)}")
@@ -0,0 +1,259 @@
+"""
+A localhost HTTP/JSON endpoint that logs entries from scripts and other local tools.
+
+POST a batch to http://127.0.0.1:<INGEST_PORT>/ingest with Content-Type application/json:
+
+    {"table": "hydration_table", "rows": [{"hydration": 16}, {"hydration": 8, "diet_time": "09:30:00"}]}
+
+or a list of such objects. Rows are objects keyed by column, or arrays in TableSpec.columns
+order. A missing date or time column defaults to now. Every batch is validated first and then
+committed in one transaction; the reply is {"inserted": {"hydration_table": 2}}.
+
+Rows are written like the app's own entries (see storage_backend.write_rows): each batch is one
+operation in the operation journal, so the app's Undo removes it, and long notes are compacted.
+
+Run it inside the app (INGEST_ENABLED in tracker_config) or on its own:
+
+    python -m database.database_utility.ingest_server
+"""
+import argparse
+import datetime
+import ipaddress
+import json
+import os
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import tracker_config as tkc
+from database.database_utility.storage_backend import SqliteBackend
+from database.database_utility.table_registry import TABLES, TableSpec
+from logger_setup import logger
+
+# ingest_server.py
+
+LOCAL_HOSTS = ('127.0.0.1', 'localhost', '::1')
+VALUE_TYPES = (str, int, float, type(None))
+
+
+class IngestError(ValueError):
+    """
+    A batch that does not match the tracking tables. Nothing of it is written.
+    """
+
+
+def build_row(spec: TableSpec, row: Any, now: datetime.datetime) -> List[Any]:
+    """
+    Converts one JSON row to the column order of its table, filling in the date and time.
+    """
+    if isinstance(row, list):
+        if len(row) != len(spec.columns):
+            raise IngestError(f"{spec.name} rows take {len(spec.columns)} values: "
+                              f"{', '.join(spec.columns)}")
+        values = row
+    elif isinstance(row, dict):
+        unknown = set(row) - set(spec.columns)
+        if unknown:
+            raise IngestError(f"Unknown columns for {spec.name}: {', '.join(sorted(unknown))}")
+        missing = [column for column in spec.value_columns if column not in row]
+        if missing:
+            raise IngestError(f"Missing columns for {spec.name}: {', '.join(missing)}")
+        defaults = {spec.date_column: now.strftime('%Y-%m-%d')}
+        if spec.time_column is not None:
+            defaults[spec.time_column] = now.strftime('%H:%M:%S')
+        values = [row.get(column, defaults.get(column)) for column in spec.columns]
+    else:
+        raise IngestError(f"{spec.name} rows must be objects or arrays")
+    for value in values:
+        if not isinstance(value, VALUE_TYPES):
+            raise IngestError(f"Values must be strings, numbers or null, got {value!r}")
+    return [int(value) if isinstance(value, bool) else value for value in values]
+
+
+def parse_batch(payload: Any, max_rows: int = tkc.INGEST_MAX_ROWS) -> Dict[str, List[List[Any]]]:
+    """
+    Validates a decoded JSON batch and groups its rows by table.
+
+    Args:
+        payload (Any): One {"table": ..., "rows": [...]} object or a list of them.
+        max_rows (int): The most rows accepted in one batch.
+
+    Returns:
+        Dict[str, List[List[Any]]]: The rows of each table, in TableSpec.columns order.
+
+    Raises:
+        IngestError: If any part of the batch is invalid.
+    """
+    groups = payload if isinstance(payload, list) else [payload]
+    now = datetime.datetime.now()
+    rows_by_table: Dict[str, List[List[Any]]] = {}
+    count = 0
+    for group in groups:
+        if not isinstance(group, dict) or not isinstance(group.get('rows'), list):
+            raise IngestError('Each batch entry needs a "table" and a "rows" list')
+        spec = TABLES.get(group.get('table'))
+        if spec is None:
+            raise IngestError(f"Unknown table {group.get('table')!r}")
+        count += len(group['rows'])
+        if count > max_rows:
+            raise IngestError(f"A batch takes at most {max_rows} rows")
+        rows_by_table.setdefault(spec.name, []).extend(
+            build_row(spec, row, now) for row in group['rows'])
+    return rows_by_table
+
+
+class IngestRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, so a client can stream batches
+    disable_nagle_algorithm = True  # small replies would otherwise wait for delayed ACKs
+    server: "IngestHTTPServer"
+
+    def do_POST(self) -> None:
+        if self.path.rstrip('/') != '/ingest':
+            self.reply(404, {'error': 'Not found'})
+            return
+        host = (self.headers.get('Host') or '').rsplit(':', 1)[0].strip('[]')
+        if host not in LOCAL_HOSTS:
+            # a web page reaching the port through DNS rebinding sends its own host name
+            self.reply(403, {'error': 'Forbidden'})
+            return
+        if self.headers.get_content_type() != 'application/json':
+            # browsers cannot send this cross-origin without a preflight, which is never answered
+            self.reply(415, {'error': 'Content-Type must be application/json'})
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > tkc.INGEST_MAX_BODY_BYTES:
+            self.reply(413, {'error': f"Body larger than {tkc.INGEST_MAX_BODY_BYTES} bytes"})
+            self.close_connection = True
+            return
+        try:
+            rows_by_table = parse_batch(json.loads(self.rfile.read(length)))
+        except (IngestError, ValueError) as e:
+            self.reply(400, {'error': str(e)})
+            return
+        counts = self.server.ingest_server.write(rows_by_table)
+        if counts is None:
+            self.reply(500, {'error': 'The batch could not be written, see the log file'})
+        else:
+            self.reply(200, {'inserted': counts})
+
+    def reply(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"Ingest {self.address_string()} - {format % args}")
+
+
+class IngestHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, ingest_server: "IngestServer") -> None:
+        if ':' in address[0]:
+            self.address_family = socket.AF_INET6
+        super().__init__(address, IngestRequestHandler)
+        self.ingest_server = ingest_server
+
+    def verify_request(self, request, client_address) -> bool:
+        return ipaddress.ip_address(client_address[0]).is_loopback
+
+
+class IngestServer:
+    """
+    Serves the ingest endpoint on a background thread and writes each batch through the
+    sqlite3 storage backend in one transaction, journaled and with its notes compacted.
+
+    Attributes:
+        db_path (str): The database file.
+        host (str): The loopback address to listen on.
+        port (int): The port to listen on.
+        on_ingest (Optional[Callable[[Dict[str, int]], None]]): Called from the server thread with
+            the rows inserted per table after every committed batch.
+    """
+
+    def __init__(self,
+                 db_path: str,
+                 host: str = tkc.INGEST_HOST,
+                 port: int = tkc.INGEST_PORT,
+                 on_ingest: Optional[Callable[[Dict[str, int]], None]] = None) -> None:
+        if host not in LOCAL_HOSTS:
+            raise ValueError(f"The ingest server only listens on loopback, not {host}")
+        self.db_path = db_path
+        self.host = host
+        self.port = port
+        self.on_ingest = on_ingest
+        self.backend = SqliteBackend(db_path)
+        self.httpd: Optional[IngestHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    def write(self, rows_by_table: Dict[str, Sequence[Sequence[Any]]]) -> Optional[Dict[str, int]]:
+        """
+        Commits one validated batch.
+
+        Returns:
+            Optional[Dict[str, int]]: The rows inserted per table, None if the batch failed.
+        """
+        if not rows_by_table:
+            return {}
+        counts = self.backend.insert_batch(rows_by_table)
+        if not counts:
+            return None
+        if self.on_ingest is not None:
+            try:
+                self.on_ingest(counts)
+            except Exception as e:
+                logger.error(f"Error notifying about ingested rows: {e}", exc_info=True)
+        return counts
+
+    def start(self) -> bool:
+        """
+        Starts listening on a background thread.
+
+        Returns:
+            bool: True if the server is running.
+        """
+        if self.thread is not None and self.thread.is_alive():
+            return True
+        try:
+            self.httpd = IngestHTTPServer((self.host, self.port), self)
+        except OSError as e:
+            logger.error(f"Error starting the ingest server on {self.host}:{self.port}: {e}")
+            return False
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="bslm-ingest",
+                                       daemon=True)
+        self.thread.start()
+        logger.info(f"Ingest server listening on {self.host}:{self.port}")
+        return True
+
+    def stop(self) -> None:
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+        self.thread = None
+        self.backend.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local-only ingest endpoint")
+    parser.add_argument('--db', default=os.path.join(os.path.expanduser('~'), tkc.DB_NAME))
+    parser.add_argument('--host', default=tkc.INGEST_HOST, choices=LOCAL_HOSTS)
+    parser.add_argument('--port', type=int, default=tkc.INGEST_PORT)
+    args = parser.parse_args()
+    server = IngestServer(args.db, args.host, args.port)
+    server.httpd = IngestHTTPServer((args.host, args.port), server)
+    print(f"Listening on {args.host}:{args.port}, Ctrl+C to stop")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        server.backend.close()
+
+
+if __name__ == "__main__":
+    main()
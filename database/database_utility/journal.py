@@ -0,0 +1,258 @@
+import datetime
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+from database.database_utility.journal_store import (
+    DONE, DROP_REDO_SQL, DROPPED, JOURNAL_TABLE, NEXT_GROUP_SQL, UNDONE, entry_values, record_sql,
+    setup_sql)
+from database.database_utility.table_registry import TABLES, TOMBSTONE_COLUMN
+from logger_setup import logger
+
+# journal.py
+
+
+class OperationJournal:
+    """
+    An append-only log of the inserts and deletes made from the app, with undo and redo.
+    The storage backends record their inserts in the same journal (see journal_store), so rows
+    logged by cli.py or the ingest server are undone like the app's own.
+
+    Every entry keeps the whole row, so undo and redo replay the inverse operation by id on
+    just the rows of one operation. The rows deleted together from a table view form one
+    operation (op_group). Finding the next operation to undo or redo is a single lookup on the
+    (state, op_group) index, however long the journal grows. Since other connections add
+    operations too, next_group is read again whenever a new operation starts.
+
+    Removing a row sets its tombstone and bringing it back clears it, falling back to the kept
+    row once the purge has removed it.
+
+    Attributes:
+        on_remove (Optional[Callable[[str, Iterable[int]], None]]): Told the rows an undo or
+            redo removed, per table, once it is committed.
+        on_restore (Optional[Callable[[str, int, Dict[str, Any]], None]]): Told each row an
+            undo or redo brought back, with its kept values, once it is committed.
+        next_group (int): The op_group of the next recorded operation.
+        has_redo (bool): Whether undone operations are waiting to be redone.
+        group_depth (int): How many begin_group() calls are open; while any is, everything
+            recorded joins one operation.
+    """
+
+    def __init__(self,
+                 on_remove: Optional[Callable[[str, Iterable[int]], None]] = None,
+                 on_restore: Optional[Callable[[str, int, Dict[str, Any]], None]] = None) -> None:
+        self.on_remove = on_remove
+        self.on_restore = on_restore
+        self.next_group = 1
+        self.has_redo = False
+        self.group_depth = 0
+        self.group_used = False
+
+    def setup(self) -> None:
+        """
+        Sets up the journal table and its index, and loads the journal position.
+        """
+        query = QSqlQuery()
+        for sql in setup_sql():
+            if not query.exec(sql):
+                logger.error(f"Error creating journal: {query.lastError().text()}")
+                return
+        self.load_position()
+
+    def load_position(self) -> None:
+        """
+        Reads the next op_group and whether there is anything to redo, e.g. after a rollback or
+        an operation recorded by another connection.
+        """
+        query = QSqlQuery()
+        if query.exec(NEXT_GROUP_SQL) and query.next():
+            self.next_group = max(self.next_group, query.value(0))
+        self.has_redo = self.find_group(UNDONE, newest=False) is not None
+
+    def begin_group(self) -> None:
+        """
+        Starts recording one operation that spans several inserts or tables, such as a unit of
+        work, until the matching end_group().
+        """
+        self.group_depth += 1
+
+    def end_group(self) -> None:
+        self.group_depth = max(self.group_depth - 1, 0)
+        if self.group_depth == 0 and self.group_used:
+            self.next_group += 1
+            self.group_used = False
+
+    def record_insert(self, table: str, row_id: int, values: Sequence[Any]) -> None:
+        """
+        Records a row inserted by a DataManager insert method.
+
+        Args:
+            table (str): The table.
+            row_id (int): The id of the new row.
+            values (Sequence[Any]): The inserted values, in the order of TableSpec.columns.
+        """
+        payload = dict(zip(TABLES[table].columns, values))
+        self.record('insert', table, [(row_id, payload)])
+
+    def record_delete(self, table: str, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Records rows deleted together as one operation.
+
+        Args:
+            table (str): The table.
+            rows (List[Dict[str, Any]]): The deleted rows, with their id, keyed by column.
+
+        Returns:
+            bool: True if every row was recorded.
+        """
+        return self.record('delete', table, [(row['id'], row) for row in rows])
+
+    def record(self, action: str, table: str, rows: List[Tuple[int, Dict[str, Any]]]) -> bool:
+        if not rows:
+            return True
+        if not self.group_used:
+            self.load_position()
+        query = QSqlQuery()
+        if self.has_redo:
+            if not query.exec(DROP_REDO_SQL):
+                logger.error(f"Error dropping redo history: {query.lastError().text()}")
+            self.has_redo = False
+        created_at = datetime.datetime.now().isoformat(timespec='seconds')
+        recorded = True
+        query.prepare(record_sql())
+        for row_id, payload in rows:
+            for value in entry_values(self.next_group, action, table, row_id, payload, created_at):
+                query.addBindValue(value)
+            if not query.exec():
+                logger.error(f"Error recording {action} on {table}: {query.lastError().text()}")
+                recorded = False
+        if self.group_depth:
+            self.group_used = True
+        else:
+            self.next_group += 1
+        return recorded
+
+    def find_group(self, state: str, newest: bool) -> Optional[int]:
+        query = QSqlQuery()
+        query.prepare(f"SELECT op_group FROM {JOURNAL_TABLE} WHERE state = ? "
+                      f"ORDER BY op_group {'DESC' if newest else 'ASC'} LIMIT 1")
+        query.addBindValue(state)
+        if query.exec() and query.next():
+            return query.value(0)
+        return None
+
+    def undo(self) -> Optional[Dict[str, List[int]]]:
+        """
+        Reverts the latest operation that is not undone yet.
+
+        Returns:
+            Optional[Dict[str, List[int]]]: The row ids it touched per table, None if there was
+            nothing to undo or the undo failed.
+        """
+        return self.replay(self.find_group(DONE, newest=True), undo=True)
+
+    def redo(self) -> Optional[Dict[str, List[int]]]:
+        """
+        Repeats the earliest undone operation.
+
+        Returns:
+            Optional[Dict[str, List[int]]]: The row ids it touched per table, None if there was
+            nothing to redo or the redo failed.
+        """
+        return self.replay(self.find_group(UNDONE, newest=False), undo=False)
+
+    def replay(self, group: Optional[int], undo: bool) -> Optional[Dict[str, List[int]]]:
+        if group is None:
+            return None
+        query = QSqlQuery()
+        query.setForwardOnly(True)
+        query.prepare(f"SELECT action, table_name, row_id, payload FROM {JOURNAL_TABLE} "
+                      f"WHERE op_group = ? ORDER BY id")
+        query.addBindValue(group)
+        if not query.exec():
+            logger.error(f"Error reading journal: {query.lastError().text()}")
+            return None
+        entries = []
+        while query.next():
+            entries.append((query.value(0), query.value(1), query.value(2),
+                            json.loads(query.value(3))))
+        if not entries:
+            return None
+
+        database = QSqlDatabase.database()
+        database.transaction()
+        try:
+            for action, table, row_id, payload in entries:
+                # undoing an insert and redoing a delete both remove the row
+                if (action == 'insert') == undo:
+                    self.delete_row(table, row_id)
+                else:
+                    self.restore_row(table, row_id, payload)
+            self.set_state(group, UNDONE if undo else DONE)
+            if not database.commit():
+                raise RuntimeError(database.lastError().text())
+        except Exception as e:
+            database.rollback()
+            logger.error(f"Error {'undoing' if undo else 'redoing'} operation {group}: {e}",
+                         exc_info=True)
+            return None
+        self.has_redo = undo or self.find_group(UNDONE, newest=False) is not None
+        for action, table, row_id, payload in entries:
+            if (action == 'insert') == undo:
+                if self.on_remove is not None:
+                    self.on_remove(table, [row_id])
+            elif self.on_restore is not None:
+                self.on_restore(table, row_id, payload)
+        touched: Dict[str, List[int]] = {}
+        for _, table, row_id, _ in entries:
+            touched.setdefault(table, []).append(row_id)
+        return touched
+
+    @staticmethod
+    def delete_row(table: str, row_id: int) -> None:
+        query = QSqlQuery()
+        query.prepare(f"UPDATE {TABLES[table].name} SET {TOMBSTONE_COLUMN} = ? WHERE id = ?")
+        query.addBindValue(datetime.datetime.now().isoformat(timespec='seconds'))
+        query.addBindValue(row_id)
+        if not query.exec():
+            raise RuntimeError(query.lastError().text())
+
+    @staticmethod
+    def restore_row(table: str, row_id: int, payload: Dict[str, Any]) -> None:
+        """
+        Clears the row's tombstone, or inserts it again from the payload once it was purged.
+        """
+        query = QSqlQuery()
+        query.prepare(f"UPDATE {TABLES[table].name} SET {TOMBSTONE_COLUMN} = NULL WHERE id = ?")
+        query.addBindValue(row_id)
+        if not query.exec():
+            raise RuntimeError(query.lastError().text())
+        if query.numRowsAffected() > 0:
+            return
+        columns = [column for column in TABLES[table].columns if column in payload]
+        query.prepare(f"INSERT INTO {TABLES[table].name}(id, {', '.join(columns)}) "
+                      f"VALUES (?{', ?' * len(columns)})")
+        query.addBindValue(row_id)
+        for column in columns:
+            query.addBindValue(payload[column])
+        if not query.exec():
+            raise RuntimeError(query.lastError().text())
+
+    @staticmethod
+    def set_state(group: int, state: str) -> None:
+        query = QSqlQuery()
+        query.prepare(f"UPDATE {JOURNAL_TABLE} SET state = ? WHERE op_group = ?")
+        query.addBindValue(state)
+        query.addBindValue(group)
+        if not query.exec():
+            raise RuntimeError(query.lastError().text())
+
+    def prune(self, keep_groups: int) -> None:
+        """
+        Deletes all but the latest keep_groups operations and the discarded redo history.
+        """
+        query = QSqlQuery()
+        query.prepare(f"DELETE FROM {JOURNAL_TABLE} WHERE op_group <= ? OR state = ?")
+        query.addBindValue(self.next_group - 1 - keep_groups)
+        query.addBindValue(DROPPED)
+        if not query.exec():
+            logger.error(f"Error pruning journal: {query.lastError().text()}")
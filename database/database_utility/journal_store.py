@@ -0,0 +1,83 @@
+import datetime
+import json
+from typing import Any, Dict, List, Sequence, Tuple
+
+# journal_store.py
+
+JOURNAL_TABLE = 'operation_journal'
+
+# entry states: 'done' entries can be undone, 'undone' ones redone; 'dropped' ones are the redo
+# history discarded by a new operation, kept until pruned
+DONE = 'done'
+UNDONE = 'undone'
+DROPPED = 'dropped'
+
+# a new operation ends the redo history
+DROP_REDO_SQL = f"UPDATE {JOURNAL_TABLE} SET state = '{DROPPED}' WHERE state = '{UNDONE}'"
+
+NEXT_GROUP_SQL = f"SELECT COALESCE(MAX(op_group), 0) + 1 FROM {JOURNAL_TABLE}"
+
+
+def setup_sql() -> List[str]:
+    """
+    Builds the journal table, the (state, op_group) index that finds the next operation to undo
+    or redo, and the op_group index that finds the next free operation.
+    """
+    return [
+        f"""CREATE TABLE IF NOT EXISTS {JOURNAL_TABLE} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                op_group INTEGER NOT NULL,
+                action TEXT NOT NULL,
+                table_name TEXT NOT NULL,
+                row_id INTEGER NOT NULL,
+                payload TEXT NOT NULL,
+                state TEXT NOT NULL DEFAULT '{DONE}',
+                created_at TEXT NOT NULL
+                )""",
+        f"CREATE INDEX IF NOT EXISTS idx_{JOURNAL_TABLE}_state ON {JOURNAL_TABLE}(state, op_group)",
+        f"CREATE INDEX IF NOT EXISTS idx_{JOURNAL_TABLE}_group ON {JOURNAL_TABLE}(op_group)",
+    ]
+
+
+def record_sql() -> str:
+    return (f"INSERT INTO {JOURNAL_TABLE}(op_group, action, table_name, row_id, payload, "
+            f"created_at) VALUES (?, ?, ?, ?, ?, ?)")
+
+
+def entry_values(group: int, action: str, table: str, row_id: int, payload: Dict[str, Any],
+                 created_at: str) -> Tuple[Any, ...]:
+    """
+    The values of record_sql() for one row; the payload keeps every column but the id.
+    """
+    return (group, action, table, row_id,
+            json.dumps({key: value for key, value in payload.items() if key != 'id'}),
+            created_at)
+
+
+def record_inserts(connection: Any, columns: Dict[str, Sequence[str]],
+                   inserted: Sequence[Tuple[str, int, Sequence[Any]]]) -> int:
+    """
+    Records rows inserted outside OperationJournal, e.g. by a storage backend, as one operation.
+
+    Runs inside the caller's write transaction, after the inserts, so the write lock already
+    keeps every other connection from taking the same op_group.
+
+    Args:
+        connection (Any): A sqlite3 connection, or anything with the same execute() and
+            executemany() whose execute() result has fetchone().
+        columns (Dict[str, Sequence[str]]): The columns of each table, in the order of the
+            inserted values.
+        inserted (Sequence[Tuple[str, int, Sequence[Any]]]): (table, row id, values) per row.
+
+    Returns:
+        int: The op_group recorded, 0 if there was nothing to record.
+    """
+    if not inserted:
+        return 0
+    connection.execute(DROP_REDO_SQL)
+    group = connection.execute(NEXT_GROUP_SQL).fetchone()[0]
+    created_at = datetime.datetime.now().isoformat(timespec='seconds')
+    connection.executemany(record_sql(), [
+        entry_values(group, 'insert', table, row_id, dict(zip(columns[table], values)), created_at)
+        for table, row_id, values in inserted])
+    return group
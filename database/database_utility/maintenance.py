@@ -0,0 +1,161 @@
+import datetime
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+import tracker_config as tkc
+from database.database_utility.note_store import compact_notes, repair_bodies
+from database.database_utility.table_registry import TABLES, TOMBSTONE_COLUMN
+from logger_setup import logger
+
+# maintenance.py
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def database_stats(connection: sqlite3.Connection, db_path: str) -> Dict[str, int]:
+    """
+    Reads the size figures of a database.
+
+    Args:
+        connection (sqlite3.Connection): An open connection to the database.
+        db_path (str): The database file.
+
+    Returns:
+        Dict[str, int]: The file size in bytes, the page size, the page count and the number of
+        free pages.
+    """
+    return {
+        'file_size': os.path.getsize(db_path),
+        'page_size': connection.execute("PRAGMA page_size").fetchone()[0],
+        'page_count': connection.execute("PRAGMA page_count").fetchone()[0],
+        'freelist_count': connection.execute("PRAGMA freelist_count").fetchone()[0],
+    }
+
+
+def purge_tombstones(connection: sqlite3.Connection,
+                     cutoff: str,
+                     chunk_size: int = tkc.PURGE_CHUNK_SIZE,
+                     pause: float = 0.01) -> Dict[str, int]:
+    """
+    Physically deletes the rows soft-deleted before the cutoff, chunk_size rows per statement.
+
+    Each chunk is its own short write transaction on the partial tombstone index, with a pause
+    after it, so the GUI's writes never wait for more than one chunk.
+
+    Args:
+        connection (sqlite3.Connection): An autocommit connection to the database.
+        cutoff (str): The ISO timestamp; rows tombstoned earlier are purged.
+        chunk_size (int): The rows deleted per statement.
+        pause (float): Seconds to sleep between chunks.
+
+    Returns:
+        Dict[str, int]: The number of rows purged per table.
+    """
+    purged: Dict[str, int] = {}
+    for table in TABLES:
+        while True:
+            cursor = connection.execute(
+                f"DELETE FROM {table} WHERE id IN (SELECT id FROM {table} "
+                f"WHERE {TOMBSTONE_COLUMN} IS NOT NULL AND {TOMBSTONE_COLUMN} < ? LIMIT ?)",
+                (cutoff, chunk_size))
+            if cursor.rowcount <= 0:
+                break
+            purged[table] = purged.get(table, 0) + cursor.rowcount
+            time.sleep(pause)
+    return purged
+
+
+class DatabaseMaintenance:
+    """
+    Periodic upkeep of the database: purge of old soft-deleted rows, compaction of new notes,
+    integrity check, ANALYZE, PRAGMA optimize and an incremental vacuum, run on a background
+    thread on its own connection.
+
+    The incremental vacuum only runs once the database is in incremental auto-vacuum mode,
+    which DataManager.setup_auto_vacuum switches it to at startup. The full VACUUM that switch
+    needs holds the write lock for the whole rewrite, so it never runs here while the GUI
+    writes.
+
+    Attributes:
+        db_path (str): The database file.
+        busy_timeout (float): Seconds to wait for the GUI connection to release its locks.
+        thread (Optional[threading.Thread]): The running maintenance, if any.
+        last_run (Optional[float]): time.monotonic() of the last finished run.
+    """
+
+    def __init__(self, db_path: str, busy_timeout: float = 5.0) -> None:
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.thread: Optional[threading.Thread] = None
+        self.last_run: Optional[float] = None
+
+    def start(self) -> bool:
+        """
+        Starts the maintenance on a background thread unless it is already running.
+
+        Returns:
+            bool: True if the maintenance was started.
+        """
+        if self.thread is not None and self.thread.is_alive():
+            return False
+        self.thread = threading.Thread(target=self.run, name="bslm-maintenance", daemon=True)
+        self.thread.start()
+        return True
+
+    def run(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        Runs the maintenance on the calling thread and logs the size figures before and after.
+
+        Returns:
+            Optional[Dict[str, Dict[str, int]]]: The 'before' and 'after' database stats, or
+            None if the maintenance failed.
+        """
+        connection = None
+        try:
+            started = time.perf_counter()
+            connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout,
+                                         isolation_level=None)
+            before = database_stats(connection, self.db_path)
+
+            cutoff = (datetime.datetime.now() - datetime.timedelta(days=tkc.PURGE_AFTER_DAYS))
+            purged = purge_tombstones(connection, cutoff.isoformat(timespec='seconds'))
+            if purged:
+                logger.info(f"Purged soft-deleted rows: {purged}")
+            compacted = compact_notes(connection)
+            if compacted:
+                logger.info(f"Compacted notes: {compacted}")
+            repaired = repair_bodies(connection)
+            if repaired:
+                logger.info(f"Stored {repaired} note bodies as blobs")
+
+            integrity = connection.execute("PRAGMA integrity_check").fetchall()
+            integrity_ok = integrity == [('ok',)]
+            if not integrity_ok:
+                logger.error(f"Database integrity check failed: {integrity[:10]}")
+
+            connection.execute("ANALYZE")
+            connection.execute("PRAGMA optimize")
+
+            # the switch to incremental auto-vacuum needs a full VACUUM, which
+            # DataManager.setup_auto_vacuum runs at startup, before anything else writes
+            auto_vacuum = connection.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if auto_vacuum == AUTO_VACUUM_INCREMENTAL:
+                connection.execute("PRAGMA incremental_vacuum").fetchall()
+
+            after = database_stats(connection, self.db_path)
+            self.last_run = time.monotonic()
+            logger.info(
+                f"Database maintenance done in {time.perf_counter() - started:.2f}s, "
+                f"integrity {'ok' if integrity_ok else 'FAILED'}: "
+                f"size {before['file_size']} -> {after['file_size']} bytes, "
+                f"pages {before['page_count']} -> {after['page_count']}, "
+                f"free pages {before['freelist_count']} -> {after['freelist_count']}")
+            return {'before': before, 'after': after}
+        except Exception as e:
+            logger.error(f"Error during database maintenance: {e}", exc_info=True)
+            return None
+        finally:
+            if connection is not None:
+                connection.close()
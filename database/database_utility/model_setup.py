@@ -1,24 +1,181 @@
+from typing import Dict, Optional
 from PyQt6 import QtSql
-from PyQt6.QtWidgets import QAbstractItemView
+from PyQt6.QtCore import QDate, QModelIndex, Qt
+from PyQt6.QtWidgets import QAbstractItemView, QTableView
+import tracker_config as tkc
+from database.database_utility.archive import ArchiveManager
+from database.database_utility.note_store import LENGTH_COLUMN, NOTE_COLUMNS
+from database.database_utility.table_registry import TABLES, TOMBSTONE_COLUMN
 from logger_setup import logger
 
 # model_setup.py
 
+# bookkeeping columns never shown in the table views
+HIDDEN_COLUMNS = (TOMBSTONE_COLUMN, LENGTH_COLUMN)
 
-def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtSql.QSqlTableModel:
+
+class DateSortedTableModel(QtSql.QSqlTableModel):
+    """
+    A QSqlTableModel whose header sorting is pushed down to SQLite.
+
+    Sorting on the date or time column orders by (date, time, id), which matches the date index
+    created by DataManager.setup_date_indexes, so SQLite walks the index instead of sorting.
+    The model still fetches rows in batches as the view scrolls, so a re-sort only reads the
+    rows needed for the visible window.
+
+    The rows shown are limited to a date range, by default the last DEFAULT_DATE_RANGE_DAYS
+    days, so opening a data page only reads recent rows through the same index. Soft-deleted
+    rows are always left out.
+
+    A note column only holds the preview of a compacted note, so it is read-only; the full
+    text is read with DataManager.read_note.
+
+    Given the ArchiveManager of its connection (DataManager.archives), a date range reaching an
+    archived year is read from the <table>_all view instead, with the archived rows. The model
+    is read-only while it does; the table name stays the same for everything else.
+
+    Attributes:
+        archives (Optional[ArchiveManager]): The archive manager, None to read the table only.
+        since (Optional[str]): The first 'yyyy-MM-dd' date shown, None for no lower bound.
+        until (Optional[str]): The last 'yyyy-MM-dd' date shown, None for no upper bound.
+        source (str): The table or view the last select() read.
+    """
+
+    def __init__(self, table_name: str, archives: Optional[ArchiveManager] = None) -> None:
+        super().__init__()
+        self.spec = TABLES.get(table_name)
+        self.sort_column = -1
+        self.sort_order = Qt.SortOrder.AscendingOrder
+        self.filters: Dict[str, str] = {}
+        self.released = False
+        self.archives = archives
+        self.since: Optional[str] = None
+        self.until: Optional[str] = None
+        self.source = table_name
+        self.setTable(table_name)
+        self.read_only_columns = {self.fieldIndex(column)
+                                  for column in (NOTE_COLUMNS.get(table_name), LENGTH_COLUMN)
+                                  if column is not None and self.fieldIndex(column) >= 0}
+        if self.spec is not None:
+            self.set_filter_clause('not_deleted', f'"{TOMBSTONE_COLUMN}" IS NULL')
+        today = QDate.currentDate()
+        self.set_date_range(today.addDays(-tkc.DEFAULT_DATE_RANGE_DAYS), today, select=False)
+
+    def set_filter_clause(self, name: str, clause: Optional[str]) -> None:
+        """
+        Sets or removes (clause None) one named part of the WHERE clause. The parts are
+        combined with AND and take effect on the next select().
+        """
+        if clause is None:
+            self.filters.pop(name, None)
+        else:
+            self.filters[name] = clause
+        self.setFilter(" AND ".join(f"({part})" for part in self.filters.values()))
+
+    def set_date_range(self, since: QDate, until: QDate, select: bool = True) -> None:
+        """
+        Limits the model to rows dated from since to until, inclusive.
+
+        QSqlTableModel filters are plain SQL text and cannot take bound values. The bounds are
+        therefore only ever formatted from valid QDates, never from user-typed text.
+
+        Args:
+            since (QDate): The first date shown. Invalid for no lower bound.
+            until (QDate): The last date shown. Invalid for no upper bound.
+            select (bool): Whether to re-select the model right away.
+        """
+        if self.spec is None:
+            return
+        date_column = self.spec.date_column
+        self.since = since.toString('yyyy-MM-dd') if since.isValid() else None
+        self.until = until.toString('yyyy-MM-dd') if until.isValid() else None
+        bounds = []
+        if self.since is not None:
+            bounds.append(f"\"{date_column}\" >= '{self.since}'")
+        if self.until is not None:
+            bounds.append(f"\"{date_column}\" <= '{self.until}'")
+        self.set_filter_clause('date_range', " AND ".join(bounds) or None)
+        if select and not self.released:
+            self.select()
+
+    def release(self) -> None:
+        """
+        Drops the fetched rows while the model is not shown. The table, filter and sort are kept,
+        so the next select() reads the same rows again. Until then, a new date range does not
+        fetch the rows.
+        """
+        self.released = True
+        table_name = self.tableName()
+        self.clear()
+        self.setTable(table_name)
+        self.setFilter(" AND ".join(f"({part})" for part in self.filters.values()))
+        if self.sort_column >= 0:
+            super().setSort(self.sort_column, self.sort_order)
+
+    def select(self) -> bool:
+        self.released = False
+        self.source = self.tableName()
+        if self.archives is not None and self.spec is not None:
+            self.source = self.archives.source(self.tableName(), self.since, self.until)
+        return super().select()
+
+    def reads_archives(self) -> bool:
+        return self.source != self.tableName()
+
+    def selectStatement(self) -> str:
+        if not self.reads_archives():
+            return super().selectStatement()
+        statement = self.database().driver().sqlStatement(
+            QtSql.QSqlDriver.StatementType.SelectStatement, self.source, self.record(), False)
+        if self.filter():
+            statement += f" WHERE {self.filter()}"
+        order = self.orderByClause()
+        return f"{statement} {order}" if order else statement
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.column() in self.read_only_columns or self.reads_archives():
+            flags &= ~Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setSort(self, column: int, order: Qt.SortOrder) -> None:
+        self.sort_column = column
+        self.sort_order = order
+        super().setSort(column, order)
+
+    def orderByClause(self) -> str:
+        if self.spec is None or self.sort_column < 0:
+            return super().orderByClause()
+        date_columns = [self.spec.date_column]
+        if self.spec.time_column is not None:
+            date_columns.append(self.spec.time_column)
+        field = self.record().fieldName(self.sort_column)
+        direction = "DESC" if self.sort_order == Qt.SortOrder.DescendingOrder else "ASC"
+        if field in date_columns:
+            return "ORDER BY " + ", ".join(f'"{column}" {direction}'
+                                           for column in date_columns + ['id'])
+        if self.reads_archives():
+            # Qt qualifies the column with the table name, which the view does not have
+            return f'ORDER BY "{field}" {direction}'
+        return super().orderByClause()
+
+
+def create_and_set_model(table_name: str, view_widget: QAbstractItemView,
+                         archives: Optional[ArchiveManager] = None) -> QtSql.QSqlTableModel:
     """
-    Creates and sets up a QSqlTableModel for the specified table name and view widget.
+    Creates and sets up a DateSortedTableModel for the specified table name and view widget.
 
     Args:
         table_name (str): The name of the table to create the model for.
         view_widget (QAbstractItemView): The view widget to set the model on.
+        archives (Optional[ArchiveManager]): The archive manager of the default connection,
+            so date ranges reaching archived years show the archived rows.
 
     Returns:
         QSqlTableModel: The created QSqlTableModel.
 
     """
-    model = QtSql.QSqlTableModel()
-    model.setTable(table_name)
+    model = DateSortedTableModel(table_name, archives)
     model.setEditStrategy(QtSql.QSqlTableModel.EditStrategy.OnFieldChange)
     if not model.select():
         error_message = f"Error selecting data from table: {table_name}, {model.lastError().text()}"
@@ -26,4 +183,15 @@ def create_and_set_model(table_name: str, view_widget: QAbstractItemView) -> QtS
         raise RuntimeError(error_message)
 
     view_widget.setModel(model)
+    if isinstance(view_widget, QTableView):
+        hide_internal_columns(view_widget, model)
     return model
+
+
+def hide_internal_columns(view: QTableView, model: QtSql.QSqlTableModel) -> None:
+    """
+    Hides the HIDDEN_COLUMNS the model has from the view.
+    """
+    for column in HIDDEN_COLUMNS:
+        if model.fieldIndex(column) >= 0:
+            view.setColumnHidden(model.fieldIndex(column), True)
@@ -0,0 +1,191 @@
+import ast
+import re
+import sqlite3
+import zlib
+from typing import Any, Dict, List, Optional
+import tracker_config as tkc
+
+# note_store.py
+
+# note tables -> their free-text column
+NOTE_COLUMNS: Dict[str, str] = {
+    'lily_notes_table': 'lily_notes',
+    'lily_walk_notes_table': 'lily_walk_note',
+}
+
+NOTE_BODY_TABLE = 'note_bodies'
+# the full length of the note; NULL until the note is compacted
+LENGTH_COLUMN = 'note_length'
+
+
+def make_preview(text: str, limit: int = tkc.NOTE_PREVIEW_CHARS) -> str:
+    """
+    Returns the first limit characters of a note on one line, with an ellipsis if cut.
+    """
+    line = re.sub(r"\s+", " ", text).strip()
+    return line if len(line) <= limit else line[:limit - 1].rstrip() + "…"
+
+
+def compress(text: str) -> bytes:
+    return zlib.compress(text.encode('utf-8'), tkc.NOTE_COMPRESSION_LEVEL)
+
+
+def body_bytes(body: Any) -> bytes:
+    """
+    Returns a stored body as bytes. The QtSql path used to bind bodies as Python bytes, which
+    PyQt6 stores as the text of their repr, "b'x\\x9c...'"; those are parsed back.
+    """
+    if isinstance(body, str):
+        value = ast.literal_eval(body) if body[:2] in ("b'", 'b"') else None
+        if not isinstance(value, bytes):
+            raise ValueError("A note body is text, not a compressed body")
+        return value
+    return bytes(body)
+
+
+def decompress(body: Any) -> str:
+    return zlib.decompress(body_bytes(body)).decode('utf-8')
+
+
+def setup_sql(table: str) -> List[str]:
+    """
+    Builds the body table and the triggers that keep a note table's bodies consistent.
+
+    Every writer inserts the full text into the note column. Compacting a note later moves the
+    text into NOTE_BODY_TABLE, zlib-compressed, and leaves a preview and LENGTH_COLUMN behind.
+    A note is compacted exactly when its body row exists. Deleting a row, e.g. by the purge,
+    deletes its body; changing the text other than by compacting (which also sets
+    LENGTH_COLUMN) drops the stale body, so the edited text is the note again.
+    """
+    column = NOTE_COLUMNS[table]
+    return [
+        f"""CREATE TABLE IF NOT EXISTS {NOTE_BODY_TABLE} (
+                table_name TEXT NOT NULL,
+                row_id INTEGER NOT NULL,
+                body BLOB NOT NULL,
+                PRIMARY KEY (table_name, row_id)
+                ) WITHOUT ROWID""",
+        f"""CREATE TRIGGER IF NOT EXISTS {table}_body_ad AFTER DELETE ON {table} BEGIN
+                DELETE FROM {NOTE_BODY_TABLE} WHERE table_name = '{table}' AND row_id = old.id;
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {table}_body_au AFTER UPDATE OF {column} ON {table}
+            WHEN new.{LENGTH_COLUMN} IS old.{LENGTH_COLUMN} BEGIN
+                DELETE FROM {NOTE_BODY_TABLE} WHERE table_name = '{table}' AND row_id = old.id;
+                UPDATE {table} SET {LENGTH_COLUMN} = NULL WHERE id = old.id;
+            END""",
+    ]
+
+
+def compact_sql(table: str) -> List[str]:
+    """
+    The statements compacting one note: store the body (id, compressed text), and replace
+    the text with its preview and set the length (preview, length, id).
+    """
+    return [f"INSERT OR REPLACE INTO {NOTE_BODY_TABLE}(table_name, row_id, body) "
+            f"VALUES ('{table}', ?, ?)",
+            f"UPDATE {table} SET {NOTE_COLUMNS[table]} = ?, {LENGTH_COLUMN} = ? WHERE id = ?"]
+
+
+def body_sql(table: str) -> str:
+    """
+    Reads a note's stored body and its column text by id; the body is NULL if not compacted.
+    """
+    return (f"SELECT b.body, t.{NOTE_COLUMNS[table]} FROM {table} t "
+            f"LEFT JOIN {NOTE_BODY_TABLE} b ON b.table_name = '{table}' AND b.row_id = t.id "
+            f"WHERE t.id = ?")
+
+
+def compact_note_sqlite(connection: sqlite3.Connection, table: str, row_id: int,
+                        text: Optional[str]) -> bool:
+    """
+    Compacts one note on a sqlite3 connection; short notes only get their length set.
+
+    Returns:
+        bool: True if a body was stored.
+    """
+    text = text or ''
+    insert_body, update_row = compact_sql(table)
+    if len(text) <= tkc.NOTE_PREVIEW_CHARS:
+        connection.execute(f"UPDATE {table} SET {LENGTH_COLUMN} = ? WHERE id = ?",
+                           (len(text), row_id))
+        return False
+    connection.execute(insert_body, (row_id, compress(text)))
+    connection.execute(update_row, (make_preview(text), len(text), row_id))
+    return True
+
+
+def compact_notes(connection: sqlite3.Connection,
+                  chunk_size: int = tkc.PURGE_CHUNK_SIZE) -> Dict[str, int]:
+    """
+    Compacts the notes written without it (by a restore or an older version), chunk_size rows
+    per transaction.
+
+    Args:
+        connection (sqlite3.Connection): An autocommit connection to the database.
+        chunk_size (int): The rows compacted per transaction.
+
+    Returns:
+        Dict[str, int]: The number of bodies stored per table.
+    """
+    compacted: Dict[str, int] = {}
+    for table, column in NOTE_COLUMNS.items():
+        while True:
+            rows = connection.execute(f"SELECT id, {column} FROM {table} "
+                                      f"WHERE {LENGTH_COLUMN} IS NULL LIMIT ?",
+                                      (chunk_size,)).fetchall()
+            if not rows:
+                break
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                for row_id, text in rows:
+                    if compact_note_sqlite(connection, table, row_id, text):
+                        compacted[table] = compacted.get(table, 0) + 1
+    return compacted
+
+
+def repair_bodies(connection: sqlite3.Connection) -> int:
+    """
+    Rewrites the bodies stored as the text of their repr (see body_bytes) as blobs, in one
+    transaction.
+
+    Args:
+        connection (sqlite3.Connection): An autocommit connection to the database.
+
+    Returns:
+        int: The number of bodies rewritten.
+    """
+    rows = connection.execute(f"SELECT table_name, row_id, body FROM {NOTE_BODY_TABLE} "
+                              f"WHERE typeof(body) = 'text'").fetchall()
+    if not rows:
+        return 0
+    with connection:
+        connection.execute("BEGIN IMMEDIATE")
+        connection.executemany(f"UPDATE {NOTE_BODY_TABLE} SET body = ? "
+                               f"WHERE table_name = ? AND row_id = ?",
+                               [(body_bytes(body), table, row_id) for table, row_id, body in rows])
+    return len(rows)
+
+
+def read_note_sqlite(connection: sqlite3.Connection, table: str, row_id: int) -> Optional[str]:
+    """
+    Returns the full text of a note, None if the row does not exist.
+    """
+    row = connection.execute(body_sql(table), (row_id,)).fetchone()
+    if row is None:
+        return None
+    body, text = row
+    return decompress(body) if body is not None else text
+
+
+def register_functions(connection: sqlite3.Connection) -> None:
+    """
+    Adds note_text(table, id, text) to a sqlite3 connection: a note's full text in SQL, e.g.
+    to copy notes into the archives uncompressed.
+    """
+    def note_text(table: str, row_id: int, text: Optional[str]) -> Optional[str]:
+        body = connection.execute(f"SELECT body FROM {NOTE_BODY_TABLE} "
+                                  f"WHERE table_name = ? AND row_id = ?",
+                                  (table, row_id)).fetchone()
+        return decompress(body[0]) if body is not None else text
+
+    connection.create_function('note_text', 3, note_text)
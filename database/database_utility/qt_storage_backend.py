@@ -0,0 +1,278 @@
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+from PyQt6.QtCore import QByteArray
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+import tracker_config as tkc
+from database.database_utility.archive import ArchiveManager
+from database.database_utility.storage_backend import (
+    StorageBackend, aggregate_sql, checked_columns, range_sql, tombstone_rows, tombstone_sql,
+    write_rows)
+from database.database_utility.table_registry import TABLES
+from logger_setup import logger
+
+# qt_storage_backend.py
+
+
+class QueryCursor:
+    """
+    The part of a sqlite3 connection and cursor that write_rows() and ArchiveManager use, on a
+    QSqlDatabase, so both backends share that code. A failed statement raises RuntimeError.
+
+    Attributes:
+        database (QSqlDatabase): The connection the statements run on.
+        query (Optional[QSqlQuery]): The last statement run.
+        lastrowid (Any): The id of the row the last statement inserted.
+    """
+
+    def __init__(self, database: QSqlDatabase) -> None:
+        self.database = database
+        self.query: Optional[QSqlQuery] = None
+        self.lastrowid: Any = None
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> "QueryCursor":
+        query = QSqlQuery(self.database)
+        query.setForwardOnly(True)
+        query.prepare(sql)
+        for value in params:
+            # bound as bytes, PyQt6 would store the text of their repr instead of a blob
+            query.addBindValue(QByteArray(value) if isinstance(value, bytes) else value)
+        if not query.exec():
+            raise RuntimeError(f"{sql} - {query.lastError().text()}")
+        self.query = query
+        self.lastrowid = query.lastInsertId()
+        return self
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> "QueryCursor":
+        for row in rows:
+            self.execute(sql, row)
+        return self
+
+    def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        if self.query is None or not self.query.next():
+            return None
+        return tuple(self.query.value(index) for index in range(self.query.record().count()))
+
+    def fetchall(self) -> List[Tuple[Any, ...]]:
+        return list(self)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+
+class QtSqlBackend(StorageBackend):
+    """
+    StorageBackend on the QtSql QSQLITE driver.
+
+    A QSqlDatabase connection may only be used by the thread that opened it. Given a
+    connection name, the backend uses that connection (the GUI passes DataManager's); without
+    one, every thread gets its own named connection to db_path. Each connection attaches the
+    archives its reads need.
+
+    Attributes:
+        db_path (Optional[str]): The database file for per-thread connections.
+        connection_name (Optional[str]): The existing connection to use instead.
+        archive_managers (Dict[str, ArchiveManager]): The archive manager of each connection.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, connection_name: Optional[str] = None) -> None:
+        if db_path is None and connection_name is None:
+            raise ValueError("QtSqlBackend needs a database path or a connection name")
+        self.db_path = db_path
+        self.connection_name = connection_name
+        self.opened: List[str] = []
+        self.archive_managers: Dict[str, ArchiveManager] = {}
+        self.lock = threading.Lock()
+
+    def database(self) -> QSqlDatabase:
+        """
+        Returns the calling thread's connection, opening it on first use.
+        """
+        if self.connection_name is not None:
+            return QSqlDatabase.database(self.connection_name)
+        name = f"bslm_backend_{id(self)}_{threading.get_ident()}"
+        if QSqlDatabase.contains(name):
+            return QSqlDatabase.database(name)
+        database = QSqlDatabase.addDatabase('QSQLITE', name)
+        database.setDatabaseName(self.db_path)
+        database.setConnectOptions(f"QSQLITE_BUSY_TIMEOUT={tkc.DB_BUSY_TIMEOUT_MS}")
+        if not database.open():
+            logger.error(f"Error: Unable to open database {self.db_path} - "
+                         f"{database.lastError().text()}")
+        with self.lock:
+            self.opened.append(name)
+        return database
+
+    def archives(self) -> ArchiveManager:
+        """
+        Returns the archive manager of the calling thread's connection.
+        """
+        database = self.database()
+        name = database.connectionName()
+        with self.lock:
+            if name not in self.archive_managers:
+                self.archive_managers[name] = ArchiveManager(QueryCursor(database))
+            return self.archive_managers[name]
+
+    def run(self, sql: str, params: Sequence[Any]) -> Optional[QSqlQuery]:
+        query = QSqlQuery(self.database())
+        query.setForwardOnly(True)
+        query.prepare(sql)
+        for value in params:
+            query.addBindValue(value)
+        if not query.exec():
+            logger.error(f"Error running query: {sql} - {query.lastError().text()}")
+            return None
+        return query
+
+    def run_in_transaction(self, statements: Iterable[Tuple[str, Iterable[Sequence[Any]]]]) -> List[int]:
+        """
+        Runs each prepared statement for every one of its rows, all inside a single transaction.
+
+        Returns:
+            List[int]: The rows affected per statement, empty if the transaction was rolled back.
+        """
+        database = self.database()
+        if not database.transaction():
+            logger.error(f"Error starting transaction - {database.lastError().text()}")
+            return []
+        counts: List[int] = []
+        for sql, rows in statements:
+            query = QSqlQuery(database)
+            query.prepare(sql)
+            count = 0
+            for row in rows:
+                for value in row:
+                    query.addBindValue(value)
+                if not query.exec():
+                    logger.error(f"Error running query: {sql} - {query.lastError().text()}")
+                    database.rollback()
+                    return []
+                count += query.numRowsAffected()
+            counts.append(count)
+        if not database.commit():
+            logger.error(f"Error committing transaction - {database.lastError().text()}")
+            database.rollback()
+            return []
+        return counts
+
+    def write_in_transaction(self,
+                             rows_by_table: Mapping[str, Iterable[Sequence[Any]]]
+                             ) -> Optional[List[Tuple[str, int]]]:
+        """
+        Runs write_rows() in a single transaction.
+
+        Returns:
+            Optional[List[Tuple[str, int]]]: (table, id) of every new row, None if the
+            transaction was rolled back.
+        """
+        database = self.database()
+        if not database.transaction():
+            logger.error(f"Error starting transaction - {database.lastError().text()}")
+            return None
+        try:
+            inserted = write_rows(QueryCursor(database), rows_by_table)
+            if not database.commit():
+                raise RuntimeError(database.lastError().text())
+            return inserted
+        except RuntimeError as e:
+            logger.error(f"Error inserting rows: {', '.join(rows_by_table)} - {e}", exc_info=True)
+            database.rollback()
+            return None
+
+    def insert(self, table: str, values: Sequence[Any]) -> Optional[int]:
+        inserted = self.write_in_transaction({table: [values]})
+        return inserted[0][1] if inserted else None
+
+    def insert_many(self, table: str, rows: Iterable[Sequence[Any]]) -> int:
+        return self.insert_batch({table: rows}).get(table, 0)
+
+    def insert_batch(self, rows_by_table: Mapping[str, Iterable[Sequence[Any]]]) -> Dict[str, int]:
+        inserted = self.write_in_transaction(rows_by_table)
+        if inserted is None:
+            return {}
+        counts = dict.fromkeys(rows_by_table, 0)
+        for table, _ in inserted:
+            counts[table] += 1
+        return counts
+
+    def delete(self, table: str, row_ids: Iterable[int]) -> int:
+        spec = TABLES[table]
+        counts = self.run_in_transaction([(tombstone_sql(spec), tombstone_rows(row_ids))])
+        return counts[0] if counts else 0
+
+    def query_range(self,
+                    table: str,
+                    since: Optional[str] = None,
+                    until: Optional[str] = None,
+                    columns: Optional[Sequence[str]] = None,
+                    descending: bool = False,
+                    limit: Optional[int] = None) -> List[Tuple[Any, ...]]:
+        spec = TABLES[table]
+        columns = checked_columns(spec, columns)
+        sql, params = range_sql(spec, columns, since, until, descending, limit,
+                                self.archives().source(table, since, until))
+        query = self.run(sql, params)
+        rows: List[Tuple[Any, ...]] = []
+        while query is not None and query.next():
+            rows.append(tuple(query.value(index) for index in range(len(columns))))
+        return rows
+
+    def iter_range(self,
+                   table: str,
+                   since: Optional[str] = None,
+                   until: Optional[str] = None,
+                   columns: Optional[Sequence[str]] = None,
+                   descending: bool = False,
+                   chunk_size: int = tkc.READ_CHUNK_SIZE) -> Iterator[List[Tuple[Any, ...]]]:
+        spec = TABLES[table]
+        columns = checked_columns(spec, columns)
+        sql, params = range_sql(spec, columns, since, until, descending, None,
+                                self.archives().source(table, since, until))
+        query = self.run(sql, params)
+        if query is None:
+            return
+        indexes = range(len(columns))
+        value = query.value
+        try:
+            rows: List[Tuple[Any, ...]] = []
+            while query.next():
+                rows.append(tuple(value(index) for index in indexes))
+                if len(rows) >= chunk_size:
+                    yield rows
+                    rows = []
+            if rows:
+                yield rows
+        finally:
+            # a cursor left open would keep the read transaction, and its snapshot, alive
+            query.finish()
+
+    def aggregate(self,
+                  table: str,
+                  column: str,
+                  function: str,
+                  since: Optional[str] = None,
+                  until: Optional[str] = None) -> Any:
+        sql, params = aggregate_sql(TABLES[table], column, function, since, until,
+                                    self.archives().source(table, since, until))
+        query = self.run(sql, params)
+        if query is None or not query.next():
+            return None
+        return query.value(0)
+
+    def close(self) -> None:
+        """
+        Closes and removes the per-thread connections. Call it after the threads that used
+        the backend have finished.
+        """
+        with self.lock:
+            names, self.opened = self.opened, []
+            for name in names:
+                self.archive_managers.pop(name, None)
+        for name in names:
+            if QSqlDatabase.contains(name):
+                QSqlDatabase.database(name, False).close()
+                QSqlDatabase.removeDatabase(name)
@@ -0,0 +1,52 @@
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Type
+
+# row_records.py
+
+
+class RowRecord:
+    """
+    The base of the row types made by record_type(): one slot per column, no instance dict,
+    so a streamed row costs its values and little else.
+    """
+    __slots__ = ()
+
+    def __init__(self, *values: Any) -> None:
+        for column, value in zip(self.__slots__, values):
+            setattr(self, column, value)
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, column) for column in self.__slots__)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {column: getattr(self, column) for column in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and other.as_tuple() == self.as_tuple()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{column}={getattr(self, column)!r}" for column in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+@lru_cache(maxsize=None)
+def record_type(table: str, columns: Tuple[str, ...]) -> Type[RowRecord]:
+    """
+    Returns the RowRecord subclass for these columns of a table, made once per column set.
+    The columns must be checked against the table registry first.
+    """
+    name = "".join(part.title() for part in table.split('_')) + "Row"
+    return type(name, (RowRecord,), {'__slots__': columns})
+
+
+def to_records(record: Type[RowRecord], rows: Iterable[Sequence[Any]]) -> List[RowRecord]:
+    return [record(*row) for row in rows]
+
+
+def to_columns(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> Dict[str, List[Any]]:
+    """
+    Turns a chunk of rows into one list per column.
+    """
+    if not rows:
+        return {column: [] for column in columns}
+    return {column: list(values) for column, values in zip(columns, zip(*rows))}
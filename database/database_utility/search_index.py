@@ -0,0 +1,168 @@
+import re
+from typing import Dict, List, Sequence, Tuple
+from database.database_utility.note_store import LENGTH_COLUMN, NOTE_COLUMNS
+from database.database_utility.table_registry import TOMBSTONE_COLUMN
+
+# search_index.py
+
+# Free-text columns indexed for search: source table -> (fts table, text column, date column,
+# time column, label shown in the search results)
+SEARCH_SOURCES: Dict[str, Tuple[str, str, str, str, str]] = {
+    'lily_notes_table': ('lily_notes_fts', 'lily_notes', 'lily_date', 'lily_time', "Lily Notes"),
+    'lily_walk_notes_table': ('lily_walk_notes_fts', 'lily_walk_note', 'lily_date', 'lily_time',
+                              "Lily Walk Notes"),
+    'diet_table': ('diet_fts', 'food_eaten', 'diet_date', 'diet_time', "Diet"),
+}
+
+# Prefix indexes for 2 and 3 character prefixes keep "wal*" style lookups on the index
+# instead of scanning every term in the vocabulary.
+FTS_OPTIONS: str = "prefix='2 3', tokenize='unicode61 remove_diacritics 2'"
+
+
+def stores_text(source_table: str) -> bool:
+    """
+    Whether the source's index keeps its own copy of the text. Note tables only keep a preview
+    once compacted, so their index cannot read the text from the table like the others.
+    """
+    return source_table in NOTE_COLUMNS
+
+
+def create_fts_table_sql(source_table: str) -> str:
+    """
+    Builds the CREATE VIRTUAL TABLE statement for the FTS5 index of a source table:
+    external-content, or holding the text itself for note tables.
+
+    Args:
+        source_table (str): The table holding the free text.
+
+    Returns:
+        str: The SQL statement.
+    """
+    fts_table, text_column, _, _, _ = SEARCH_SOURCES[source_table]
+    content = "" if stores_text(source_table) else f"content='{source_table}', content_rowid='id', "
+    return (f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+            f"{text_column}, {content}{FTS_OPTIONS})")
+
+
+def create_fts_trigger_sql(source_table: str) -> List[str]:
+    """
+    Builds the triggers keeping the FTS5 index of a source table in sync with inserts,
+    deletes and updates of its text column.
+
+    Args:
+        source_table (str): The table holding the free text.
+
+    Returns:
+        List[str]: One CREATE TRIGGER statement per event.
+    """
+    fts_table, col, _, _, _ = SEARCH_SOURCES[source_table]
+    insert_new = f"INSERT INTO {fts_table}(rowid, {col}) VALUES (new.id, new.{col});"
+    if stores_text(source_table):
+        # writers insert the full text; compacting it to a preview sets the length and
+        # leaves the index alone
+        delete_old = f"DELETE FROM {fts_table} WHERE rowid = old.id;"
+        on_update = (f"AFTER UPDATE OF {col} ON {source_table} "
+                     f"WHEN new.{LENGTH_COLUMN} IS old.{LENGTH_COLUMN}")
+    else:
+        delete_old = (f"INSERT INTO {fts_table}({fts_table}, rowid, {col}) "
+                      f"VALUES ('delete', old.id, old.{col});")
+        on_update = f"AFTER UPDATE OF {col} ON {source_table}"
+    return [
+        f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source_table} BEGIN
+                {insert_new}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source_table} BEGIN
+                {delete_old}
+            END""",
+        f"""CREATE TRIGGER IF NOT EXISTS {fts_table}_au {on_update} BEGIN
+                {delete_old}
+                {insert_new}
+            END""",
+    ]
+
+
+def rebuild_fts_sql(source_table: str) -> str:
+    """
+    Builds the statement that repopulates an FTS5 index from its content table. An index
+    holding its own text is filled from the table once, before any note is compacted.
+
+    Args:
+        source_table (str): The table holding the free text.
+
+    Returns:
+        str: The SQL statement.
+    """
+    fts_table, col, _, _, _ = SEARCH_SOURCES[source_table]
+    if stores_text(source_table):
+        return f"INSERT INTO {fts_table}(rowid, {col}) SELECT id, {col} FROM {source_table}"
+    return f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')"
+
+
+def create_archive_fts_sql(schema: str, source_table: str) -> str:
+    """
+    Builds the FTS5 index of a source table in an archive. Archived rows hold their full text
+    and are never changed, so the index keeps its own copy and needs no triggers.
+
+    Args:
+        schema (str): The attached archive.
+        source_table (str): The table holding the free text.
+
+    Returns:
+        str: The SQL statement.
+    """
+    fts_table, col, _, _, _ = SEARCH_SOURCES[source_table]
+    return (f"CREATE VIRTUAL TABLE IF NOT EXISTS {schema}.{fts_table} "
+            f"USING fts5({col}, {FTS_OPTIONS})")
+
+
+def fill_archive_fts_sql(schema: str, source_table: str) -> str:
+    """
+    Builds the statement indexing the archived rows of a source table that are not indexed yet.
+    """
+    fts_table, col, _, _, _ = SEARCH_SOURCES[source_table]
+    return (f"INSERT INTO {schema}.{fts_table}(rowid, {col}) "
+            f"SELECT id, {col} FROM {schema}.{source_table} "
+            f"WHERE id NOT IN (SELECT rowid FROM {schema}.{fts_table})")
+
+
+def build_match_expression(text: str) -> str:
+    """
+    Turns free text typed into the search box into an FTS5 MATCH expression.
+
+    Every word is quoted, so FTS5 operators typed by the user are treated as plain text, and
+    becomes a prefix query. Words are combined with an implicit AND.
+
+    Args:
+        text (str): The text typed by the user.
+
+    Returns:
+        str: The MATCH expression, or an empty string if the text contains no words.
+    """
+    terms = re.findall(r"\w+", text)
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def build_search_sql(archive_schemas: Sequence[str] = ()) -> str:
+    """
+    Builds one ranked query across every indexed source, in the main database and in the
+    given attached archives.
+
+    The MATCH expression is bound once per source and database, followed by the result limit.
+
+    Args:
+        archive_schemas (Sequence[str]): The attached archives whose indexes are searched too.
+
+    Returns:
+        str: The SQL statement returning (source, id, date, time, snippet, score) rows.
+    """
+    selects = []
+    for schema in ('main', *archive_schemas):
+        for source_table, (fts_table, _, date_col, time_col, _) in SEARCH_SOURCES.items():
+            selects.append(
+                f"""SELECT '{source_table}' AS source, t.id, t.{date_col}, t.{time_col},
+                           snippet(f.{fts_table}, 0, '[', ']', '...', 10),
+                           bm25(f.{fts_table}) AS score
+                    FROM {schema}.{fts_table} f
+                    JOIN {schema}.{source_table} t ON t.id = f.rowid
+                    WHERE f.{fts_table} MATCH ? AND t.{TOMBSTONE_COLUMN} IS NULL""")
+    return "\nUNION ALL\n".join(selects) + "\nORDER BY score LIMIT ?"
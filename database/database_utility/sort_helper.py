@@ -3,5 +3,11 @@ from PyQt6.QtCore import Qt
 
 
 def apply_sorting(table_view, column_index):
+    """
+    Enables header sorting on the view and sorts it by the given column, newest first.
+
+    The sort is handed to the view's model, which for DateSortedTableModel runs as one
+    indexed ORDER BY query rather than an in-memory sort.
+    """
     table_view.setSortingEnabled(True)
     table_view.sortByColumn(column_index, Qt.SortOrder.DescendingOrder)
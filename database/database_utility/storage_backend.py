@@ -0,0 +1,397 @@
+import datetime
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+import tracker_config as tkc
+from database.database_utility.archive import ArchiveManager
+from database.database_utility.journal_store import record_inserts
+from database.database_utility.note_store import NOTE_COLUMNS, compact_note_sqlite
+from database.database_utility.table_registry import TABLES, TOMBSTONE_COLUMN, TableSpec
+from logger_setup import logger
+
+# storage_backend.py
+
+AGGREGATES = ('avg', 'min', 'max', 'sum', 'count')
+
+
+def checked_columns(spec: TableSpec, columns: Optional[Sequence[str]]) -> List[str]:
+    """
+    Returns the requested columns of a table, or all of them, after checking every name
+    against the table registry. Table and column names cannot be bound, so nothing else may
+    reach the SQL text.
+    """
+    if columns is None:
+        return ['id'] + list(spec.columns)
+    allowed = {'id', *spec.columns}
+    unknown = [column for column in columns if column not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown columns for {spec.name}: {', '.join(unknown)}")
+    return list(columns)
+
+
+def insert_sql(spec: TableSpec, columns: Sequence[str]) -> str:
+    return (f"INSERT INTO {spec.name}({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})")
+
+
+def write_rows(connection: Any,
+               rows_by_table: Mapping[str, Iterable[Sequence[Any]]]) -> List[Tuple[str, int]]:
+    """
+    Inserts rows the way DataManager.exec_insert does, inside the caller's transaction: the
+    notes are compacted, and all rows are recorded in the operation journal as one operation,
+    so the app can undo them.
+
+    Args:
+        connection (Any): A sqlite3 connection, or anything with the same execute() and
+            executemany().
+        rows_by_table (Mapping[str, Iterable[Sequence[Any]]]): The rows of each table, in the
+            order of TableSpec.columns.
+
+    Returns:
+        List[Tuple[str, int]]: (table, id) of every new row, in insert order.
+    """
+    inserted: List[Tuple[str, int, Tuple[Any, ...]]] = []
+    for table, rows in rows_by_table.items():
+        spec = TABLES[table]
+        sql = insert_sql(spec, spec.columns)
+        note_index = spec.columns.index(NOTE_COLUMNS[table]) if table in NOTE_COLUMNS else None
+        for row in rows:
+            values = tuple(row)
+            row_id = connection.execute(sql, values).lastrowid
+            inserted.append((table, row_id, values))
+            if note_index is not None:
+                # the journal keeps the full text; the row only its preview
+                compact_note_sqlite(connection, table, row_id, values[note_index])
+    record_inserts(connection, {table: TABLES[table].columns for table in rows_by_table}, inserted)
+    return [(table, row_id) for table, row_id, _ in inserted]
+
+
+def range_where(spec: TableSpec, since: Optional[str], until: Optional[str]) -> Tuple[str, List[str]]:
+    """
+    Builds the WHERE clause of an inclusive 'yyyy-MM-dd' date range over the live rows.
+    None leaves a side open.
+    """
+    parts: List[str] = [f"{TOMBSTONE_COLUMN} IS NULL"]
+    params: List[str] = []
+    if since is not None:
+        parts.append(f"{spec.date_column} >= ?")
+        params.append(since)
+    if until is not None:
+        parts.append(f"{spec.date_column} <= ?")
+        params.append(until)
+    return f" WHERE {' AND '.join(parts)}", params
+
+
+def tombstone_rows(row_ids: Iterable[int]) -> Iterable[Tuple[str, int]]:
+    deleted_at = datetime.datetime.now().isoformat(timespec='seconds')
+    return ((deleted_at, row_id) for row_id in row_ids)
+
+
+def tombstone_sql(spec: TableSpec) -> str:
+    return (f"UPDATE {spec.name} SET {TOMBSTONE_COLUMN} = ? "
+            f"WHERE id = ? AND {TOMBSTONE_COLUMN} IS NULL")
+
+
+def range_sql(spec: TableSpec,
+              columns: Sequence[str],
+              since: Optional[str],
+              until: Optional[str],
+              descending: bool,
+              limit: Optional[int],
+              source: Optional[str] = None) -> Tuple[str, List[Any]]:
+    """
+    Builds the SELECT of a date range; source is the table or view read, by default the table
+    (see ArchiveManager.source).
+    """
+    where, params = range_where(spec, since, until)
+    direction = "DESC" if descending else "ASC"
+    order = [spec.date_column] + ([spec.time_column] if spec.time_column else []) + ['id']
+    sql = (f"SELECT {', '.join(columns)} FROM {source or spec.name}{where} "
+           f"ORDER BY {', '.join(f'{column} {direction}' for column in order)}")
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = params + [limit]
+    return sql, params
+
+
+def aggregate_sql(spec: TableSpec,
+                  column: str,
+                  function: str,
+                  since: Optional[str],
+                  until: Optional[str],
+                  source: Optional[str] = None) -> Tuple[str, List[str]]:
+    if function not in AGGREGATES:
+        raise ValueError(f"Unknown aggregate {function}, expected one of {', '.join(AGGREGATES)}")
+    checked_columns(spec, [column])
+    where, params = range_where(spec, since, until)
+    return f"SELECT {function}({column}) FROM {source or spec.name}{where}", params
+
+
+class StorageBackend(ABC):
+    """
+    The storage operations the tracker needs, independent of the database driver.
+
+    Tables and columns are the ones in the table registry. Rows are tuples in the requested
+    column order, dates are 'yyyy-MM-dd' strings. Inserts go through write_rows(), so each call
+    is one operation in the operation journal and notes are compacted. Deletes are soft: they
+    set the row's tombstone, reads skip tombstoned rows and the maintenance purges them later.
+    Range reads include the archived rows once the range reaches an archived year.
+    """
+
+    @abstractmethod
+    def insert(self, table: str, values: Sequence[Any]) -> Optional[int]:
+        """
+        Inserts one row.
+
+        Args:
+            table (str): The table.
+            values (Sequence[Any]): The row, in the order of TableSpec.columns.
+
+        Returns:
+            Optional[int]: The id of the new row, None if the insert failed.
+        """
+
+    @abstractmethod
+    def insert_many(self, table: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Inserts many rows in one transaction. Either all rows are inserted or none.
+
+        Args:
+            table (str): The table.
+            rows (Iterable[Sequence[Any]]): The rows, in the order of TableSpec.columns.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+
+    @abstractmethod
+    def insert_batch(self, rows_by_table: Mapping[str, Iterable[Sequence[Any]]]) -> Dict[str, int]:
+        """
+        Inserts rows into several tables in one transaction. Either all rows are inserted or
+        none.
+
+        Args:
+            rows_by_table (Mapping[str, Iterable[Sequence[Any]]]): The rows of each table, in
+                the order of TableSpec.columns.
+
+        Returns:
+            Dict[str, int]: The number of rows inserted per table, empty if the batch failed.
+        """
+
+    @abstractmethod
+    def delete(self, table: str, row_ids: Iterable[int]) -> int:
+        """
+        Soft-deletes rows by id.
+
+        Returns:
+            int: The number of rows tombstoned.
+        """
+
+    @abstractmethod
+    def query_range(self,
+                    table: str,
+                    since: Optional[str] = None,
+                    until: Optional[str] = None,
+                    columns: Optional[Sequence[str]] = None,
+                    descending: bool = False,
+                    limit: Optional[int] = None) -> List[Tuple[Any, ...]]:
+        """
+        Reads the rows of an inclusive date range, ordered by date and time.
+
+        Args:
+            table (str): The table.
+            since (Optional[str]): The first date, None for no lower bound.
+            until (Optional[str]): The last date, None for no upper bound.
+            columns (Optional[Sequence[str]]): The columns to read, default id and TableSpec.columns.
+            descending (bool): Newest rows first.
+            limit (Optional[int]): The maximum number of rows.
+
+        Returns:
+            List[Tuple[Any, ...]]: The rows.
+        """
+
+    @abstractmethod
+    def iter_range(self,
+                   table: str,
+                   since: Optional[str] = None,
+                   until: Optional[str] = None,
+                   columns: Optional[Sequence[str]] = None,
+                   descending: bool = False,
+                   chunk_size: int = tkc.READ_CHUNK_SIZE) -> Iterator[List[Tuple[Any, ...]]]:
+        """
+        Reads the rows of an inclusive date range like query_range, but streams them in chunks
+        of up to chunk_size rows from a forward-only cursor, so memory stays the same however
+        many rows the range holds. The cursor is released when the iterator is exhausted or
+        closed.
+
+        Yields:
+            List[Tuple[Any, ...]]: The next chunk of rows.
+        """
+
+    @abstractmethod
+    def aggregate(self,
+                  table: str,
+                  column: str,
+                  function: str,
+                  since: Optional[str] = None,
+                  until: Optional[str] = None) -> Any:
+        """
+        Computes avg, min, max, sum or count of a column over an inclusive date range.
+
+        Returns:
+            Any: The result, None for an empty range (0 for count).
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Closes every connection the backend opened.
+        """
+
+
+class SqliteBackend(StorageBackend):
+    """
+    StorageBackend on the standard library sqlite3 module, usable without PyQt6.
+
+    Every thread gets its own connection, so workers can read and write concurrently; SQLite
+    serializes the writers and each waits up to the busy timeout for a lock. Each connection
+    attaches the archives its reads need.
+
+    Attributes:
+        db_path (str): The database file.
+        busy_timeout (float): Seconds a statement waits for another connection's lock.
+        archive_dir (Optional[str]): Where the archives live, None for the default directory.
+    """
+
+    def __init__(self, db_path: str, busy_timeout: float = tkc.DB_BUSY_TIMEOUT_MS / 1000,
+                 archive_dir: Optional[str] = None) -> None:
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self.archive_dir = archive_dir
+        self.local = threading.local()
+        self.connections: List[sqlite3.Connection] = []
+        self.lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        Returns the calling thread's connection, opening it on first use.
+        """
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            # only this thread uses it; close() may run on another one
+            connection = sqlite3.connect(self.db_path, timeout=self.busy_timeout,
+                                         check_same_thread=False)
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def archives(self) -> ArchiveManager:
+        """
+        Returns the archive manager of the calling thread's connection.
+        """
+        archives = getattr(self.local, 'archives', None)
+        if archives is None:
+            connection = self.connection()
+            archives = (ArchiveManager(connection) if self.archive_dir is None
+                        else ArchiveManager(connection, self.archive_dir))
+            self.local.archives = archives
+        return archives
+
+    def insert(self, table: str, values: Sequence[Any]) -> Optional[int]:
+        try:
+            with self.connection() as connection:
+                return write_rows(connection, {table: [values]})[0][1]
+        except sqlite3.Error as e:
+            logger.error(f"Error inserting data: {table} - {e}", exc_info=True)
+            return None
+
+    def insert_many(self, table: str, rows: Iterable[Sequence[Any]]) -> int:
+        return self.insert_batch({table: rows}).get(table, 0)
+
+    def insert_batch(self, rows_by_table: Mapping[str, Iterable[Sequence[Any]]]) -> Dict[str, int]:
+        try:
+            with self.connection() as connection:
+                inserted = write_rows(connection, rows_by_table)
+        except sqlite3.Error as e:
+            logger.error(f"Error inserting rows: {', '.join(rows_by_table)} - {e}", exc_info=True)
+            return {}
+        counts = dict.fromkeys(rows_by_table, 0)
+        for table, _ in inserted:
+            counts[table] += 1
+        return counts
+
+    def delete(self, table: str, row_ids: Iterable[int]) -> int:
+        spec = TABLES[table]
+        try:
+            with self.connection() as connection:
+                cursor = connection.executemany(tombstone_sql(spec), tombstone_rows(row_ids))
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting rows: {table} - {e}", exc_info=True)
+            return 0
+
+    def query_range(self,
+                    table: str,
+                    since: Optional[str] = None,
+                    until: Optional[str] = None,
+                    columns: Optional[Sequence[str]] = None,
+                    descending: bool = False,
+                    limit: Optional[int] = None) -> List[Tuple[Any, ...]]:
+        spec = TABLES[table]
+        sql, params = range_sql(spec, checked_columns(spec, columns), since, until, descending,
+                                limit, self.archives().source(table, since, until))
+        try:
+            return self.connection().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading rows: {table} - {e}", exc_info=True)
+            return []
+
+    def iter_range(self,
+                   table: str,
+                   since: Optional[str] = None,
+                   until: Optional[str] = None,
+                   columns: Optional[Sequence[str]] = None,
+                   descending: bool = False,
+                   chunk_size: int = tkc.READ_CHUNK_SIZE) -> Iterator[List[Tuple[Any, ...]]]:
+        spec = TABLES[table]
+        sql, params = range_sql(spec, checked_columns(spec, columns), since, until, descending,
+                                None, self.archives().source(table, since, until))
+        cursor = None
+        try:
+            cursor = self.connection().execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+        except sqlite3.Error as e:
+            logger.error(f"Error reading rows: {table} - {e}", exc_info=True)
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def aggregate(self,
+                  table: str,
+                  column: str,
+                  function: str,
+                  since: Optional[str] = None,
+                  until: Optional[str] = None) -> Any:
+        sql, params = aggregate_sql(TABLES[table], column, function, since, until,
+                                    self.archives().source(table, since, until))
+        try:
+            return self.connection().execute(sql, params).fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"Error aggregating {function}({column}): {table} - {e}", exc_info=True)
+            return None
+
+    def close(self) -> None:
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error as e:
+                logger.error(f"Error closing connection: {e}", exc_info=True)
+        self.local = threading.local()
@@ -0,0 +1,56 @@
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# table_registry.py
+
+# set on soft-deleted rows, which the maintenance purges later; NULL for live rows
+TOMBSTONE_COLUMN = 'deleted_at'
+
+
+class TableSpec(NamedTuple):
+    """
+    Describes one tracking table created by DataManager.setup_tables.
+
+    Attributes:
+        name (str): The table name.
+        date_column (str): The 'yyyy-MM-dd' date column.
+        time_column (Optional[str]): The 'hh:mm:ss' time column, if the table has one.
+        value_columns (Tuple[str, ...]): The data columns, in the order the table's
+            DataManager insert method takes them after the date and time.
+    """
+    name: str
+    date_column: str
+    time_column: Optional[str]
+    value_columns: Tuple[str, ...]
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """The columns in the order the table's DataManager insert method takes them."""
+        if self.time_column is None:
+            return (self.date_column,) + self.value_columns
+        return (self.date_column, self.time_column) + self.value_columns
+
+
+TABLES: Dict[str, TableSpec] = {spec.name: spec for spec in (
+    TableSpec('sleep_table', 'sleep_date', None, ('time_asleep', 'time_awake')),
+    TableSpec('total_hours_slept_table', 'sleep_date', None, ('total_hours_slept',)),
+    TableSpec('woke_up_like_table', 'sleep_date', None, ('woke_up_like',)),
+    TableSpec('sleep_quality_table', 'sleep_date', None, ('sleep_quality',)),
+    TableSpec('shower_table', 'basics_date', 'basics_time', ('shower_check',)),
+    TableSpec('exercise_table', 'basics_date', 'basics_time', ('exerc_check',)),
+    TableSpec('tooth_table', 'basics_date', 'basics_time', ('tooth_check',)),
+    TableSpec('diet_table', 'diet_date', 'diet_time', ('food_eaten', 'calories')),
+    TableSpec('hydration_table', 'diet_date', 'diet_time', ('hydration',)),
+    TableSpec('lily_diet_table', 'lily_date', 'lily_time', ()),
+    TableSpec('lily_mood_table', 'lily_date', 'lily_time',
+              ('lily_mood_slider', 'lily_mood_activity_slider', 'lily_energy_slider')),
+    TableSpec('lily_walk_table', 'lily_date', 'lily_time', ('lily_behavior', 'lily_gait')),
+    TableSpec('lily_in_room_table', 'lily_date', 'lily_time', ('time_in_room_slider',)),
+    TableSpec('lily_notes_table', 'lily_date', 'lily_time', ('lily_notes',)),
+    TableSpec('lily_walk_notes_table', 'lily_date', 'lily_time', ('lily_walk_note',)),
+    TableSpec('wefe_table', 'wefe_date', 'wefe_time',
+              ('wellbeing_slider', 'excite_slider', 'focus_slider', 'energy_slider')),
+    TableSpec('cspr_table', 'cspr_date', 'cspr_time',
+              ('calm_slider', 'stress_slider', 'pain_slider', 'rage_slider')),
+    TableSpec('mmdmr_table', 'mmdmr_date', 'mmdmr_time',
+              ('mood_slider', 'mania_slider', 'depression_slider', 'mixed_risk_slider')),
+)}
@@ -20,7 +20,7 @@ log_file = os.path.join(log_directory, tkc.LOG_FILE)
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(level=logging.ERROR,
+logging.basicConfig(level=tkc.LOG_LEVEL,
                     format='%(asctime)s - %(levelname)s - %(message)s',
                     datefmt=tkc.DATEFORMAT,
                     filename=log_file,
@@ -22,7 +22,6 @@ def run_app():
         # app.setStyleSheet(homie_stylesheet)
         window = MainWindow()
         window.show()
-        window.setFixedSize(300, 330)
         sys.exit(app.exec())
     except (ValueError, TypeError) as e:
         logger.error(f"Value or Type error occurred {e}", exc_info=True)
@@ -0,0 +1,80 @@
+"""
+Measure what DATA_BROWSER_MODE saves: the live widget count and resident memory of the main
+window with one table view per table (mode off) and with one shared view per data page (on).
+
+    python measure_data_browser.py
+    python measure_data_browser.py --platform xcb
+
+Each mode starts the app in a fresh process, against the usual database in the home
+directory, waits until the window has shown and settled, and reports its figures; the parent
+prints both and the difference. The Qt platform defaults to 'offscreen', so no window appears.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, Optional
+
+SETTLE_MS = 2000
+
+
+def measure(browser_mode: bool) -> Dict[str, Optional[int]]:
+    """
+    Starts the main window in this process and returns its widget count and resident memory.
+    """
+    import tracker_config as tkc
+    tkc.DATA_BROWSER_MODE = browser_mode
+    from PyQt6.QtCore import QEvent, QTimer
+    from PyQt6.QtWidgets import QApplication
+    from app import MainWindow
+    from utility.widgets_set_widgets.data_browser import widget_stats
+
+    app = QApplication(sys.argv[:1])
+    window = MainWindow()
+    window.show()
+    QTimer.singleShot(SETTLE_MS, app.quit)
+    app.exec()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+    widgets, memory = widget_stats()
+    window.close()
+    return {'widgets': widgets, 'memory': memory}
+
+
+def run_child(browser_mode: bool, platform: str) -> Dict[str, Optional[int]]:
+    environment = dict(os.environ, QT_QPA_PLATFORM=platform)
+    process = subprocess.run([sys.executable, __file__, '--child', 'on' if browser_mode else 'off'],
+                             env=environment, capture_output=True, text=True)
+    if process.returncode != 0:
+        sys.exit(f"Measuring with DATA_BROWSER_MODE {'on' if browser_mode else 'off'} failed:\n"
+                 f"{process.stderr}")
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def format_memory(memory: Optional[int]) -> str:
+    return "n/a" if memory is None else f"{memory / 2 ** 20:.1f} MiB"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare widget count and resident memory with DATA_BROWSER_MODE off and on.")
+    parser.add_argument('--platform', default='offscreen', help="the Qt platform plugin")
+    parser.add_argument('--child', choices=('off', 'on'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child is not None:
+        print(json.dumps(measure(args.child == 'on')))
+        return
+
+    results = {mode: run_child(mode == 'on', args.platform) for mode in ('off', 'on')}
+    for mode, result in results.items():
+        print(f"DATA_BROWSER_MODE {mode:>3}: {result['widgets']:6d} widgets, "
+              f"resident memory {format_memory(result['memory'])}")
+    off, on = results['off'], results['on']
+    print(f"difference:           {on['widgets'] - off['widgets']:+6d} widgets", end="")
+    if off['memory'] is not None and on['memory'] is not None:
+        print(f", {(on['memory'] - off['memory']) / 2 ** 20:+.1f} MiB", end="")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# conftest.py
+
+# the modules import each other from the repository root, as when the app is started
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
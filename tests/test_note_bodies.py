@@ -0,0 +1,85 @@
+import sqlite3
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+pytest.importorskip("PyQt6.QtSql")
+
+from database.database_manager import DataManager
+from database.database_utility.note_store import (
+    NOTE_BODY_TABLE, compact_note_sqlite, compress, repair_bodies)
+from database.database_utility.storage_backend import insert_sql
+from database.database_utility.table_registry import TABLES
+import tracker_config as tkc
+
+# test_note_bodies.py
+
+TABLE = 'lily_notes_table'
+LONG_NOTE = "Lily walked the long loop today.\n" * (tkc.NOTE_PREVIEW_CHARS // 8)
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    db_path = str(tmp_path / 'notes.db')
+    manager = DataManager(db_path)
+    yield manager, db_path
+    manager.db.close()
+    del app
+
+
+def body_type(db_path, row_id):
+    connection = sqlite3.connect(db_path)
+    try:
+        return connection.execute(f"SELECT typeof(body) FROM {NOTE_BODY_TABLE} "
+                                  f"WHERE table_name = ? AND row_id = ?",
+                                  (TABLE, row_id)).fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_long_note_committed_from_the_gui_keeps_its_text(db_manager):
+    manager, db_path = db_manager
+    assert len(LONG_NOTE) > tkc.NOTE_PREVIEW_CHARS
+    row_id = manager.exec_insert(TABLE, insert_sql(TABLES[TABLE], TABLES[TABLE].columns),
+                                 ['2024-05-01', '08:30:00', LONG_NOTE])
+    assert row_id is not None
+    assert manager.read_note(TABLE, row_id) == LONG_NOTE
+    assert body_type(db_path, row_id) == 'blob'
+
+
+def test_sqlite3_and_qt_bodies_are_stored_alike(db_manager):
+    manager, db_path = db_manager
+    connection = sqlite3.connect(db_path)
+    try:
+        with connection:
+            row_id = connection.execute(insert_sql(TABLES[TABLE], TABLES[TABLE].columns),
+                                        ('2024-05-02', '08:30:00', LONG_NOTE)).lastrowid
+            compact_note_sqlite(connection, TABLE, row_id, LONG_NOTE)
+    finally:
+        connection.close()
+    assert body_type(db_path, row_id) == 'blob'
+    assert manager.read_note(TABLE, row_id) == LONG_NOTE
+
+
+def test_bodies_stored_as_their_repr_are_read_and_repaired(db_manager):
+    manager, db_path = db_manager
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        row_id = connection.execute(insert_sql(TABLES[TABLE], TABLES[TABLE].columns),
+                                    ('2024-05-03', '08:30:00', 'preview')).lastrowid
+        connection.execute(f"INSERT INTO {NOTE_BODY_TABLE}(table_name, row_id, body) "
+                           f"VALUES (?, ?, ?)", (TABLE, row_id, repr(compress(LONG_NOTE))))
+        assert manager.read_note(TABLE, row_id) == LONG_NOTE
+        assert repair_bodies(connection) == 1
+    finally:
+        connection.close()
+    assert body_type(db_path, row_id) == 'blob'
+    assert manager.read_note(TABLE, row_id) == LONG_NOTE
+
+
+def test_long_note_inserted_through_the_qt_backend_keeps_its_text(db_manager):
+    manager, db_path = db_manager
+    row_id = manager.backend.insert(TABLE, ['2024-05-04', '08:30:00', LONG_NOTE])
+    assert row_id is not None
+    assert body_type(db_path, row_id) == 'blob'
+    assert manager.read_note(TABLE, row_id) == LONG_NOTE
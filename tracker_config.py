@@ -8,10 +8,58 @@ LOG_FILE = 'BSLM14.log'
 PRINGLES = 'BSLM14'  # lol the directory made/placed
 DATEFORMAT = '%d-%b-%y %I:%M:%S %p'  # this is how you want it from now on lolol ok?
 FILE_MODE = 'w'
+LOG_LEVEL = 'ERROR'  # 'INFO' also logs maintenance, backups, stalls and profiles
+# UI state snapshot, kept in the PRINGLES directory
+UI_STATE_FILE = 'ui_state.bin'
 # database
 # DB_NAME = 'theDBofTracksAugust8th.db'
 DB_NAME = 'theDBofTracksAugust8th.db'
-
-
-
-
+# how long a write waits for another process (e.g. cli.py) to release the database
+DB_BUSY_TIMEOUT_MS = 5000
+# long notes are stored zlib-compressed apart from their table, which keeps a preview
+NOTE_PREVIEW_CHARS = 120
+NOTE_COMPRESSION_LEVEL = 6
+# streaming reads (DataManager.iter_rows) fetch this many rows per chunk
+READ_CHUNK_SIZE = 1000
+# long-text cells are painted as one elided line; this many are cached per table view
+PREVIEW_CACHE_SIZE = 4096
+# data pages show this many days back from today by default
+DEFAULT_DATE_RANGE_DAYS = 29
+# one shared table view per data page, with a picker for the table shown, instead of one view
+# per table; the hidden tables' rows are released
+DATA_BROWSER_MODE = False
+# database backups, kept in the PRINGLES directory
+BACKUP_DIRECTORY = 'backups'
+BACKUP_PAGES_PER_STEP = 64
+BACKUP_STEP_SLEEP = 0.01  # seconds between backup steps
+BACKUP_KEEP_DAILY = 7
+BACKUP_KEEP_WEEKLY = 4
+BACKUP_INTERVAL_MS = 6 * 60 * 60 * 1000
+# idle-time database maintenance
+MAINTENANCE_IDLE_MS = 5 * 60 * 1000  # how long the app must be idle first
+MAINTENANCE_INTERVAL_S = 24 * 60 * 60
+# soft-deleted rows are purged this many days after the delete, in chunks
+PURGE_AFTER_DAYS = 30
+PURGE_CHUNK_SIZE = 500
+# undo / redo history kept in the operation journal
+JOURNAL_KEEP_OPERATIONS = 1000
+# year-partitioned archives, kept in the PRINGLES directory
+ARCHIVE_DIRECTORY = 'archive'
+ARCHIVE_AFTER_DAYS = None  # e.g. 730 to archive rows older than two years; None turns it off
+# local-only HTTP/JSON ingest endpoint, see database/database_utility/ingest_server.py
+INGEST_ENABLED = False
+INGEST_HOST = '127.0.0.1'
+INGEST_PORT = 8765
+INGEST_MAX_BODY_BYTES = 8 * 1024 * 1024
+INGEST_MAX_ROWS = 50000
+INGEST_REFRESH_MS = 250  # ingested rows are shown at most this often
+# event loop stall watchdog; reports go to the 'stalls' directory next to the log file
+STALL_WATCHDOG_ENABLED = True
+STALL_THRESHOLD_MS = 500
+STALL_HEARTBEAT_MS = 100
+STALL_DIRECTORY = 'stalls'
+STALL_KEEP_REPORTS = 50
+# sampling profiler started and stopped from the menu; profiles go to the PRINGLES directory
+PROFILE_DIRECTORY = 'profiles'
+PROFILER_RATE_HZ = 100
+PROFILER_TOP_N = 30
@@ -0,0 +1,277 @@
+import datetime
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPen, QTransform
+from PyQt6.QtWidgets import QComboBox, QDialog, QLabel, QVBoxLayout, QWidget
+from database.database_utility.column_cache import NUMERIC_TABLES
+from database.database_utility.table_registry import TABLES
+from utility.app_operations.lttb import lttb
+from logger_setup import logger
+
+# charts.py
+
+# dataset label -> (table, column) of each line
+CHART_DATASETS: Dict[str, List[Tuple[str, str]]] = {
+    "Mood / Mania / Depression / Mixed Risk": [
+        ('mmdmr_table', 'mood_slider'), ('mmdmr_table', 'mania_slider'),
+        ('mmdmr_table', 'depression_slider'), ('mmdmr_table', 'mixed_risk_slider')],
+    "Calm / Stress / Pain / Rage": [
+        ('cspr_table', 'calm_slider'), ('cspr_table', 'stress_slider'),
+        ('cspr_table', 'pain_slider'), ('cspr_table', 'rage_slider')],
+    "Wellbeing / Excite / Focus / Energy": [
+        ('wefe_table', 'wellbeing_slider'), ('wefe_table', 'excite_slider'),
+        ('wefe_table', 'focus_slider'), ('wefe_table', 'energy_slider')],
+    "Sleep Quality / Woke Up Like": [
+        ('sleep_quality_table', 'sleep_quality'), ('woke_up_like_table', 'woke_up_like')],
+    "Hours Slept": [('total_hours_slept_table', 'total_hours_slept')],
+    "Hydration": [('hydration_table', 'hydration')],
+}
+
+LINE_COLORS = ["#4fc3f7", "#ff8a65", "#aed581", "#ba68c8"]
+PATH_CACHE_SIZE = 64
+
+
+def parse_value(value) -> Optional[float]:
+    """
+    Converts a stored value to a float. 'HH:MM' durations become hours.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        if ':' in value:
+            hours, minutes = value.split(':')[:2]
+            return int(hours) + int(minutes) / 60
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class SeriesCache:
+    """
+    Column arrays of (timestamp, value) per table column, loaded from the database once and
+    kept until the table changes.
+
+    The NUMERIC_TABLES are served as read-only views of the DataManager's ColumnCache, which
+    keeps itself current; only the other tables are loaded and kept here. Both read through
+    DataManager's streaming reads, so archived rows are included.
+
+    Attributes:
+        db_manager: The DataManager the series are read through.
+        series (Dict[Tuple[str, str], Tuple[array, array]]): The loaded (table, column) series.
+    """
+
+    def __init__(self, db_manager) -> None:
+        self.db_manager = db_manager
+        self.series: Dict[Tuple[str, str], Tuple[array, array]] = {}
+
+    def invalidate(self, table: str) -> None:
+        for key in [key for key in self.series if key[0] == table]:
+            del self.series[key]
+
+    def get(self, table: str, column: str) -> Tuple[Sequence[float], Sequence[float]]:
+        if table in NUMERIC_TABLES:
+            return self.db_manager.column_cache.view(table, column)
+        key = (table, column)
+        if key not in self.series:
+            self.series[key] = self.load(table, column)
+        return self.series[key]
+
+    def load(self, table: str, column: str) -> Tuple[array, array]:
+        """
+        Reads one column as (epoch seconds, value) arrays ordered by date and time.
+        """
+        spec = TABLES[table]
+        read = [spec.date_column] + ([spec.time_column] if spec.time_column else []) + [column]
+        xs = array('d')
+        ys = array('d')
+        try:
+            for chunk in self.db_manager.iter_column_chunks(table, columns=read):
+                times = chunk[spec.time_column] if spec.time_column else None
+                for index, (date, stored) in enumerate(zip(chunk[spec.date_column],
+                                                           chunk[column])):
+                    value = parse_value(stored)
+                    if value is None:
+                        continue
+                    try:
+                        stamp = datetime.datetime.fromisoformat(
+                            f"{date}T{times[index] if times else '00:00:00'}")
+                    except (TypeError, ValueError):
+                        continue
+                    xs.append(stamp.timestamp())
+                    ys.append(value)
+        except ValueError as e:
+            logger.error(f"Error loading chart data: {table}.{column} - {e}", exc_info=True)
+        return xs, ys
+
+
+class TimeSeriesChart(QWidget):
+    """
+    A line chart for long time series that pans with the mouse and zooms with the wheel.
+
+    Each series is downsampled with LTTB to about one point per pixel at the current zoom
+    level. The resulting path is built in data coordinates and cached per zoom level, so
+    panning only changes the painter transform and never rebuilds a path.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setMinimumSize(320, 200)
+        self.series: List[Tuple[str, Sequence[float], Sequence[float], QColor]] = []
+        self.origin = 0.0
+        self.full_span = 1.0
+        self.view_start = 0.0
+        self.view_span = 1.0
+        self.y_min = 0.0
+        self.y_max = 1.0
+        self.drag_x: Optional[float] = None
+        self.paths: "OrderedDict[Tuple[str, int, int], QPainterPath]" = OrderedDict()
+
+    def set_series(self, series: List[Tuple[str, Sequence[float], Sequence[float]]]) -> None:
+        """
+        Replaces the plotted series and shows their full time range.
+
+        Args:
+            series (List[Tuple[str, Sequence[float], Sequence[float]]]): (label, epoch seconds,
+                values) of each line, timestamps in ascending order.
+        """
+        self.series = [(label, xs, ys, QColor(LINE_COLORS[index % len(LINE_COLORS)]))
+                       for index, (label, xs, ys) in enumerate(series)]
+        self.paths.clear()
+        non_empty = [(xs, ys) for _, xs, ys, _ in self.series if len(xs)]
+        if non_empty:
+            self.origin = min(xs[0] for xs, _ in non_empty)
+            self.full_span = max(max(xs[-1] for xs, _ in non_empty) - self.origin, 1.0)
+            self.y_min = min(0.0, min(min(ys) for _, ys in non_empty))
+            self.y_max = max(max(ys) for _, ys in non_empty)
+            if self.y_max <= self.y_min:
+                self.y_max = self.y_min + 1.0
+        self.view_start = 0.0
+        self.view_span = self.full_span
+        self.update()
+
+    def zoom_level(self) -> int:
+        return max(0, math.ceil(math.log2(self.full_span / self.view_span)))
+
+    def path_for(self, label: str, xs: Sequence[float], ys: Sequence[float]) -> QPainterPath:
+        """
+        Returns the cached path of a series for the current zoom level and width.
+        """
+        level = self.zoom_level()
+        key = (label, level, self.width())
+        path = self.paths.get(key)
+        if path is not None:
+            self.paths.move_to_end(key)
+            return path
+
+        sampled_x, sampled_y = lttb(xs, ys, max(3, self.width() * (2 ** level)))
+        path = QPainterPath()
+        if len(sampled_x):
+            path.moveTo(sampled_x[0] - self.origin, sampled_y[0])
+            for x, y in zip(sampled_x[1:], sampled_y[1:]):
+                path.lineTo(x - self.origin, y)
+        self.paths[key] = path
+        if len(self.paths) > PATH_CACHE_SIZE:
+            self.paths.popitem(last=False)
+        return path
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.fillRect(self.rect(), QColor("#1e1e1e"))
+            if not self.series:
+                return
+            width = self.width()
+            height = self.height()
+            x_scale = width / self.view_span
+            y_scale = (height - 20) / (self.y_max - self.y_min)
+            transform = QTransform(x_scale, 0, 0, -y_scale,
+                                   -self.view_start * x_scale, height - 10 + self.y_min * y_scale)
+            for index, (label, xs, ys, color) in enumerate(self.series):
+                # only the visible slice matters for the legend, the path covers the series
+                first = bisect_left(xs, self.origin + self.view_start)
+                last = bisect_right(xs, self.origin + self.view_start + self.view_span)
+                pen = QPen(color, 1.5)
+                pen.setCosmetic(True)
+                painter.setPen(pen)
+                painter.setTransform(transform)
+                painter.drawPath(self.path_for(label, xs, ys))
+                painter.resetTransform()
+                painter.drawText(QPointF(8, 16 + 14 * index), f"{label} ({last - first})")
+            start = datetime.datetime.fromtimestamp(self.origin + self.view_start)
+            end = datetime.datetime.fromtimestamp(self.origin + self.view_start + self.view_span)
+            painter.setPen(QColor("#bdbdbd"))
+            painter.drawText(QRectF(0, 0, width - 8, height - 4),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom,
+                             f"{start:%Y-%m-%d} - {end:%Y-%m-%d}")
+        except Exception as e:
+            logger.error(f"Error painting chart: {e}", exc_info=True)
+        finally:
+            painter.end()
+
+    def wheelEvent(self, event) -> None:
+        factor = 0.8 if event.angleDelta().y() > 0 else 1.25
+        anchor = self.view_start + self.view_span * event.position().x() / max(self.width(), 1)
+        self.view_span = min(max(self.view_span * factor, 60.0), self.full_span)
+        self.view_start = anchor - self.view_span * event.position().x() / max(self.width(), 1)
+        self.clamp_view()
+        self.update()
+
+    def mousePressEvent(self, event) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event) -> None:
+        if self.drag_x is None:
+            return
+        self.view_start -= (event.position().x() - self.drag_x) * self.view_span / self.width()
+        self.drag_x = event.position().x()
+        self.clamp_view()
+        self.update()
+
+    def mouseReleaseEvent(self, event) -> None:
+        self.drag_x = None
+
+    def clamp_view(self) -> None:
+        self.view_start = min(max(self.view_start, 0.0), self.full_span - self.view_span)
+
+
+class ChartDialog(QDialog):
+    """
+    Trend charts for the mental, sleep and hydration data.
+    """
+
+    def __init__(self, series_cache: SeriesCache, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.series_cache = series_cache
+        self.setWindowTitle("Charts")
+        self.resize(760, 420)
+
+        self.dataset = QComboBox(self)
+        self.dataset.addItems(CHART_DATASETS.keys())
+        self.chart = TimeSeriesChart(self)
+        hint = QLabel("Scroll to zoom, drag to pan", self)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.dataset)
+        layout.addWidget(self.chart, 1)
+        layout.addWidget(hint)
+        self.dataset.currentTextChanged.connect(self.show_dataset)
+
+    def show_dataset(self, label: str) -> None:
+        try:
+            series = []
+            for table, column in CHART_DATASETS[label]:
+                xs, ys = self.series_cache.get(table, column)
+                series.append((column.replace('_slider', '').replace('_', ' '), xs, ys))
+            self.chart.set_series(series)
+        except Exception as e:
+            logger.error(f"Error showing chart {label}: {e}", exc_info=True)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.show_dataset(self.dataset.currentText())
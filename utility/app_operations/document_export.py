@@ -0,0 +1,137 @@
+import os
+import tempfile
+import threading
+from typing import List, Optional, Sequence
+from PyQt6.QtCore import QMarginsF, QObject, QRectF, QSizeF, pyqtSignal
+from PyQt6.QtGui import QPageLayout, QPageSize, QPainter, QPdfWriter, QTextDocument
+from logger_setup import logger
+
+# document_export.py
+
+TEXT_FORMATS = ('txt', 'md', 'html')
+WRITE_CHUNK_CHARS = 64 * 1024
+
+
+class DocumentExporter(QObject):
+    """
+    Writes text documents to PDF, plain text, Markdown or HTML on a background thread.
+
+    Only strings cross to the export thread: the GUI thread hands over HTML for a PDF, or the
+    finished text for the other formats (e.g. QTextEdit.document().toMarkdown()). Every
+    QTextDocument is created on the export thread, which owns it, so its layout, the PDF
+    rendering and the writing all happen there. Output goes to a temporary file next to the
+    target that replaces it once complete, so a failed or interrupted export never leaves a
+    half-written file behind.
+
+    PDFs are painted page by page with QPdfWriter, which reports progress per page and lets
+    several documents share one PDF, each starting on a new page.
+
+    Signals:
+        progress(int, int): Pages (PDF) or characters (text formats) written, and the total.
+        finished(str): The file written.
+        failed(str): The file that could not be written.
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def export(self, sources: Sequence[str], filename: str) -> bool:
+        """
+        Starts exporting; the format follows the file's extension. Several sources are only
+        supported for PDF.
+
+        Args:
+            sources (Sequence[str]): HTML documents for a PDF, otherwise the one text to write,
+                already in the file's format.
+            filename (str): The file to write.
+
+        Returns:
+            bool: True if the export was started, False if one is still running or the
+            request is invalid.
+        """
+        if self.running:
+            logger.info("An export is still running")
+            return False
+        extension = os.path.splitext(filename)[1].lower().lstrip('.')
+        if extension != 'pdf' and (extension not in TEXT_FORMATS or len(sources) != 1):
+            logger.error(f"Cannot export {len(sources)} document(s) to {filename}")
+            return False
+        self.thread = threading.Thread(target=self.run, args=(list(sources), filename, extension),
+                                       name="bslm-export", daemon=True)
+        self.thread.start()
+        return True
+
+    def run(self, sources: List[str], filename: str, extension: str) -> None:
+        temp_path = None
+        try:
+            directory = os.path.dirname(os.path.abspath(filename))
+            descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix='.export-',
+                                                     suffix='.' + extension)
+            os.close(descriptor)
+            if extension == 'pdf':
+                self.write_pdf([self.as_document(source) for source in sources], temp_path)
+            else:
+                self.write_text(sources[0], temp_path)
+            os.chmod(temp_path, 0o644)  # mkstemp creates it private
+            os.replace(temp_path, filename)
+            logger.info(f"Exported {len(sources)} document(s) to {filename}")
+            self.finished.emit(filename)
+        except Exception as e:
+            logger.error(f"Error exporting to {filename}: {e}", exc_info=True)
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            self.failed.emit(filename)
+
+    @staticmethod
+    def as_document(html: str) -> QTextDocument:
+        """
+        Builds a document from HTML; called on the export thread, which then owns it.
+        """
+        document = QTextDocument()
+        document.setHtml(html)
+        return document
+
+    def write_pdf(self, documents: List[QTextDocument], path: str) -> None:
+        writer = QPdfWriter(path)
+        writer.setPageSize(QPageSize(QPageSize.PageSizeId.A4))
+        writer.setPageMargins(QMarginsF(15, 15, 15, 15), QPageLayout.Unit.Millimeter)
+        area = writer.pageLayout().paintRectPixels(writer.resolution())
+        page_size = QSizeF(area.width(), area.height())
+        for document in documents:
+            # lay out for the PDF's resolution, not the screen's
+            document.documentLayout().setPaintDevice(writer)
+            document.setPageSize(page_size)
+        total = sum(document.pageCount() for document in documents)
+        painter = QPainter()
+        if not painter.begin(writer):
+            raise OSError(f"Cannot write {path}")
+        try:
+            done = 0
+            for document in documents:
+                for page in range(document.pageCount()):
+                    if done:
+                        writer.newPage()
+                    top = page * page_size.height()
+                    painter.save()
+                    painter.translate(0, -top)
+                    document.drawContents(painter, QRectF(0, top, page_size.width(),
+                                                          page_size.height()))
+                    painter.restore()
+                    done += 1
+                    self.progress.emit(done, total)
+        finally:
+            painter.end()
+
+    def write_text(self, text: str, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as file:
+            for start in range(0, len(text), WRITE_CHUNK_CHARS):
+                file.write(text[start:start + WRITE_CHUNK_CHARS])
+                self.progress.emit(min(start + WRITE_CHUNK_CHARS, len(text)), len(text))
@@ -0,0 +1,128 @@
+from typing import Any, Callable, Dict, Iterable, Set, Tuple
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtWidgets import (QAbstractSpinBox, QCheckBox, QDoubleSpinBox, QLineEdit, QSlider,
+                             QSpinBox, QTextEdit, QWidget)
+from logger_setup import logger
+
+# draft_autosave.py
+
+DRAFT_GROUP = "drafts"
+
+
+class DraftAutosaver(QObject):
+    """
+    Keeps a draft of every input widget on the input pages so in-progress forms survive a crash.
+
+    Changes are coalesced with a debounce timer. When it fires, only the widgets whose value
+    differs from the last saved draft are written, followed by one sync() of the store.
+
+    Date and time edits are not watched, they are stamped with the current date and time on
+    startup anyway.
+
+    Attributes:
+        store: Where the drafts are kept, a QSettings or anything with the same value(),
+            setValue(), contains() and sync() methods such as UiStateSnapshot.
+        fields (Dict[str, Tuple[type, Callable, Callable]]): Maps a widget's object name to the
+            value type, getter and setter of that widget.
+        saved (Dict[str, Any]): The last value written for each widget.
+        dirty (Set[str]): Widgets changed since the last flush.
+        timer (QTimer): The debounce timer.
+    """
+
+    def __init__(self,
+                 store: Any,
+                 pages: Iterable[QWidget],
+                 delay_ms: int = 750) -> None:
+        super().__init__()
+        self.store = store
+        self.fields: Dict[str, Tuple[type, Callable[[], Any], Callable[[Any], None]]] = {}
+        self.saved: Dict[str, Any] = {}
+        self.dirty: Set[str] = set()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.flush)
+
+        for page in pages:
+            self.watch_page(page)
+
+    def watch_page(self, page: QWidget) -> None:
+        """
+        Watches every supported input widget on the given page.
+
+        Args:
+            page (QWidget): The page to scan for input widgets.
+        """
+        try:
+            for widget in page.findChildren(QWidget):
+                name = widget.objectName()
+                if not name or name.startswith("qt_") or name in self.fields:
+                    continue
+                if isinstance(widget, (QSlider, QSpinBox)):
+                    self.watch(name, int, widget.value, widget.setValue, widget.valueChanged)
+                elif isinstance(widget, QDoubleSpinBox):
+                    self.watch(name, float, widget.value, widget.setValue, widget.valueChanged)
+                elif isinstance(widget, QCheckBox):
+                    self.watch(name, bool, widget.isChecked, widget.setChecked, widget.toggled)
+                elif isinstance(widget, QLineEdit) and not isinstance(widget.parent(),
+                                                                       QAbstractSpinBox):
+                    self.watch(name, str, widget.text, widget.setText, widget.textChanged)
+                elif isinstance(widget, QTextEdit):
+                    self.watch(name, str, widget.toHtml, widget.setHtml, widget.textChanged)
+        except Exception as e:
+            logger.error(f"Error watching page for drafts: {e}", exc_info=True)
+
+    def watch(self,
+              name: str,
+              value_type: type,
+              getter: Callable[[], Any],
+              setter: Callable[[Any], None],
+              signal: Any) -> None:
+        self.fields[name] = (value_type, getter, setter)
+        signal.connect(lambda *_, n=name: self.mark_dirty(n))
+
+    def mark_dirty(self, name: str) -> None:
+        self.dirty.add(name)
+        self.timer.start()
+
+    def flush(self) -> None:
+        """
+        Writes the drafts of the widgets changed since the last flush, then syncs once.
+        """
+        self.timer.stop()
+        try:
+            changed = False
+            for name in self.dirty:
+                value = self.fields[name][1]()
+                if self.saved.get(name) != value:
+                    self.store.setValue(f"{DRAFT_GROUP}/{name}", value)
+                    self.saved[name] = value
+                    changed = True
+            self.dirty.clear()
+            if changed:
+                self.store.sync()
+        except Exception as e:
+            logger.error(f"Error saving drafts: {e}", exc_info=True)
+
+    def restore(self) -> None:
+        """
+        Restores every watched widget from its saved draft.
+
+        Widgets without a draft fall back to the key the old closeEvent based save_state wrote,
+        which was the widget's object name.
+        """
+        try:
+            for name, (value_type, _, setter) in self.fields.items():
+                key = f"{DRAFT_GROUP}/{name}"
+                if not self.store.contains(key):
+                    key = name
+                    if not self.store.contains(key):
+                        continue
+                value = self.store.value(key, type=value_type)
+                self.saved[name] = value
+                setter(value)
+            self.dirty.clear()
+            self.timer.stop()
+        except Exception as e:
+            logger.error(f"Error restoring drafts: {e}", exc_info=True)
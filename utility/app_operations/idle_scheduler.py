@@ -0,0 +1,74 @@
+import time
+from typing import Callable, List, Optional, Tuple
+from PyQt6.QtCore import QEvent, QObject, QTimer
+from PyQt6.QtWidgets import QApplication
+from logger_setup import logger
+
+# idle_scheduler.py
+
+USER_INPUT_EVENTS = {
+    QEvent.Type.KeyPress,
+    QEvent.Type.MouseButtonPress,
+    QEvent.Type.MouseMove,
+    QEvent.Type.Wheel,
+}
+
+
+class IdleScheduler(QObject):
+    """
+    Runs background jobs once the user has not touched the app for a while.
+
+    Every user input event resets the idle clock. The clock is checked periodically, and each
+    job runs when the app has been idle for idle_ms and the job's own interval has passed since
+    it last ran.
+
+    Attributes:
+        idle_ms (int): How long the app must be idle before jobs run.
+        last_input (float): time.monotonic() of the last user input.
+        jobs (List[Tuple[Callable[[], None], float, Optional[float]]]): (job, interval in
+            seconds, time.monotonic() of its last run) for each registered job.
+        timer (QTimer): The periodic idle check.
+    """
+
+    def __init__(self,
+                 idle_ms: int,
+                 check_interval_ms: int = 60 * 1000,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.idle_ms = idle_ms
+        self.last_input = time.monotonic()
+        self.jobs: List[Tuple[Callable[[], None], float, Optional[float]]] = []
+
+        QApplication.instance().installEventFilter(self)
+        self.timer = QTimer(self)
+        self.timer.setInterval(check_interval_ms)
+        self.timer.timeout.connect(self.run_due_jobs)
+        self.timer.start()
+
+    def add_job(self, job: Callable[[], None], interval_s: float) -> None:
+        """
+        Registers a job to run when idle, at most once every interval_s seconds.
+
+        Args:
+            job (Callable[[], None]): The job. It should hand long work to a background thread.
+            interval_s (float): The minimum number of seconds between two runs.
+        """
+        self.jobs.append((job, interval_s, None))
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() in USER_INPUT_EVENTS:
+            self.last_input = time.monotonic()
+        return False
+
+    def run_due_jobs(self) -> None:
+        now = time.monotonic()
+        if (now - self.last_input) * 1000 < self.idle_ms:
+            return
+        for index, (job, interval_s, last_run) in enumerate(self.jobs):
+            if last_run is not None and now - last_run < interval_s:
+                continue
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Error running idle job {job}: {e}", exc_info=True)
+            self.jobs[index] = (job, interval_s, now)
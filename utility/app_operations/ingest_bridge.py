@@ -0,0 +1,64 @@
+from typing import Callable, Dict, Optional, Set
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from logger_setup import logger
+
+# ingest_bridge.py
+
+
+class IngestBridge(QObject):
+    """
+    Hands the ingest server's batches to the GUI thread and refreshes the affected models.
+
+    notify() is called on the server thread; the signal queues the counts to the GUI thread,
+    where they are collected and every touched model is refreshed once per delay_ms, however
+    many batches arrived in between.
+
+    The refresh is a re-select, not an append: a QSqlTableModel cannot take rows committed by
+    another connection into its result set, and new rows sort into the date order rather than
+    after the rows already fetched, so fetchMore() would not show them. A re-select only reads
+    the first batch of rows, which is the visible window. Through refresh_model (the app passes
+    RefreshScheduler.mark_dirty), models on hidden pages wait until they are shown. The cost
+    therefore grows with the number of touched, visible tables, not with the ingest rate.
+
+    Signals:
+        rowsIngested(dict): The rows inserted per table by one batch.
+        tablesRefreshed(set): The tables whose models were just re-selected.
+    """
+    rowsIngested = pyqtSignal(dict)
+    tablesRefreshed = pyqtSignal(set)
+
+    def __init__(self, models: Dict[str, object], delay_ms: int,
+                 parent: Optional[QObject] = None,
+                 refresh_model: Optional[Callable[[object], None]] = None) -> None:
+        super().__init__(parent)
+        self.models = models
+        self.refresh_model = refresh_model
+        self.pending: Set[str] = set()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay_ms)
+        self.timer.timeout.connect(self.refresh)
+        self.rowsIngested.connect(self.queue_refresh)
+
+    def notify(self, counts: Dict[str, int]) -> None:
+        self.rowsIngested.emit(dict(counts))
+
+    def queue_refresh(self, counts: Dict[str, int]) -> None:
+        self.pending.update(table for table, count in counts.items() if count)
+        if self.pending and not self.timer.isActive():
+            self.timer.start()
+
+    def refresh(self) -> None:
+        tables, self.pending = self.pending, set()
+        for table in tables:
+            model = self.models.get(table)
+            try:
+                if model is None:
+                    continue
+                if self.refresh_model is not None:
+                    self.refresh_model(model)
+                else:
+                    model.select()
+            except Exception as e:
+                logger.error(f"Error refreshing {table} after ingest: {e}", exc_info=True)
+        self.tablesRefreshed.emit(tables)
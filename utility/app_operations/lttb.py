@@ -0,0 +1,57 @@
+from array import array
+from typing import Sequence, Tuple
+
+# lttb.py
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> Tuple[array, array]:
+    """
+    Downsamples a series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept. The points in between are split into threshold - 2
+    buckets, and each bucket keeps the point forming the largest triangle with the point kept
+    from the previous bucket and the average of the next bucket. Peaks and dips survive, which
+    plain decimation would drop.
+
+    Args:
+        xs (Sequence[float]): The x values, in ascending order.
+        ys (Sequence[float]): The y values.
+        threshold (int): The number of points to keep.
+
+    Returns:
+        Tuple[array, array]: The kept x and y values as array('d').
+    """
+    length = len(xs)
+    if threshold >= length or threshold < 3:
+        return array('d', xs), array('d', ys)
+
+    out_x = array('d', [xs[0]])
+    out_y = array('d', [ys[0]])
+    bucket_size = (length - 2) / (threshold - 2)
+    a = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        next_count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / next_count
+        avg_y = sum(ys[next_start:next_end]) / next_count
+
+        ax = xs[a]
+        ay = ys[a]
+        best_area = -1.0
+        best = start
+        for index in range(start, end):
+            area = abs((ax - avg_x) * (ys[index] - ay) - (ax - xs[index]) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = index
+        out_x.append(xs[best])
+        out_y.append(ys[best])
+        a = best
+
+    out_x.append(xs[length - 1])
+    out_y.append(ys[length - 1])
+    return out_x, out_y
@@ -0,0 +1,48 @@
+from typing import Any, Optional
+from PyQt6.QtCore import QModelIndex
+from PyQt6.QtWidgets import QDialog, QTextEdit, QVBoxLayout
+from database.database_utility.note_store import NOTE_COLUMNS
+from logger_setup import logger
+
+# note_viewer.py
+
+
+class NoteViewer(QDialog):
+    """
+    Shows the full text of a note. The note tables only show a preview of long notes; their
+    text is read from its compressed body when a row is opened.
+
+    Attributes:
+        db_manager: The DataManager the notes are read with.
+        text_view (QTextEdit): The read-only text of the note.
+    """
+
+    def __init__(self, db_manager: Any, parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.resize(480, 400)
+        self.text_view = QTextEdit(self)
+        self.text_view.setReadOnly(True)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.text_view)
+
+    def open_index(self, index: QModelIndex) -> None:
+        """
+        Shows the note of the double-clicked row; rows of other tables are ignored.
+        """
+        try:
+            model = index.model()
+            table = model.tableName() if hasattr(model, 'tableName') else None
+            if table not in NOTE_COLUMNS:
+                return
+            record = model.record(index.row())
+            text = self.db_manager.read_note(table, record.value('id'))
+            if text is None:
+                return
+            self.setWindowTitle(f"{record.value('lily_date')} {record.value('lily_time')}")
+            self.text_view.setPlainText(text)
+            self.show()
+            self.raise_()
+            self.activateWindow()
+        except Exception as e:
+            logger.error(f"Error opening note: {e}", exc_info=True)
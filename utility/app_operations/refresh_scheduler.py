@@ -0,0 +1,80 @@
+from typing import Dict, List, Optional
+from PyQt6.QtCore import QEvent, QObject, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QAbstractItemView
+from logger_setup import logger
+
+# refresh_scheduler.py
+
+
+class RefreshScheduler(QObject):
+    """
+    Coalesces model refreshes: code that changed a table marks its model dirty instead of
+    calling select(), and every dirty model is re-selected at most once per event loop pass.
+
+    A model whose watched views are all hidden, e.g. on a data page that is not shown, is not
+    re-selected then; it stays pending until one of them is shown. A model no watched view
+    shows is re-selected right away, unless the data browser released it: showing it selects
+    it anyway.
+
+    Signals:
+        modelRefreshed(object): A model was just re-selected.
+    """
+    modelRefreshed = pyqtSignal(object)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.dirty: Dict[int, object] = {}
+        self.hidden: Dict[int, object] = {}
+        self.views: List[QAbstractItemView] = []
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.flush)
+
+    def watch(self, view: QAbstractItemView) -> None:
+        """
+        Registers a view, so the models it shows wait for it to be shown.
+        """
+        if view in self.views:
+            return
+        self.views.append(view)
+        view.installEventFilter(self)
+
+    def mark_dirty(self, model: object) -> None:
+        """
+        Queues a model for one re-select on the next event loop pass.
+        """
+        if model is None:
+            return
+        self.dirty[id(model)] = model
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def is_shown(self, model: object) -> bool:
+        views = [view for view in self.views if view.model() is model]
+        return not views or any(view.isVisible() for view in views)
+
+    def flush(self) -> None:
+        models, self.dirty = self.dirty, {}
+        for key, model in models.items():
+            if getattr(model, 'released', False):
+                continue
+            if not self.is_shown(model):
+                self.hidden[key] = model
+                continue
+            self.hidden.pop(key, None)
+            self.refresh(model)
+
+    def refresh(self, model: object) -> None:
+        try:
+            model.select()
+            self.modelRefreshed.emit(model)
+        except Exception as e:
+            logger.error(f"Error refreshing model: {e}", exc_info=True)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Show and self.hidden:
+            model = watched.model()
+            if model is not None and self.hidden.pop(id(model), None) is not None:
+                self.mark_dirty(model)
+        return False
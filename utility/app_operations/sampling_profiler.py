@@ -0,0 +1,161 @@
+import datetime
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType
+from typing import Dict, List, Optional, Tuple
+from logger_setup import logger
+
+# sampling_profiler.py
+
+StackKey = Tuple[CodeType, ...]
+
+# (file, function) of innermost frames where a thread waits for work; such samples are skipped
+IDLE_FRAMES = {('threading.py', 'wait'), ('selectors.py', 'select'),
+               ('socketserver.py', 'serve_forever'), ('queue.py', 'get')}
+
+
+def is_idle(code: CodeType) -> bool:
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES
+
+
+def frame_label(code: CodeType) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    A statistical profiler for the running app.
+
+    A background thread wakes up rate_hz times a second and records, through
+    sys._current_frames, the Python stack of the GUI thread (the one that created the
+    profiler) and of every other thread that is running. Threads parked waiting for work, with
+    an IDLE_FRAMES frame innermost (Event.wait, a selector, a queue), are counted as idle and
+    left out, so they neither top the summary nor dilute its percentages. A stack is kept as the
+    tuple of its code objects, so a sample costs one walk up the frames and a Counter update;
+    nothing is formatted until the end. The profiled code runs unchanged between samples.
+
+    After stop(), the sampling thread itself writes two files to output_directory, so stopping
+    never blocks the GUI: a collapsed-stack file, one 'thread;outer;...;inner count' line per
+    distinct stack as read by flamegraph.pl and speedscope, and a summary of the top_n functions
+    by own and by total samples.
+
+    Attributes:
+        output_directory (str): Where the profiles are written.
+        rate_hz (int): Samples per second.
+        top_n (int): How many functions the summary lists.
+    """
+
+    def __init__(self, output_directory: str, rate_hz: int, top_n: int) -> None:
+        self.output_directory = output_directory
+        self.rate_hz = rate_hz
+        self.top_n = top_n
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self.idle_samples = 0
+        self.gui_thread_id = threading.get_ident()
+        self.written: Optional[Tuple[str, str]] = None
+        self.started: Optional[datetime.datetime] = None
+        self.elapsed = 0.0
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the profiler is sampling; it may still be writing the last profile after."""
+        return (self.thread is not None and self.thread.is_alive()
+                and not self.stop_event.is_set())
+
+    def start(self) -> None:
+        if self.running:
+            return
+        if self.thread is not None:
+            # the previous profile is still being written
+            self.thread.join()
+        self.samples = Counter()
+        self.sample_count = 0
+        self.idle_samples = 0
+        self.written = None
+        self.started = datetime.datetime.now()
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="bslm-profiler", daemon=True)
+        self.thread.start()
+        logger.info(f"Sampling profiler started at {self.rate_hz} Hz")
+
+    def stop(self, wait: bool = False) -> None:
+        """
+        Stops sampling; the sampling thread then writes the profile to written.
+
+        Args:
+            wait (bool): Whether to wait until the profile is written, e.g. when the app exits.
+        """
+        if not self.running:
+            return
+        self.stop_event.set()
+        if wait:
+            self.thread.join()
+
+    def run(self) -> None:
+        interval = 1 / self.rate_hz
+        own_id = threading.get_ident()
+        began = time.perf_counter()
+        names: Dict[int, str] = {}
+        while not self.stop_event.wait(interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if thread_id != self.gui_thread_id and is_idle(frame.f_code):
+                    self.idle_samples += 1
+                    continue
+                if thread_id not in names:
+                    names = {thread.ident: thread.name for thread in threading.enumerate()}
+                stack = []
+                while frame is not None:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples[(names.get(thread_id, str(thread_id)),) + tuple(stack)] += 1
+            self.sample_count += 1
+        self.elapsed = time.perf_counter() - began
+        try:
+            self.written = self.write()
+        except Exception as e:
+            logger.error(f"Error writing profile: {e}", exc_info=True)
+
+    def write(self) -> Tuple[str, str]:
+        os.makedirs(self.output_directory, exist_ok=True)
+        base = os.path.join(self.output_directory,
+                            f"profile-{self.started.strftime('%Y%m%d-%H%M%S')}")
+        with open(base + '.collapsed', 'w', encoding='utf-8') as collapsed:
+            for (thread_name, *stack), count in self.samples.most_common():
+                labels = [thread_name] + [frame_label(code) for code in stack]
+                collapsed.write(f"{';'.join(label.replace(';', ',') for label in labels)} "
+                                f"{count}\n")
+        with open(base + '.txt', 'w', encoding='utf-8') as summary:
+            summary.write("\n".join(self.summary_lines()) + "\n")
+        logger.info(f"Profile of {self.sample_count} samples written to {base}.collapsed/.txt")
+        return base + '.collapsed', base + '.txt'
+
+    def summary_lines(self) -> List[str]:
+        own: Counter = Counter()
+        total: Counter = Counter()
+        thread_samples: Counter = Counter()
+        for (thread_name, *stack), count in self.samples.items():
+            thread_samples[thread_name] += count
+            if stack:
+                own[stack[-1]] += count
+            for code in set(stack):
+                total[code] += count
+        all_samples = sum(thread_samples.values()) or 1
+        lines = [f"{self.sample_count} samples over {self.elapsed:.1f} s at {self.rate_hz} Hz",
+                 f"{self.idle_samples} samples of idle threads left out",
+                 "", "Samples per thread:"]
+        lines.extend(f"  {count:8d}  {100 * count / all_samples:5.1f}%  {name}"
+                     for name, count in thread_samples.most_common())
+        for title, counter in (("own", own), ("total", total)):
+            lines.extend(["", f"Top {self.top_n} functions by {title} samples:"])
+            lines.extend(f"  {count:8d}  {100 * count / all_samples:5.1f}%  {frame_label(code)}"
+                         for code, count in counter.most_common(self.top_n))
+        return lines
@@ -1,8 +1,7 @@
 import logging
 from PyQt6.QtWidgets import QTextEdit, QFileDialog
-from PyQt6.QtCore import QFileInfo, QByteArray
-from PyQt6.QtGui import QTextDocument, QTextDocumentWriter
-from PyQt6.QtPrintSupport import QPrinter
+from PyQt6.QtCore import QFileInfo
+from utility.app_operations.document_export import DocumentExporter
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +10,12 @@ class TextEditSaver:
     """
     A class that handles saving the contents of a QTextEdit widget to a file.
 
+    The file is written by a DocumentExporter on a background thread, so large notes do not
+    freeze the window.
+
     Attributes:
         current_text_edit (QTextEdit): The current QTextEdit widget to save.
+        exporter (DocumentExporter): Writes the file.
 
     Methods:
         set_current_text_edit(text_edit): Sets the current QTextEdit widget to save.
@@ -20,8 +23,9 @@ class TextEditSaver:
 
     """
 
-    def __init__(self):
+    def __init__(self, exporter=None):
         self.current_text_edit = None
+        self.exporter = exporter if exporter is not None else DocumentExporter()
 
     def set_current_text_edit(self, text_edit):
         """
@@ -41,8 +45,8 @@ class TextEditSaver:
         """
         Save the current text in the text editor to a file.
         This function opens a dialog to select the file format and location for saving the text.
-        It then saves the text in the chosen format and logs the file saving action.
-        If an error occurs during the file saving process, it logs the error.
+        It then hands the document, as HTML for a PDF or as the chosen format's text, to the
+        exporter, which writes it in the background. If an error occurs during the file saving process, it logs the error.
 
         """
         try:
@@ -57,21 +61,17 @@ class TextEditSaver:
 
                 if file_extension not in ["txt", "md", "html", "pdf"]:
                     filename += ".txt"  # Default to .txt if no valid extension is provided
+                    file_extension = "txt"
 
-                if file_extension == "pdf":
-                    printer = QPrinter(QPrinter.PrinterMode.HighResolution)
-                    printer.setOutputFormat(QPrinter.OutputFormat.PdfFormat)
-                    printer.setOutputFileName(filename)
-                    self.current_text_edit.document().print(printer)
+                document = self.current_text_edit.document()
+                if file_extension == "md":
+                    content = document.toMarkdown()
+                elif file_extension == "txt":
+                    content = document.toPlainText()
                 else:
-                    with open(filename, 'w', encoding='utf-8') as file:
-                        if file_extension == "html":
-                            file.write(self.current_text_edit.toHtml())
-                        elif file_extension == "txt":
-                            file.write(self.current_text_edit.toPlainText())
-                        elif file_extension == "md":
-                            file.write(self.current_text_edit.toMarkdown())
-                logger.info(f"Saved file: {filename}, Extension: {file_extension}")
+                    content = document.toHtml()
+                self.exporter.export([content], filename)
+                logger.info(f"Saving file: {filename}, Extension: {file_extension}")
             else:
                 logger.info("File not saved")
         except Exception as e:
@@ -0,0 +1,80 @@
+from typing import Any, Callable, Dict, Optional
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QDialog, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout
+from database.database_utility.search_index import SEARCH_SOURCES
+from logger_setup import logger
+
+
+class SearchDialog(QDialog):
+    """
+    A search box returning ranked hits across the lily notes, lily walk notes and diet entries.
+
+    Attributes:
+        db_manager: The DataManager used to run the searches.
+        page_switchers (Dict[str, Callable[[], None]]): Maps a source table to the method that
+            switches the main window to the data page showing that table.
+        search_input (QLineEdit): The text box the search is typed into.
+        results_list (QListWidget): The ranked hits of the last search.
+        search_timer (QTimer): Delays the search until typing pauses.
+    """
+
+    def __init__(self,
+                 db_manager: Any,
+                 page_switchers: Dict[str, Callable[[], None]],
+                 parent: Optional[Any] = None) -> None:
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.page_switchers = page_switchers
+        self.setWindowTitle("Search")
+        self.resize(420, 360)
+
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText("Search notes and food...")
+        self.search_input.setClearButtonEnabled(True)
+        self.results_list = QListWidget(self)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.search_input)
+        layout.addWidget(self.results_list)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.results_list.itemActivated.connect(self.open_result)
+
+    def run_search(self) -> None:
+        """
+        Runs the search for the current text and lists the hits, best match first.
+        """
+        try:
+            self.results_list.clear()
+            for source, row_id, date, time, snippet in self.db_manager.search_entries(
+                    self.search_input.text()):
+                label = SEARCH_SOURCES[source][4]
+                item = QListWidgetItem(f"{label}  {date} {time}\n{snippet}")
+                item.setData(Qt.ItemDataRole.UserRole, (source, row_id))
+                self.results_list.addItem(item)
+        except Exception as e:
+            logger.error(f"Error running search: {e}", exc_info=True)
+
+    def open_result(self, item: QListWidgetItem) -> None:
+        """
+        Switches the main window to the data page holding the activated hit.
+
+        Args:
+            item (QListWidgetItem): The activated search result.
+        """
+        try:
+            source, _ = item.data(Qt.ItemDataRole.UserRole)
+            switch_page = self.page_switchers.get(source)
+            if switch_page is not None:
+                switch_page()
+        except Exception as e:
+            logger.error(f"Error opening search result: {e}", exc_info=True)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.search_input.setFocus()
+        self.search_input.selectAll()
@@ -0,0 +1,129 @@
+import datetime
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from typing import List, Optional, Tuple
+from PyQt6.QtCore import QObject, QTimer
+from logger_setup import logger
+
+# stall_watchdog.py
+
+StackKey = Tuple[Tuple[str, int, str], ...]
+
+
+class StallWatchdog(QObject):
+    """
+    Detects event loop stalls and records what the GUI thread was running during them.
+
+    A heartbeat timer on the GUI thread stamps the time every heartbeat_ms. A background
+    thread checks the stamp; once it is older than threshold_ms the event loop is stalled, and
+    the thread samples the GUI thread's Python stack through sys._current_frames until the
+    heartbeat comes back. It then writes a report with the stall's duration and its stacks,
+    most frequent first, to report_directory. Both the sampling and the writing happen on the
+    watchdog thread.
+
+    Attributes:
+        report_directory (str): Where stall reports are written.
+        threshold_ms (int): How long the heartbeat may be late before it counts as a stall.
+        heartbeat_ms (int): How often the GUI thread stamps the time.
+        keep_reports (int): How many reports are kept; older ones are removed.
+    """
+
+    def __init__(self,
+                 report_directory: str,
+                 threshold_ms: int,
+                 heartbeat_ms: int,
+                 keep_reports: int,
+                 parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.report_directory = report_directory
+        self.threshold_ms = threshold_ms
+        self.heartbeat_ms = heartbeat_ms
+        self.keep_reports = keep_reports
+        self.gui_thread_id = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setInterval(heartbeat_ms)
+        self.heartbeat.timeout.connect(self.beat)
+
+    def beat(self) -> None:
+        self.last_beat = time.monotonic()
+
+    def start(self) -> None:
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.beat()
+        self.stop_event.clear()
+        self.heartbeat.start()
+        self.thread = threading.Thread(target=self.run, name="bslm-stall-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.heartbeat.stop()
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+    def run(self) -> None:
+        threshold = self.threshold_ms / 1000
+        poll = self.heartbeat_ms / 2000
+        while not self.stop_event.wait(poll):
+            stalled_since = self.last_beat
+            if time.monotonic() - stalled_since < threshold:
+                continue
+            samples: Counter = Counter()
+            while not self.stop_event.is_set() and self.last_beat == stalled_since:
+                stack = self.sample()
+                if stack:
+                    samples[stack] += 1
+                self.stop_event.wait(poll)
+            ended = self.last_beat if self.last_beat != stalled_since else time.monotonic()
+            started = datetime.datetime.now() - datetime.timedelta(
+                seconds=time.monotonic() - stalled_since)
+            try:
+                self.write_report(started, ended - stalled_since, samples)
+            except Exception as e:
+                logger.error(f"Error writing stall report: {e}", exc_info=True)
+
+    def sample(self) -> Optional[StackKey]:
+        frame = sys._current_frames().get(self.gui_thread_id)
+        if frame is None:
+            return None
+        return tuple((entry.filename, entry.lineno, entry.name)
+                     for entry in traceback.extract_stack(frame))
+
+    def write_report(self, started: datetime.datetime, duration: float, samples: Counter) -> None:
+        os.makedirs(self.report_directory, exist_ok=True)
+        path = os.path.join(self.report_directory,
+                            f"stall-{started.strftime('%Y%m%d-%H%M%S-%f')}.txt")
+        total = sum(samples.values())
+        lines: List[str] = [f"Event loop stalled for {duration * 1000:.0f} ms "
+                            f"starting {started.isoformat(timespec='milliseconds')}",
+                            f"{total} stack samples of the GUI thread", ""]
+        for stack, count in samples.most_common():
+            lines.append(f"--- {count} of {total} samples")
+            lines.extend(f'  File "{filename}", line {lineno}, in {name}'
+                         for filename, lineno, name in stack)
+            lines.append("")
+        with open(path, 'w', encoding='utf-8') as report:
+            report.write("\n".join(lines))
+        where = samples.most_common(1)[0][0][-1] if samples else None
+        logger.warning(f"Event loop stalled for {duration * 1000:.0f} ms"
+                       + (f" in {where[2]} ({where[0]}:{where[1]})" if where else "")
+                       + f", see {path}")
+        self.prune_reports()
+
+    def prune_reports(self) -> None:
+        reports = sorted(name for name in os.listdir(self.report_directory)
+                         if name.startswith('stall-') and name.endswith('.txt'))
+        for name in reports[:-self.keep_reports] if self.keep_reports > 0 else []:
+            try:
+                os.remove(os.path.join(self.report_directory, name))
+            except OSError as e:
+                logger.error(f"Error removing stall report {name}: {e}")
@@ -0,0 +1,183 @@
+import os
+import struct
+import zlib
+from typing import Any, Dict, Optional
+from logger_setup import logger
+
+# ui_snapshot.py
+#
+# Layout (big endian):
+#   header:  magic b'BSUI' | version u8 | entry count u32
+#   entry:   key length u16 | key utf-8 | tag u8 | payload
+#   payload: i -> i64, f -> f64, b -> u8, s/z/r -> length u32 + data
+#            (z is zlib compressed utf-8 text, r is raw bytes)
+
+SNAPSHOT_MAGIC = b'BSUI'
+SNAPSHOT_VERSION = 1
+COMPRESS_THRESHOLD = 512  # text at least this long (in bytes) is stored zlib compressed
+
+_HEADER = struct.Struct('>4sBI')
+_KEY_LEN = struct.Struct('>H')
+_TAG = struct.Struct('>B')
+_INT = struct.Struct('>q')
+_FLOAT = struct.Struct('>d')
+_BLOB_LEN = struct.Struct('>I')
+
+
+def encode_snapshot(values: Dict[str, Any]) -> bytes:
+    """
+    Encodes the UI state values into the compact binary snapshot format.
+
+    Args:
+        values (Dict[str, Any]): The values to encode. Supported types are bool, int, float,
+            str and bytes.
+
+    Returns:
+        bytes: The encoded snapshot.
+
+    Raises:
+        TypeError: If a value has an unsupported type.
+    """
+    parts = [_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(values))]
+    for key, value in values.items():
+        encoded_key = key.encode('utf-8')
+        parts.append(_KEY_LEN.pack(len(encoded_key)))
+        parts.append(encoded_key)
+        if isinstance(value, bool):
+            parts.append(_TAG.pack(ord('b')) + _TAG.pack(int(value)))
+        elif isinstance(value, int):
+            parts.append(_TAG.pack(ord('i')) + _INT.pack(value))
+        elif isinstance(value, float):
+            parts.append(_TAG.pack(ord('f')) + _FLOAT.pack(value))
+        elif isinstance(value, str):
+            data = value.encode('utf-8')
+            tag = 's'
+            if len(data) >= COMPRESS_THRESHOLD:
+                data = zlib.compress(data)
+                tag = 'z'
+            parts.append(_TAG.pack(ord(tag)) + _BLOB_LEN.pack(len(data)) + data)
+        elif isinstance(value, (bytes, bytearray)):
+            parts.append(_TAG.pack(ord('r')) + _BLOB_LEN.pack(len(value)) + bytes(value))
+        else:
+            raise TypeError(f"Unsupported snapshot value for {key}: {type(value).__name__}")
+    return b''.join(parts)
+
+
+def decode_snapshot(data: bytes) -> Dict[str, Any]:
+    """
+    Decodes a binary snapshot produced by encode_snapshot.
+
+    Args:
+        data (bytes): The encoded snapshot.
+
+    Returns:
+        Dict[str, Any]: The decoded values.
+
+    Raises:
+        ValueError: If the data is not a snapshot or has an unknown version.
+    """
+    magic, version, count = _HEADER.unpack_from(data, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a UI state snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported UI state snapshot version {version}")
+
+    values: Dict[str, Any] = {}
+    offset = _HEADER.size
+    for _ in range(count):
+        (key_len,) = _KEY_LEN.unpack_from(data, offset)
+        offset += _KEY_LEN.size
+        key = data[offset:offset + key_len].decode('utf-8')
+        offset += key_len
+        tag = chr(data[offset])
+        offset += _TAG.size
+        if tag == 'b':
+            values[key] = bool(data[offset])
+            offset += _TAG.size
+        elif tag == 'i':
+            (values[key],) = _INT.unpack_from(data, offset)
+            offset += _INT.size
+        elif tag == 'f':
+            (values[key],) = _FLOAT.unpack_from(data, offset)
+            offset += _FLOAT.size
+        else:
+            (blob_len,) = _BLOB_LEN.unpack_from(data, offset)
+            offset += _BLOB_LEN.size
+            blob = data[offset:offset + blob_len]
+            offset += blob_len
+            if tag == 's':
+                values[key] = blob.decode('utf-8')
+            elif tag == 'z':
+                values[key] = zlib.decompress(blob).decode('utf-8')
+            elif tag == 'r':
+                values[key] = bytes(blob)
+            else:
+                raise ValueError(f"Unknown snapshot tag {tag!r} for {key}")
+    return values
+
+
+class UiStateSnapshot:
+    """
+    The UI state (geometry, window state, input drafts, current page) kept in one binary file.
+
+    The file is read once when the snapshot is created and rewritten atomically by sync()
+    whenever a value changed. value(), setValue(), contains() and sync() mirror the QSettings
+    methods the rest of the app uses, so the snapshot can stand in for QSettings.
+
+    Attributes:
+        path (str): The snapshot file.
+        values (Dict[str, Any]): The current UI state.
+        loaded (bool): Whether an existing snapshot was read from disk.
+        changed (bool): Whether values changed since the last write.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.values: Dict[str, Any] = {}
+        self.loaded = False
+        self.changed = False
+        self.load()
+
+    def load(self) -> None:
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'rb') as file:
+                    self.values = decode_snapshot(file.read())
+                self.loaded = True
+        except Exception as e:
+            logger.error(f"Error loading UI state snapshot {self.path}: {e}", exc_info=True)
+            self.values = {}
+
+    def contains(self, key: str) -> bool:
+        return key in self.values
+
+    def value(self, key: str, default: Any = None, type: Optional[type] = None) -> Any:
+        value = self.values.get(key, default)
+        if type is None or value is None or isinstance(value, type):
+            return value
+        if type is bool and isinstance(value, str):
+            return value.lower() == 'true'
+        return type(value)
+
+    def setValue(self, key: str, value: Any) -> None:
+        if self.values.get(key) != value:
+            self.values[key] = value
+            self.changed = True
+
+    def sync(self) -> None:
+        """
+        Writes the snapshot if it changed. The data goes to a temporary file next to the
+        snapshot which then replaces it, so a crash mid-write never leaves a torn file.
+        """
+        if not self.changed:
+            return
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'wb') as file:
+                file.write(encode_snapshot(self.values))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+            self.changed = False
+        except Exception as e:
+            logger.error(f"Error writing UI state snapshot {self.path}: {e}", exc_info=True)
@@ -0,0 +1,110 @@
+import os
+from typing import List, Optional, Tuple
+from PyQt6.QtWidgets import QApplication, QComboBox, QTableView, QVBoxLayout, QWidget
+from database.database_utility.model_setup import hide_internal_columns
+from database.database_utility.sort_helper import apply_sorting
+from utility.widgets_set_widgets.date_range_filter import insert_page_widget
+from logger_setup import logger
+
+# data_browser.py
+
+
+def resident_memory() -> Optional[int]:
+    """
+    Returns the resident memory of the process in bytes, None where /proc is not available.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def widget_stats() -> Tuple[int, Optional[int]]:
+    """
+    Returns the number of live widgets and the resident memory in bytes.
+    """
+    return len(QApplication.allWidgets()), resident_memory()
+
+
+class DataBrowser(QWidget):
+    """
+    One table view for a whole data page, with a picker for the table it shows.
+
+    Only the shown table's model is attached to the view and keeps fetched rows. A model that
+    is switched away from releases its rows and reads them again when it is shown next.
+
+    Attributes:
+        entries (List[Tuple[str, object]]): (label, model) of every table of the page.
+        view (QTableView): The shared view.
+        current (Optional[object]): The model shown.
+    """
+
+    def __init__(self, entries: List[Tuple[str, object]], parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.entries = entries
+        self.current = None
+        self.picker = QComboBox(self)
+        self.picker.addItems([label for label, _ in entries])
+        self.view = QTableView(self)
+        self.view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.picker)
+        layout.addWidget(self.view, 1)
+        self.picker.currentIndexChanged.connect(self.show_table)
+        self.show_table(0)
+        for _, model in entries[1:]:
+            model.release()
+
+    def show_table(self, index: int) -> None:
+        try:
+            if not 0 <= index < len(self.entries):
+                return
+            model = self.entries[index][1]
+            if model is self.current:
+                return
+            previous, self.current = self.current, model
+            old_selection = self.view.selectionModel()
+            self.view.setModel(model)
+            if old_selection is not None:
+                # setModel() leaves the previous selection model to its owner
+                old_selection.deleteLater()
+            hide_internal_columns(self.view, model)
+            # the sort re-selects the model, reading its rows back
+            apply_sorting(self.view, 1)
+            if previous is not None:
+                previous.release()
+        except Exception as e:
+            logger.error(f"Error switching the data browser table: {e}", exc_info=True)
+
+
+def install_data_browser(main_window_instance, page: QWidget,
+                         tables: List[Tuple[str, str, str]]) -> DataBrowser:
+    """
+    Replaces the table views of a data page with one DataBrowser.
+
+    The page's views are deleted and their attributes on the main window point to the shared
+    view, so code resolving a view by name, like delete_selected_rows, reaches the shared view.
+    It must check that the view shows the model it acts on.
+
+    Args:
+        main_window_instance: The main window holding the views and models.
+        page (QWidget): The data page.
+        tables (List[Tuple[str, str, str]]): (label, view attribute, model attribute) per table.
+
+    Returns:
+        DataBrowser: The installed browser.
+    """
+    browser = DataBrowser([(label, getattr(main_window_instance, model_name))
+                           for label, _, model_name in tables], page)
+    for _, view_name, _ in tables:
+        view = getattr(main_window_instance, view_name)
+        view.setModel(None)
+        view.hide()
+        view.deleteLater()
+        setattr(main_window_instance, view_name, browser.view)
+    # below the date range filter
+    insert_page_widget(page, browser, 1)
+    return browser
@@ -0,0 +1,137 @@
+from typing import Iterable, Optional
+from PyQt6.QtCore import QDate, pyqtSignal
+from PyQt6.QtWidgets import (QBoxLayout, QComboBox, QDateEdit, QGridLayout, QHBoxLayout, QWidget)
+from logger_setup import logger
+
+# date_range_filter.py
+
+# preset label -> number of days back from today, None for the whole history
+RANGE_PRESETS = {
+    "Today": 0,
+    "Last 7 days": 6,
+    "Last 30 days": 29,
+    "All": None,
+    "Custom": -1,
+}
+
+
+class DateRangeFilter(QWidget):
+    """
+    A date range picker (today / 7 days / 30 days / all / custom) for the data pages.
+
+    Signals:
+        rangeChanged(QDate, QDate): The new first and last date. Both are invalid QDates when
+            the whole history is selected.
+    """
+    rangeChanged = pyqtSignal(QDate, QDate)
+
+    def __init__(self, default_days: int, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.preset = QComboBox(self)
+        self.preset.addItems(RANGE_PRESETS.keys())
+        self.since_edit = QDateEdit(self)
+        self.until_edit = QDateEdit(self)
+        for date_edit in (self.since_edit, self.until_edit):
+            date_edit.setCalendarPopup(True)
+            date_edit.setDisplayFormat("yyyy-MM-dd")
+            date_edit.setVisible(False)
+            date_edit.dateChanged.connect(self.emit_range)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.preset)
+        layout.addWidget(self.since_edit)
+        layout.addWidget(self.until_edit)
+        layout.addStretch()
+
+        today = QDate.currentDate()
+        self.since_edit.setDate(today.addDays(-default_days))
+        self.until_edit.setDate(today)
+        self.preset.setCurrentText(
+            next((label for label, days in RANGE_PRESETS.items() if days == default_days),
+                 "Custom"))
+        self.preset.currentTextChanged.connect(self.apply_preset)
+        self.apply_preset(self.preset.currentText())
+
+    def apply_preset(self, label: str) -> None:
+        days = RANGE_PRESETS[label]
+        custom = days == -1
+        self.since_edit.setVisible(custom)
+        self.until_edit.setVisible(custom)
+        if days is not None and not custom:
+            today = QDate.currentDate()
+            self.since_edit.blockSignals(True)
+            self.until_edit.blockSignals(True)
+            self.since_edit.setDate(today.addDays(-days))
+            self.until_edit.setDate(today)
+            self.since_edit.blockSignals(False)
+            self.until_edit.blockSignals(False)
+        self.emit_range()
+
+    def emit_range(self) -> None:
+        if RANGE_PRESETS[self.preset.currentText()] is None:
+            self.rangeChanged.emit(QDate(), QDate())
+        else:
+            self.rangeChanged.emit(self.since_edit.date(), self.until_edit.date())
+
+
+def install_date_filter(page: QWidget, models: Iterable, default_days: int) -> DateRangeFilter:
+    """
+    Adds a DateRangeFilter to the top of a data page and applies its range to the page's models.
+
+    Args:
+        page (QWidget): The data page.
+        models (Iterable[DateSortedTableModel]): The models shown on the page.
+        default_days (int): The default window, in days before today.
+
+    Returns:
+        DateRangeFilter: The installed filter.
+    """
+    date_filter = DateRangeFilter(default_days, page)
+    models = list(models)
+
+    def apply_range(since: QDate, until: QDate) -> None:
+        try:
+            for model in models:
+                model.set_date_range(since, until)
+        except Exception as e:
+            logger.error(f"Error applying date range filter: {e}", exc_info=True)
+
+    date_filter.rangeChanged.connect(apply_range)
+    insert_page_widget(page, date_filter, 0)
+    return date_filter
+
+
+def insert_page_widget(page: QWidget, widget: QWidget, index: int) -> None:
+    """
+    Adds a widget to a page's own layout: at the index of a box layout, as a new full-width row
+    at that row of a grid layout, or at the top left of a page without a layout.
+    """
+    layout = page.layout()
+    if isinstance(layout, QBoxLayout):
+        layout.insertWidget(index, widget)
+    elif isinstance(layout, QGridLayout):
+        insert_grid_row(layout, index)
+        layout.addWidget(widget, index, 0, 1, max(layout.columnCount(), 1))
+    else:
+        widget.move(0, 0)
+
+
+def insert_grid_row(layout: QGridLayout, row: int) -> None:
+    """
+    Moves every item of a grid layout at or below the row one row down, with the rows'
+    stretch factors and minimum heights, leaving the row empty.
+    """
+    items = []
+    for position in reversed(range(layout.count())):
+        item_row, column, row_span, column_span = layout.getItemPosition(position)
+        items.append((layout.takeAt(position), item_row, column, row_span, column_span))
+    for shifted in reversed(range(row, layout.rowCount())):
+        layout.setRowStretch(shifted + 1, layout.rowStretch(shifted))
+        layout.setRowMinimumHeight(shifted + 1, layout.rowMinimumHeight(shifted))
+    layout.setRowStretch(row, 0)
+    layout.setRowMinimumHeight(row, 0)
+    for item, item_row, column, row_span, column_span in reversed(items):
+        if item_row >= row:
+            item_row += 1
+        layout.addItem(item, item_row, column, row_span, column_span, item.alignment())
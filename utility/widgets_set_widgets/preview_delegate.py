@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from typing import Dict, Tuple
+from PyQt6.QtCore import QModelIndex, QSize, Qt
+from PyQt6.QtGui import QPainter
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+import tracker_config as tkc
+
+# preview_delegate.py
+
+# (table, row id, column, text width) -> (text, elided line)
+CacheKey = Tuple[str, object, int, int]
+
+
+class PreviewDelegate(QStyledItemDelegate):
+    """
+    Paints long-text cells as one elided line instead of laying out their full text.
+
+    The elided line of a cell is cached per row id, column and text width, so repainting and
+    scrolling only look it up; resizing a column elides each visible cell once for the new
+    width. An entry is only used while the cell's text is unchanged. The cache keeps the
+    cache_size most recently painted cells.
+
+    The delegate is set for the whole view and only handles the columns listed for the table
+    the view currently shows, so a view shared by several tables can use one delegate.
+
+    Attributes:
+        columns (Dict[str, str]): Table name -> the long-text column previewed.
+        cache_size (int): The number of elided cells kept.
+    """
+
+    def __init__(self, columns: Dict[str, str], cache_size: int, parent=None) -> None:
+        super().__init__(parent)
+        self.columns = columns
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[CacheKey, Tuple[str, str]]" = OrderedDict()
+
+    def preview_column(self, index: QModelIndex) -> bool:
+        model = index.model()
+        if not hasattr(model, 'tableName'):
+            return False
+        column = self.columns.get(model.tableName())
+        return column is not None and model.fieldIndex(column) == index.column()
+
+    def elided_text(self, index: QModelIndex, text: str, option: QStyleOptionViewItem,
+                    width: int) -> str:
+        model = index.model()
+        id_column = model.fieldIndex('id')
+        row_id = index.siblingAtColumn(id_column).data() if id_column >= 0 else index.row()
+        key = (model.tableName(), row_id, index.column(), width)
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == text:
+            self.cache.move_to_end(key)
+            return cached[1]
+        line = " ".join(text.split())
+        elided = option.fontMetrics.elidedText(line, Qt.TextElideMode.ElideRight, width)
+        self.cache[key] = (text, elided)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return elided
+
+    def single_line_option(self, option: QStyleOptionViewItem,
+                           index: QModelIndex) -> Tuple[QStyleOptionViewItem, QStyle]:
+        item = QStyleOptionViewItem(option)
+        self.initStyleOption(item, index)
+        item.features &= ~QStyleOptionViewItem.ViewItemFeature.WrapText
+        widget = option.widget
+        return item, widget.style() if widget is not None else QApplication.style()
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        if not self.preview_column(index):
+            super().paint(painter, option, index)
+            return
+        item, style = self.single_line_option(option, index)
+        widget = option.widget
+        width = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, item, widget).width()
+        # the style's own text margins
+        margin = 2 * (style.pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, None, widget) + 1)
+        item.text = self.elided_text(index, item.text, item, max(width - margin, 0))
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, item, painter, widget)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        if not self.preview_column(index):
+            return super().sizeHint(option, index)
+        # one line of at most a preview's length, so resizing to contents never lays out the
+        # full text
+        item, style = self.single_line_option(option, index)
+        item.text = " ".join(item.text.split())[:tkc.NOTE_PREVIEW_CHARS]
+        return style.sizeFromContents(QStyle.ContentsType.CT_ItemViewItem, item, QSize(),
+                                      option.widget)
+
+
+def install_preview_delegates(views, columns: Dict[str, str], cache_size: int) -> None:
+    """
+    Sets one PreviewDelegate on each distinct view; the views are its parents.
+    """
+    for view in {id(view): view for view in views}.values():
+        view.setItemDelegate(PreviewDelegate(columns, cache_size, view))